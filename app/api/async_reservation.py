@@ -0,0 +1,101 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth import Principal, get_current_user
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, next_cursor
+from app.core.serialization import encode_page, json_response
+from app.models.enums import UserRole
+from app.repository.reservation import AsyncReservationRepository
+from app.schemas.reservation import (
+    ReservationResponse,
+    ReservationUpdate,
+    CreateReservationRequest,
+    ReservationPage,
+    ReservationFilter,
+)
+from app.service.idempotency import IDEMPOTENCY_HEADER, idempotent_response_async, request_fingerprint
+from app.service.reservation import AsyncReservationService
+from app.service.seat_ledger import AsyncSeatLedgerService
+
+router = APIRouter(prefix="/reservations", tags=["reservations"])
+
+@router.post("/", response_model=ReservationResponse)
+async def create_reservation(
+        request: CreateReservationRequest,
+        idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_HEADER),
+        db: AsyncSession = Depends(get_async_db),
+        current_user: Principal = Depends(get_current_user)
+):
+    repository = AsyncReservationRepository(db)
+    if settings.SEAT_LEDGER_ENABLED:
+        service = AsyncSeatLedgerService(repository)
+    else:
+        service = AsyncReservationService(repository)
+    if idempotency_key is None:
+        return await service.create_reservation(request, current_user)
+
+    async def create() -> bytes:
+        reservation = await service.create_reservation(request, current_user)
+        return ReservationResponse.model_validate(reservation).model_dump_json().encode()
+
+    return await idempotent_response_async(
+        idempotency_key,
+        f"{current_user.id}:POST /reservations",
+        request_fingerprint(request),
+        create
+    )
+
+
+@router.get("/", response_model=ReservationPage)
+async def get_reservations(
+        filters: ReservationFilter = Depends(),
+        cursor: Optional[str] = None,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        db: AsyncSession = Depends(get_async_db),
+        current_user: Principal = Depends(get_current_user)
+):
+    repository = AsyncReservationRepository(db)
+    after_id = decode_cursor(cursor)
+    if current_user.role == UserRole.ADMIN:
+        items, last_id = await repository.get_all_reservations(filters, after_id, limit)
+    else:
+        items, last_id = await repository.get_user_reservations(current_user.id, filters, after_id, limit)
+    return json_response(encode_page(items, next_cursor(last_id)))
+
+
+@router.patch("/{reservation_id}/confirm", response_model=ReservationResponse)
+async def confirm_reservation(
+        reservation_id: int,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: Principal = Depends(get_current_user)
+):
+    repository = AsyncReservationRepository(db)
+    service = AsyncReservationService(repository)
+    return await service.confirm_reservation(reservation_id, current_user)
+
+
+@router.patch("/{reservation_id}", response_model=ReservationResponse)
+async def update_reservation(
+        reservation_id: int,
+        update_data: ReservationUpdate,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: Principal = Depends(get_current_user)
+):
+    repository = AsyncReservationRepository(db)
+    service = AsyncReservationService(repository)
+    return await service.update_reservation(reservation_id, update_data, current_user)
+
+
+@router.delete("/{reservation_id}", status_code=204)
+async def delete_reservation(
+        reservation_id: int,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: Principal = Depends(get_current_user)
+):
+    repository = AsyncReservationRepository(db)
+    service = AsyncReservationService(repository)
+    await service.delete_reservation(reservation_id, current_user)
@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Header, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import schedule_cache, cached_json_response, AVAILABLE_SCHEDULES_CACHE_KEY
+from app.core.database import get_async_db
+from app.core.serialization import json_response
+from app.repository.schedule import AsyncExamScheduleRepository
+from app.schemas.schedule import AvailableExamScheduleResponse
+from app.service.schedule import AsyncExamScheduleService, encode_available_schedules
+
+router = APIRouter(prefix="/exam-schedules", tags=["exam-schedules"])
+
+
+@router.get(
+    "/available",
+    response_model=List[AvailableExamScheduleResponse],
+    responses={304: {"description": "If-None-Match 와 ETag 가 같으면 본문 없이 응답"}}
+)
+async def get_available_schedules(
+        if_none_match: Optional[str] = Header(None),
+        db: AsyncSession = Depends(get_async_db)
+):
+    async def compute() -> bytes:
+        repository = AsyncExamScheduleRepository(db)
+        service = AsyncExamScheduleService(repository)
+        return encode_available_schedules(await service.get_available_schedules())
+
+    cached = await schedule_cache.get_or_set_async(AVAILABLE_SCHEDULES_CACHE_KEY, compute)
+    return cached_json_response(cached, if_none_match)
+
+
+@router.get("/search", response_model=List[AvailableExamScheduleResponse])
+async def search_schedules(
+        start_time: datetime,
+        end_time: datetime,
+        min_seats: int = Query(1, ge=1),
+        db: AsyncSession = Depends(get_async_db)
+):
+    """[start_time, end_time) 와 겹치고 남은 좌석이 min_seats 이상인 예약 가능 일정을 시작 시각 순으로 돌려준다."""
+    service = AsyncExamScheduleService(AsyncExamScheduleRepository(db))
+    return json_response(await service.search_available_schedules(start_time, end_time, min_seats))
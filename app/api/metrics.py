@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from app.core.auth import get_current_user
+from app.core.config import settings
+from app.core.instrumentation import metrics_registry
+from app.models.enums import UserRole
+
+router = APIRouter(tags=["metrics"])
+
+
+async def require_metrics_access(authorization: str = Header(None)):
+    """METRICS_PUBLIC 이 아니면 관리자만 지표를 볼 수 있다. 지표에는 라우트·쿼리 패턴과 부하 정보가 담긴다."""
+    if settings.METRICS_PUBLIC:
+        return
+    principal = await get_current_user(authorization)
+    if principal.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="관리자만 지표를 볼 수 있습니다.")
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+    dependencies=[Depends(require_metrics_access)],
+)
+def get_metrics():
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
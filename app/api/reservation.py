@@ -1,45 +1,73 @@
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query
 from sqlalchemy.orm import Session
 
-from app.core.auth import get_current_user
+from app.core.auth import Principal, get_current_user
+from app.core.config import settings
 from app.core.database import get_db
-from app.models import User
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, next_cursor
+from app.core.serialization import encode_page, json_response
 from app.models.enums import UserRole
 from app.repository.reservation import ReservationRepository
-from app.schemas.reservation import ReservationResponse, ReservationUpdate, CreateReservationRequest
+from app.schemas.reservation import (
+    ReservationResponse,
+    ReservationUpdate,
+    CreateReservationRequest,
+    ReservationPage,
+    ReservationFilter,
+)
+from app.service.idempotency import IDEMPOTENCY_HEADER, idempotent_response, request_fingerprint
 from app.service.reservation import ReservationService
+from app.service.seat_ledger import SeatLedgerService
 
 router = APIRouter(prefix="/reservations", tags=["reservations"])
 
 @router.post("/", response_model=ReservationResponse)
 def create_reservation(
         request: CreateReservationRequest,
+        idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_HEADER),
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        current_user: Principal = Depends(get_current_user)
 ):
     repository = ReservationRepository(db)
-    service = ReservationService(repository)
-    return service.create_reservation(request, current_user)
+    service = SeatLedgerService(repository) if settings.SEAT_LEDGER_ENABLED else ReservationService(repository)
+    if idempotency_key is None:
+        return service.create_reservation(request, current_user)
+
+    # 재시도는 저장된 응답을 돌려주므로 일정 조회·예약 생성을 다시 타지 않는다
+    return idempotent_response(
+        idempotency_key,
+        f"{current_user.id}:POST /reservations",
+        request_fingerprint(request),
+        lambda: ReservationResponse.model_validate(
+            service.create_reservation(request, current_user)
+        ).model_dump_json().encode()
+    )
 
 
-@router.get("/", response_model=List[ReservationResponse])
+@router.get("/", response_model=ReservationPage)
 def get_reservations(
+        filters: ReservationFilter = Depends(),
+        cursor: Optional[str] = None,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        current_user: Principal = Depends(get_current_user)
 ):
     repository = ReservationRepository(db)
+    after_id = decode_cursor(cursor)
     if current_user.role == UserRole.ADMIN:
-        return repository.get_all_reservations()
-    return repository.get_user_reservations(current_user.id)
+        items, last_id = repository.get_all_reservations(filters, after_id, limit)
+    else:
+        items, last_id = repository.get_user_reservations(current_user.id, filters, after_id, limit)
+    return json_response(encode_page(items, next_cursor(last_id)))
 
 
 @router.patch("/{reservation_id}/confirm", response_model=ReservationResponse)
-async def confirm_reservation(
+def confirm_reservation(
         reservation_id: int,
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        current_user: Principal = Depends(get_current_user)
 ):
     repository = ReservationRepository(db)
     service = ReservationService(repository)
@@ -47,11 +75,11 @@ async def confirm_reservation(
 
 
 @router.patch("/{reservation_id}", response_model=ReservationResponse)
-async def update_reservation(
+def update_reservation(
         reservation_id: int,
         update_data: ReservationUpdate,
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        current_user: Principal = Depends(get_current_user)
 ):
     repository = ReservationRepository(db)
     service = ReservationService(repository)
@@ -59,10 +87,10 @@ async def update_reservation(
 
 
 @router.delete("/{reservation_id}", status_code=204)
-async def delete_reservation(
+def delete_reservation(
         reservation_id: int,
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        current_user: Principal = Depends(get_current_user)
 ):
     repository = ReservationRepository(db)
     service = ReservationService(repository)
@@ -0,0 +1,48 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.auth import Principal, get_current_user
+from app.core.config import settings
+from app.core.database import get_db
+from app.repository.reservation import ReservationRepository
+from app.schemas.reservation import (
+    BulkConfirmReservationRequest,
+    BulkCreateReservationRequest,
+    BulkPolicy,
+    BulkReservationResponse,
+)
+from app.service.bulk import BulkReservationService
+
+router = APIRouter(prefix="/reservations", tags=["reservations"])
+
+
+def _resolve_policy(policy: Optional[BulkPolicy], item_count: int) -> BulkPolicy:
+    if item_count > settings.BULK_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {settings.BULK_MAX_ITEMS}건까지 처리할 수 있습니다.")
+    return policy or BulkPolicy(settings.BULK_DEFAULT_POLICY)
+
+
+@router.post("/bulk", response_model=BulkReservationResponse)
+def create_reservations(
+        request: BulkCreateReservationRequest,
+        policy: Optional[BulkPolicy] = None,
+        db: Session = Depends(get_db),
+        current_user: Principal = Depends(get_current_user)
+):
+    policy = _resolve_policy(policy, len(request.items))
+    service = BulkReservationService(ReservationRepository(db))
+    return service.create_reservations(request.items, current_user, policy)
+
+
+@router.patch("/confirm-bulk", response_model=BulkReservationResponse)
+def confirm_reservations(
+        request: BulkConfirmReservationRequest,
+        policy: Optional[BulkPolicy] = None,
+        db: Session = Depends(get_db),
+        current_user: Principal = Depends(get_current_user)
+):
+    policy = _resolve_policy(policy, len(request.reservation_ids))
+    service = BulkReservationService(ReservationRepository(db))
+    return service.confirm_reservations(request.reservation_ids, current_user, policy)
\ No newline at end of file
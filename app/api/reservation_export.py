@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+
+from app.core.auth import Principal, get_current_user
+from app.models.enums import UserRole
+from app.schemas.reservation import ReservationFilter
+from app.service.export import ExportFormat, stream_reservations
+
+router = APIRouter(prefix="/reservations", tags=["reservations"])
+
+
+@router.get("/export")
+def export_reservations(
+        format: ExportFormat = ExportFormat.NDJSON,
+        filters: ReservationFilter = Depends(),
+        current_user: Principal = Depends(get_current_user)
+):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="관리자만 예약을 내보낼 수 있습니다.")
+
+    return StreamingResponse(
+        stream_reservations(filters, format),
+        media_type=format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="reservations.{format.value}"'}
+    )
\ No newline at end of file
@@ -1,18 +1,44 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query
 from sqlalchemy.orm import Session
 
+from app.core.cache import schedule_cache, cached_json_response, AVAILABLE_SCHEDULES_CACHE_KEY
 from app.core.database import get_db
+from app.core.serialization import json_response
 from app.repository.schedule import ExamScheduleRepository
 from app.schemas.schedule import AvailableExamScheduleResponse
-from app.service.schedule import ExamScheduleService
+from app.service.schedule import ExamScheduleService, encode_available_schedules
 
 router = APIRouter(prefix="/exam-schedules", tags=["exam-schedules"])
 
 
-@router.get("/available", response_model=List[AvailableExamScheduleResponse])
-async def get_available_schedules(db: Session = Depends(get_db)):
+@router.get(
+    "/available",
+    response_model=List[AvailableExamScheduleResponse],
+    responses={304: {"description": "If-None-Match 와 ETag 가 같으면 본문 없이 응답"}}
+)
+def get_available_schedules(
+        if_none_match: Optional[str] = Header(None),
+        db: Session = Depends(get_db)
+):
     repository = ExamScheduleRepository(db)
     service = ExamScheduleService(repository)
-    return service.get_available_schedules()
+    cached = schedule_cache.get_or_set(
+        AVAILABLE_SCHEDULES_CACHE_KEY,
+        lambda: encode_available_schedules(service.get_available_schedules())
+    )
+    return cached_json_response(cached, if_none_match)
+
+
+@router.get("/search", response_model=List[AvailableExamScheduleResponse])
+def search_schedules(
+        start_time: datetime,
+        end_time: datetime,
+        min_seats: int = Query(1, ge=1),
+        db: Session = Depends(get_db)
+):
+    """[start_time, end_time) 와 겹치고 남은 좌석이 min_seats 이상인 예약 가능 일정을 시작 시각 순으로 돌려준다."""
+    service = ExamScheduleService(ExamScheduleRepository(db))
+    return json_response(service.search_available_schedules(start_time, end_time, min_seats))
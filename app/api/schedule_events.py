@@ -0,0 +1,28 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
+
+from app.service.seat_feed import seat_feed
+
+router = APIRouter(prefix="/exam-schedules", tags=["exam-schedules"])
+
+
+@router.get(
+    "/available/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}, "description": "남은 좌석 변경 SSE 스트림"}}
+)
+async def stream_available_seats(
+        exam_id: Optional[List[int]] = Query(None),
+        last_event_id: Optional[str] = Header(None),
+):
+    """
+    확정·수정·삭제가 커밋될 때 바뀐 일정의 남은 좌석을 보낸다(`event: seats`, `data: [{"exam_id", "available_seats"}]`).
+    `/exam-schedules/available` 을 한 번 읽은 뒤 구독하고, `event: reset` 을 받으면 다시 읽는다. exam_id 로 일정을 고를 수 있다.
+    """
+    return StreamingResponse(
+        seat_feed.stream(last_event_id, set(exam_id) if exam_id else None),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
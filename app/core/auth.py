@@ -1,22 +1,114 @@
+import time
+from dataclasses import dataclass
+from typing import Optional
+
 from fastapi import Header, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import SessionLocal, AsyncSessionLocal
+from app.core.replica import set_current_subject
+from app.core.token import InvalidToken, TokenClaims, verify_access_token
 from app.models import User
 from app.models.enums import UserRole
 
 
-async def get_current_user(authorization: str = Header(None)) -> User:
-    if not authorization:
-        raise HTTPException(status_code=401, detail="인증헤더가 필요합니다.")
+@dataclass(frozen=True)
+class Principal:
+    """인증된 사용자. ORM 객체가 아니므로 세션·변경 추적 없이 요청 사이에 캐시해 둘 수 있다."""
+    id: int
+    name: str
+    role: UserRole
+
+
+_principal_cache: TTLCache[int, Principal] = TTLCache(
+    settings.AUTH_USER_CACHE_MAX_ENTRIES,
+    ttl=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
+# 검증을 마친 토큰 문자열 -> 클레임. 같은 토큰은 만료 전까지 서명을 다시 확인하지 않는다
+_verified_tokens: TTLCache[str, TokenClaims] = TTLCache(
+    settings.AUTH_USER_CACHE_MAX_ENTRIES,
+    ttl=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
+
+_PRINCIPAL_COLUMNS = (User.id, User.name, User.role)
+
+
+def invalidate_principal(user_id: int):
+    """사용자 이름·역할이 바뀌면 호출해 다음 요청에서 다시 읽게 한다."""
+    _principal_cache.delete(user_id)
+
+
+def _load_principal(user_id: int) -> Optional[Principal]:
+    with SessionLocal() as db:
+        row = db.execute(select(*_PRINCIPAL_COLUMNS).where(User.id == user_id)).first()
+    return Principal(*row) if row else None
+
+
+async def _load_principal_async(user_id: int) -> Optional[Principal]:
+    async with AsyncSessionLocal() as db:
+        row = (await db.execute(select(*_PRINCIPAL_COLUMNS).where(User.id == user_id))).first()
+    return Principal(*row) if row else None
+
+
+async def get_principal(user_id: int) -> Optional[Principal]:
+    principal = _principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    if settings.DATABASE_DRIVER == "async":
+        principal = await _load_principal_async(user_id)
+    else:
+        principal = await run_in_threadpool(_load_principal, user_id)
+    if principal is not None:
+        _principal_cache.set(user_id, principal)
+    return principal
+
+
+def _verify(token: str) -> TokenClaims:
+    claims = _verified_tokens.get(token)
+    if claims is None:
+        claims = verify_access_token(token)
+        ttl = min(settings.AUTH_USER_CACHE_TTL_SECONDS, claims.expires_at - time.time())
+        _verified_tokens.set(token, claims, ttl)
+    return claims
 
-    token = authorization.split(" ")[1] if " " in authorization else authorization
 
+def _dev_token_subject(token: str) -> int:
+    """개발용 토큰: "admin" 은 1번 사용자, "userN" 은 N번 사용자."""
     if token == "admin":
-        return User(id=1, name="admin", role=UserRole.ADMIN)
-    elif token.startswith("user"):
+        return 1
+    if token.startswith("user"):
         try:
-            user_id = int(token.split("user")[1])
-            return User(id=user_id, name=f"user{user_id}", role=UserRole.USER)
+            return int(token.split("user")[1])
         except (ValueError, IndexError):
             raise HTTPException(status_code=401, detail="잘못된 사용자의 토큰입니다.")
-    else:
-        raise HTTPException(status_code=401, detail="잘못된 토큰입니다.")
+    raise HTTPException(status_code=401, detail="잘못된 토큰입니다.")
+
+
+def resolve_subject(authorization: Optional[str]) -> int:
+    """Authorization 헤더의 사용자 id. DB 를 읽지 않으므로 사용자가 실제로 있는지는 확인하지 않는다."""
+    if not authorization:
+        raise HTTPException(status_code=401, detail="인증헤더가 필요합니다.")
+
+    token = authorization.split(" ")[1] if " " in authorization else authorization
+
+    if "." in token:
+        try:
+            return _verify(token).subject
+        except InvalidToken as e:
+            raise HTTPException(status_code=401, detail=str(e))
+    if settings.AUTH_ALLOW_DEV_TOKENS:
+        return _dev_token_subject(token)
+    raise HTTPException(status_code=401, detail="잘못된 토큰입니다.")
+
+
+async def get_current_user(authorization: str = Header(None)) -> Principal:
+    user_id = resolve_subject(authorization)
+    principal = await get_principal(user_id)
+    if principal is None:
+        raise HTTPException(status_code=401, detail="존재하지 않는 사용자입니다.")
+    set_current_subject(principal.id)
+    return principal
@@ -0,0 +1,200 @@
+import hashlib
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Optional, Callable, Dict, Generic, Tuple, TypeVar
+
+from fastapi import Response
+
+from app.core.config import settings
+
+AVAILABLE_SCHEDULES_CACHE_KEY = "exam-schedules:available"
+# 세대 값은 항목보다 오래 남아야 한다. 사라져도 새 값을 만들 뿐 이전 세대로 돌아가지는 않는다
+_GENERATION_TTL_SECONDS = 24 * 3600
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """만료 시간이 있는 프로세스 로컬 LRU. 최대 개수를 넘으면 가장 오래 쓰이지 않은 항목부터 버린다."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: K):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class CacheBackend:
+    """
+    응답 캐시 저장소 인터페이스. 값은 bytes 로만 주고받으므로
+    Redis/Memcached 같은 공유 저장소도 같은 인터페이스로 붙일 수 있다.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: float):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+
+class LRUCacheBackend(CacheBackend):
+    """프로세스 로컬 LRU 캐시."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: TTLCache[str, bytes] = TTLCache(max_entries, ttl=0)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._entries.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float):
+        self._entries.set(key, value, ttl)
+
+    def delete(self, key: str):
+        self._entries.delete(key)
+
+
+class FakeSharedCacheBackend(CacheBackend):
+    """공유 저장소를 흉내 내는 테스트용 백엔드. 여러 ResponseCache 가 같은 인스턴스를 공유하면 된다."""
+
+    def __init__(self):
+        self.store: Dict[str, Tuple[float, bytes]] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self.store.get(key)
+        if entry is None or entry[0] <= time.time():
+            self.store.pop(key, None)
+            return None
+        return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: float):
+        self.store[key] = (time.time() + ttl, bytes(value))
+
+    def delete(self, key: str):
+        self.store.pop(key, None)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+
+    def to_bytes(self) -> bytes:
+        return self.etag.encode() + b"\n" + self.body
+
+    @classmethod
+    def from_bytes(cls, value: bytes) -> "CachedResponse":
+        etag, body = value.split(b"\n", 1)
+        return cls(body=body, etag=etag.decode())
+
+    @classmethod
+    def of(cls, body: bytes) -> "CachedResponse":
+        return cls(body=body, etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+
+
+class ResponseCache:
+    """
+    key 별 응답 캐시. 항목은 key 의 현재 세대를 붙인 키에 두고, invalidate 는 세대만 바꾼다.
+    무효화 전에 계산을 시작한 요청이 늦게 넣은 값은 이전 세대 키에 들어가 다시 읽히지 않는다.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+
+    def use_backend(self, backend: CacheBackend):
+        self.backend = backend
+
+    def _versioned_key(self, key: str) -> str:
+        generation_key = f"{key}:generation"
+        generation = self.backend.get(generation_key)
+        if generation is None:
+            generation = self._new_generation(generation_key)
+        return f"{key}@{generation.decode()}"
+
+    def _new_generation(self, generation_key: str) -> bytes:
+        # 여러 프로세스가 공유 저장소를 써도 겹치지 않도록 증가값 대신 임의 값을 쓴다
+        generation = secrets.token_hex(8).encode()
+        self.backend.set(generation_key, generation, _GENERATION_TTL_SECONDS)
+        return generation
+
+    def _lookup(self, versioned_key: str) -> Optional[CachedResponse]:
+        value = self.backend.get(versioned_key)
+        return CachedResponse.from_bytes(value) if value is not None else None
+
+    def _put(self, versioned_key: str, body: bytes) -> CachedResponse:
+        cached = CachedResponse.of(body)
+        self.backend.set(versioned_key, cached.to_bytes(), self.ttl)
+        return cached
+
+    def get_or_set(self, key: str, compute: Callable[[], bytes]) -> CachedResponse:
+        # 세대는 계산하기 전에 정한다. 계산 중에 무효화되면 결과는 이전 세대에 들어간다
+        versioned_key = self._versioned_key(key)
+        cached = self._lookup(versioned_key)
+        if cached is None:
+            cached = self._put(versioned_key, compute())
+        return cached
+
+    async def get_or_set_async(self, key: str, compute: Callable[[], Awaitable[bytes]]) -> CachedResponse:
+        versioned_key = self._versioned_key(key)
+        cached = self._lookup(versioned_key)
+        if cached is None:
+            cached = self._put(versioned_key, await compute())
+        return cached
+
+    def invalidate(self, key: str):
+        self._new_generation(f"{key}:generation")
+
+
+def _etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def cached_json_response(cached: CachedResponse, if_none_match: Optional[str]) -> Response:
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(cached.etag, if_none_match):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+schedule_cache = ResponseCache(
+    LRUCacheBackend(settings.SCHEDULE_CACHE_MAX_ENTRIES),
+    ttl=settings.SCHEDULE_CACHE_TTL_SECONDS,
+)
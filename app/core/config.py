@@ -1,23 +1,172 @@
+from functools import lru_cache
+from typing import Optional
+
 from pydantic.v1 import BaseSettings
 
+_ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+
+def _async_url(url: str) -> str:
+    scheme, rest = url.split("://", 1)
+    return f"{_ASYNC_DRIVERS.get(scheme, scheme)}://{rest}"
+
+
 class Settings(BaseSettings):
     PROJECT_NAME: str = "FastAPI Project"
     VERSION: str = "0.1.0"
 
-    POSTGRES_USER: str
-    POSTGRES_PASSWORD: str
-    POSTGRES_SERVER: str
-    POSTGRES_PORT: str
-    POSTGRES_DB: str
+    # DATABASE_URL 이 없을 때 접속에 쓴다. 접속 URL 을 만들 때 검사하므로 OpenAPI 생성 등 DB 없이 import 할 때는 없어도 된다
+    POSTGRES_USER: Optional[str] = None
+    POSTGRES_PASSWORD: Optional[str] = None
+    POSTGRES_SERVER: Optional[str] = None
+    POSTGRES_PORT: Optional[str] = None
+    POSTGRES_DB: Optional[str] = None
+
+    # 지정하면 POSTGRES_* 대신 이 URL로 접속한다 (예: 벤치마크용 sqlite:///bench.db)
+    DATABASE_URL: Optional[str] = None
+
+    # 읽기 전용 조회(예약 목록, 예약 가능 일정)를 보낼 복제본. 비어 있으면 primary 만 쓴다
+    DATABASE_REPLICA_URL: Optional[str] = None
+    # 쓰기를 커밋한 사용자의 읽기는 이 시간 동안 primary 로 보낸다 (복제 지연 대비)
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+    # 그동안 primary 로 읽을 사용자를 기억하는 최대 수. 넘으면 가장 오래된 사용자부터 잊고 복제본에서 읽는다
+    READ_YOUR_WRITES_MAX_ENTRIES: int = 100_000
+
+    # "sync": Session + 스레드풀, "async": AsyncSession(asyncpg)
+    DATABASE_DRIVER: str = "sync"
+
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 10.0
+    # 서버·방화벽이 유휴 커넥션을 끊기 전에 먼저 교체한다
+    DB_POOL_RECYCLE: int = 1800
+    # 대기 커넥션을 LIFO 로 꺼내면 한가할 때 남는 커넥션이 recycle 로 자연스럽게 정리된다
+    DB_POOL_USE_LIFO: bool = True
+    # 체크아웃마다 SELECT 1 로 끊긴 커넥션을 걸러낸다. 왕복 하나를 아끼려고 끄면 DB 재시작·페일오버 직후 요청이 실패한다
+    DB_POOL_PRE_PING: bool = True
+    # PgBouncer(트랜잭션 풀링) 뒤에서 돌릴 때 asyncpg 의 prepared statement 캐시를 끈다
+    DB_PGBOUNCER: bool = False
+
+    # RS256 키(PKCS#1 PEM). 비어 있으면 개발용 토큰을 켠 경우에만 프로세스마다 임시 키를 만들고, 아니면 기동하지 않는다
+    AUTH_PUBLIC_KEY_FILE: Optional[str] = None
+    AUTH_PRIVATE_KEY_FILE: Optional[str] = None
+    AUTH_TOKEN_TTL_SECONDS: int = 3600
+    # "admin", "userN" 같은 서명 없는 개발용 토큰 허용 여부. 로컬 개발·테스트·벤치마크에서만 켠다
+    AUTH_ALLOW_DEV_TOKENS: bool = False
+    AUTH_USER_CACHE_TTL_SECONDS: float = 60.0
+    AUTH_USER_CACHE_MAX_ENTRIES: int = 10000
+
+    SCHEDULE_CACHE_TTL_SECONDS: float = 5.0
+    SCHEDULE_CACHE_MAX_ENTRIES: int = 128
+    # 시간대 검색을 예약 가능 일정 캐시로 만든 프로세스 내 구간 트리로 처리한다. 끄면 매번 DB(GiST 인덱스)에 묻는다
+    SCHEDULE_SEARCH_INDEX_ENABLED: bool = True
+
+    BULK_DEFAULT_POLICY: str = "partial"
+    BULK_MAX_ITEMS: int = 1000
+
+    TRANSACTION_MAX_RETRIES: int = 3
+    TRANSACTION_RETRY_BACKOFF_SECONDS: float = 0.01
+
+    # POST /reservations 의 Idempotency-Key 저장소. "memory": 프로세스 로컬 LRU, "db": idempotency_keys 테이블(여러 인스턴스)
+    IDEMPOTENCY_BACKEND: str = "memory"
+    IDEMPOTENCY_TTL_SECONDS: float = 24 * 3600
+    IDEMPOTENCY_MAX_ENTRIES: int = 100_000
+    # 처리 중 표시의 유효 시간. 요청을 처리하던 프로세스가 죽어도 이 시간이 지나면 재시도가 다시 처리된다
+    IDEMPOTENCY_LOCK_SECONDS: float = 30.0
+    # 같은 키의 앞선 요청이 끝나기를 기다리는 최대 시간. 넘으면 409
+    IDEMPOTENCY_WAIT_SECONDS: float = 5.0
+    IDEMPOTENCY_PURGE_INTERVAL_SECONDS: float = 3600.0
+
+    # 주기 작업(오래된 PENDING 예약 만료, 확정 좌석 카운터 보정). 간격이 0 이면 그 작업은 돌지 않는다
+    SCHEDULER_ENABLED: bool = True
+    PENDING_EXPIRY_SECONDS: int = 3 * 24 * 3600
+    PENDING_EXPIRY_INTERVAL_SECONDS: float = 300.0
+    PENDING_EXPIRY_BATCH_SIZE: int = 1000
+    SEAT_RECONCILE_INTERVAL_SECONDS: float = 3600.0
+    SEAT_RECONCILE_BATCH_SIZE: int = 500
+
+    WAITLIST_WORKER_ENABLED: bool = True
+    # 대기열 승격 한 트랜잭션에서 확정하는 최대 예약 수
+    WAITLIST_PROMOTION_BATCH_SIZE: int = 100
+    # 알림을 놓친 일정(워커 오류, 다른 프로세스의 커밋)을 다시 훑는 주기. 0 이면 알림으로만 깨어난다
+    WAITLIST_SWEEP_SECONDS: float = 300.0
+
+    # 좌석 원장 모드: 예약 생성의 좌석 판단을 메모리에서 하고, 받아들인 요청은 모아서 한 트랜잭션으로 쓴다
+    SEAT_LEDGER_ENABLED: bool = False
+    # 원장 항목을 DB 값으로 다시 읽기 전까지 쓰는 시간. 좌석이 풀린 뒤 이 시간 동안은 거절될 수 있다
+    SEAT_LEDGER_TTL_SECONDS: float = 1.0
+    SEAT_LEDGER_MAX_ENTRIES: int = 10_000
+    SEAT_LEDGER_BATCH_SIZE: int = 500
+    # 첫 요청 뒤 배치를 더 모으는 시간. 0 이면 앞 배치를 쓰는 동안 쌓인 요청만 묶는다
+    SEAT_LEDGER_LINGER_SECONDS: float = 0.0
+    # 쓰기를 기다리는 요청 수 상한. 넘으면 503
+    SEAT_LEDGER_MAX_PENDING: int = 10_000
+
+    # 요청 수 제한(토큰 버킷). 예약 생성은 사용자별, 일정 조회는 클라이언트 IP 별로 센다. 넘으면 429 + Retry-After
+    RATE_LIMIT_ENABLED: bool = False
+    # 초당 채워지는 요청 수와 한 번에 몰아 쓸 수 있는 최대 요청 수(버킷 크기)
+    RATE_LIMIT_RESERVATION_PER_SECOND: float = 1.0
+    RATE_LIMIT_RESERVATION_BURST: int = 5
+    RATE_LIMIT_SCHEDULE_PER_SECOND: float = 5.0
+    RATE_LIMIT_SCHEDULE_BURST: int = 20
+    # 프로세스 로컬 저장소가 기억하는 최대 키 수. 넘으면 가장 오래 쓰지 않은 키부터 버린다
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+    # 리버스 프록시 뒤에서는 프록시가 X-Forwarded-For 에 덧붙인 마지막 주소를 클라이언트 IP 로 쓴다
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = False
+
+    # 남은 좌석 SSE 피드. 한 연결에 이 간격보다 자주 보내지 않고 그 사이의 변경은 일정별 최신 값 하나로 합친다
+    SEAT_FEED_MIN_INTERVAL_SECONDS: float = 0.5
+    # 변경이 없을 때 프록시가 연결을 끊지 않도록 보내는 주석 간격
+    SEAT_FEED_HEARTBEAT_SECONDS: float = 15.0
+    # 재연결(Last-Event-ID) 때 이어 보낼 수 있도록 기억하는 일정 수. 넘으면 오래 바뀌지 않은 일정부터 잊는다
+    SEAT_FEED_MAX_ENTRIES: int = 100_000
+
+    SQL_INSTRUMENTATION_ENABLED: bool = True
+    # GET /metrics 는 관리자만 볼 수 있다. 스크레이퍼가 내부망에서만 접근할 수 있으면 켜서 인증 없이 연다
+    METRICS_PUBLIC: bool = False
+    # 한 요청에서 같은 문장이 이 횟수 이상 실행되면 N+1 로 의심해 경고 로그를 남긴다
+    SQL_REPEATED_STATEMENT_THRESHOLD: int = 5
+    SQL_SLOW_QUERY_MS: float = 100.0
 
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> str:
+        if self.DATABASE_URL:
+            return self.DATABASE_URL
+        return self._database_uri("postgresql")
+
+    @property
+    def SQLALCHEMY_ASYNC_DATABASE_URI(self) -> str:
+        if self.DATABASE_URL:
+            return _async_url(self.DATABASE_URL)
+        return self._database_uri("postgresql+asyncpg")
+
+    @property
+    def SQLALCHEMY_ASYNC_REPLICA_DATABASE_URI(self) -> Optional[str]:
+        return _async_url(self.DATABASE_REPLICA_URL) if self.DATABASE_REPLICA_URL else None
+
+    def _database_uri(self, scheme: str) -> str:
+        missing = [name for name in ("POSTGRES_USER", "POSTGRES_SERVER", "POSTGRES_PORT", "POSTGRES_DB")
+                   if not getattr(self, name)]
+        if missing:
+            raise RuntimeError(f"DATABASE_URL 또는 {', '.join(missing)} 환경변수가 필요합니다.")
         if not self.POSTGRES_PASSWORD:
-            return f"postgresql://{self.POSTGRES_USER}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
-        return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+            return f"{scheme}://{self.POSTGRES_USER}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        return f"{scheme}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
     class Config:
         env_file = ".env"
         case_sensitive = True
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    return Settings()
+
+
+class _LazySettings:
+    """처음 값을 읽을 때 Settings 를 만든다. 환경변수를 바꾼 뒤 import 해도 그 값을 읽는다."""
+
+    def __getattr__(self, name: str):
+        return getattr(get_settings(), name)
+
+
+settings: Settings = _LazySettings()  # type: ignore[assignment]
\ No newline at end of file
@@ -1,15 +1,128 @@
+import threading
+from typing import Callable, Dict, Optional, Union
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.core.config import settings
+from app.core.instrumentation import instrument_engine, metrics_registry
+from app.core.pool import engine_options, pool_metrics
+from app.core.replica import REPLICA_BIND_KEY, RoutingSession
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI,pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# 엔진은 처음 쓸 때 만든다. import 만으로는 접속 설정을 읽지도, 드라이버를 불러오지도 않는다
+_engines: Dict[str, Union[Engine, AsyncEngine]] = {}
+_engines_lock = threading.Lock()
+
+
+def _create_engine(url: str, is_async: bool = False) -> Union[Engine, AsyncEngine]:
+    if is_async:
+        created = create_async_engine(url, **engine_options(url, is_async=True))
+        sync_engine = created.sync_engine
+    else:
+        created = sync_engine = create_engine(url, **engine_options(url))
+    if settings.SQL_INSTRUMENTATION_ENABLED:
+        instrument_engine(sync_engine)
+    return created
+
+
+def _get_or_create(name: str, factory: Callable[[], Union[Engine, AsyncEngine]]):
+    engine = _engines.get(name)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(name)
+            if engine is None:
+                engine = _engines[name] = factory()
+    return engine
+
+
+def get_engine() -> Engine:
+    return _get_or_create("sync", lambda: _create_engine(settings.SQLALCHEMY_DATABASE_URI))
+
+
+def get_async_engine() -> AsyncEngine:
+    return _get_or_create("async", lambda: _create_engine(settings.SQLALCHEMY_ASYNC_DATABASE_URI, is_async=True))
+
+
+def get_replica_engine() -> Optional[Engine]:
+    if not settings.DATABASE_REPLICA_URL:
+        return None
+    return _get_or_create("sync_replica", lambda: _create_engine(settings.DATABASE_REPLICA_URL))
+
+
+def get_async_replica_engine() -> Optional[AsyncEngine]:
+    if not settings.DATABASE_REPLICA_URL:
+        return None
+    return _get_or_create(
+        "async_replica",
+        lambda: _create_engine(settings.SQLALCHEMY_ASYNC_REPLICA_DATABASE_URI, is_async=True)
+    )
+
+
+def all_engines(create: bool = True) -> Dict[str, Engine]:
+    """계측·지표용. 이름 -> 동기 Engine (AsyncEngine 은 sync_engine). create=False 면 이미 만든 엔진만."""
+    if create:
+        get_engine()
+        get_async_engine()
+        get_replica_engine()
+        get_async_replica_engine()
+    return {
+        name: engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        for name, engine in list(_engines.items())
+    }
+
+
+async def dispose_engines():
+    """만들어 둔 엔진의 커넥션 풀을 닫는다. 이벤트 루프를 닫기 전에 부른다."""
+    for engine in list(_engines.values()):
+        if isinstance(engine, AsyncEngine):
+            await engine.dispose()
+        else:
+            engine.dispose()
+
+
+class _LazySessionFactory:
+    """처음 세션을 열 때 엔진과 sessionmaker 를 만든다. 호출 방법은 sessionmaker 와 같다."""
+
+    def __init__(self, build: Callable[[], Callable]):
+        self._build = build
+        self._factory: Optional[Callable] = None
+
+    def __call__(self, **kwargs):
+        if self._factory is None:
+            self._factory = self._build()
+        return self._factory(**kwargs)
+
+
+SessionLocal = _LazySessionFactory(lambda: sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=get_engine(),
+    info={REPLICA_BIND_KEY: get_replica_engine()}
+))
+
+AsyncSessionLocal = _LazySessionFactory(lambda: async_sessionmaker(
+    bind=get_async_engine(),
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+    info={REPLICA_BIND_KEY: get_async_replica_engine().sync_engine if settings.DATABASE_REPLICA_URL else None}
+))
+
+
+metrics_registry.register_collector(lambda: pool_metrics(all_engines(create=False)))
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
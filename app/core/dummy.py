@@ -1,12 +1,27 @@
+import random
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import Optional
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.models import User, ExamSchedule, Reservation
 from app.models.enums import UserRole, ReservationStatus
+from app.repository.schedule import ExamScheduleRepository
 
 
-def create_seed_data(db: Session):
+@dataclass(frozen=True)
+class SeedVolume:
+    """벤치마크용 대량 데이터 규모. 기본 샘플 데이터에 더해 생성된다."""
+    users: int = 1_000
+    schedules: int = 2_000
+    reservations: int = 1_000_000
+    batch_size: int = 10_000
+    seed: int = 42
+
+
+def create_seed_data(db: Session, volume: Optional[SeedVolume] = None):
     if db.query(User).first() is not None:
         return
 
@@ -58,4 +73,56 @@ def create_seed_data(db: Session):
         )
     ]
     db.add_all(reservations)
-    db.commit()
\ No newline at end of file
+    db.commit()
+
+    if volume is not None:
+        _create_volume_data(db, volume)
+
+    ExamScheduleRepository(db).reconcile_confirmed_seats()
+    db.commit()
+
+
+def _create_volume_data(db: Session, volume: SeedVolume):
+    rng = random.Random(volume.seed)
+    first_day = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=4)
+
+    _insert_in_batches(db, User, (
+        {"name": f"부하 테스트 유저 {i}", "password": f"비밀번호_예시_{i}", "role": UserRole.USER}
+        for i in range(volume.users)
+    ), volume.batch_size)
+    user_ids = [user_id for user_id, in db.query(User.id).filter(User.role == UserRole.USER)]
+
+    # 하루 8개 슬롯(09시~16시 정각 시작, 2시간)씩 날짜를 늘려가며 배치한다
+    _insert_in_batches(db, ExamSchedule, (
+        {
+            "start_time": first_day + timedelta(days=i // 8, hours=9 + i % 8),
+            "end_time": first_day + timedelta(days=i // 8, hours=11 + i % 8),
+            "max_seats": 50000,
+        }
+        for i in range(volume.schedules)
+    ), volume.batch_size)
+    exam_ids = [exam_id for exam_id, in db.query(ExamSchedule.id)]
+
+    statuses = [ReservationStatus.PENDING] * 6 + [ReservationStatus.CONFIRMED] * 3 + [ReservationStatus.CANCELLED]
+    _insert_in_batches(db, Reservation, (
+        {
+            "user_id": rng.choice(user_ids),
+            "exam_id": rng.choice(exam_ids),
+            "status": rng.choice(statuses),
+            "requested_seats": rng.randint(1, 20),
+        }
+        for _ in range(volume.reservations)
+    ), volume.batch_size)
+
+
+def _insert_in_batches(db: Session, model, rows, batch_size: int):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            db.execute(insert(model), batch)
+            db.commit()
+            batch = []
+    if batch:
+        db.execute(insert(model), batch)
+        db.commit()
\ No newline at end of file
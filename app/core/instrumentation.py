@@ -0,0 +1,254 @@
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.sql")
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+
+_STARTED_AT_KEY = "instrumentation_started_at"
+_WHITESPACE = re.compile(r"\s+")
+# IN (...) 의 바인드 파라미터 개수만 다른 문장은 같은 패턴으로 본다
+_EXPANDED_IN = re.compile(r"\(\s*(?:\?|%\(\w+\)s|\$\d+)(?:\s*,\s*(?:\?|%\(\w+\)s|\$\d+))*\s*\)")
+
+
+def normalize_statement(statement: str) -> str:
+    return _EXPANDED_IN.sub("(...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+@dataclass
+class QueryStats:
+    """한 요청(또는 query_budget 블록) 동안 실행된 SQL 통계."""
+    count: int = 0
+    total_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: Optional[str] = None
+    statements: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed: float):
+        pattern = normalize_statement(statement)
+        self.count += 1
+        self.total_time += elapsed
+        self.statements[pattern] += 1
+        if elapsed >= self.slowest_time:
+            self.slowest_time = elapsed
+            self.slowest_statement = pattern
+
+    def repeated(self, threshold: Optional[int] = None) -> List[Tuple[str, int]]:
+        """threshold 번 이상 반복된 문장. 대부분 N+1 로딩이다."""
+        threshold = threshold or settings.SQL_REPEATED_STATEMENT_THRESHOLD
+        return [(pattern, n) for pattern, n in self.statements.most_common() if n >= threshold]
+
+
+# 중첩된 수집 범위(미들웨어 안의 query_budget 등)가 모두 같은 쿼리를 세도록 스택으로 둔다
+_active_stats: ContextVar[Tuple[QueryStats, ...]] = ContextVar("active_query_stats", default=())
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    active = _active_stats.get()
+    return active[-1] if active else None
+
+
+@contextmanager
+def collect_queries() -> Iterator[QueryStats]:
+    """블록 안에서 실행된 쿼리를 새 QueryStats 에 모은다. 스레드풀·greenlet 으로도 전파된다."""
+    stats = QueryStats()
+    token = _active_stats.set(_active_stats.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_STARTED_AT_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info[_STARTED_AT_KEY].pop()
+    for stats in _active_stats.get():
+        stats.record(statement, elapsed)
+
+
+def _handle_error(exception_context):
+    started = exception_context.connection.info.get(_STARTED_AT_KEY) if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def instrument_engine(engine: Engine):
+    """동기 엔진(AsyncEngine 은 .sync_engine)에 쿼리 계측 리스너를 한 번만 단다."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def _budget_message(stats: QueryStats, max_queries: int) -> str:
+    lines = [f"쿼리 예산 초과: {stats.count}회 실행 (허용 {max_queries}회)"]
+    lines += [f"  {n}x {pattern}" for pattern, n in stats.statements.most_common(5)]
+    return "\n".join(lines)
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """
+    테스트용. 블록 안의 쿼리가 max_queries 를 넘으면 QueryBudgetExceeded 를 던진다.
+    서비스 직접 호출이나 httpx.ASGITransport 처럼 같은 태스크에서 앱을 실행하는 클라이언트에 쓴다.
+    """
+    with collect_queries() as stats:
+        yield stats
+    if stats.count > max_queries:
+        raise QueryBudgetExceeded(_budget_message(stats, max_queries))
+
+
+def assert_query_budget(response, max_queries: int):
+    """테스트용. 다른 스레드에서 앱을 실행하는 TestClient 응답은 X-DB-Query-Count 헤더로 검사한다."""
+    count = int(response.headers[QUERY_COUNT_HEADER])
+    if count > max_queries:
+        raise QueryBudgetExceeded(
+            f"쿼리 예산 초과: {response.request.method} {response.request.url.path} "
+            f"{count}회 실행 (허용 {max_queries}회)"
+        )
+
+
+class _RouteMetrics:
+    __slots__ = ("requests", "queries", "db_seconds", "repeated_requests")
+
+    def __init__(self):
+        self.requests = 0
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.repeated_requests = 0
+
+
+class MetricsRegistry:
+    """/metrics 에 내보낼 값을 모은다. 다른 모듈은 register_collector 로 자기 지표를 덧붙인다."""
+
+    def __init__(self):
+        self._routes: Dict[Tuple[str, str], _RouteMetrics] = {}
+        self._collectors: List[Callable[[], List[str]]] = []
+        self._lock = threading.Lock()
+
+    def observe_request(self, method: str, route: str, stats: QueryStats, repeated: bool):
+        with self._lock:
+            metrics = self._routes.setdefault((method, route), _RouteMetrics())
+            metrics.requests += 1
+            metrics.queries += stats.count
+            metrics.db_seconds += stats.total_time
+            metrics.repeated_requests += int(repeated)
+
+    def register_collector(self, collector: Callable[[], List[str]]):
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        with self._lock:
+            routes = sorted((key, _values(metrics)) for key, metrics in self._routes.items())
+
+        lines = []
+        for name, kind, help_text, attr in _ROUTE_SERIES:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (method, route), values in routes:
+                lines.append(f'{name}{{method="{method}",route="{route}"}} {values[attr]}')
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+def _values(metrics: _RouteMetrics) -> Dict[str, float]:
+    return {attr: getattr(metrics, attr) for attr in _RouteMetrics.__slots__}
+
+
+_ROUTE_SERIES = (
+    ("http_requests_total", "counter", "처리한 요청 수", "requests"),
+    ("db_queries_total", "counter", "요청 처리 중 실행한 SQL 수", "queries"),
+    ("db_query_seconds_total", "counter", "요청 처리 중 SQL 실행에 쓴 시간(초)", "db_seconds"),
+    ("db_repeated_statement_requests_total", "counter", "같은 문장을 임계값 이상 반복한(N+1 의심) 요청 수", "repeated_requests"),
+)
+
+metrics_registry = MetricsRegistry()
+
+def _route_template(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+def _server_timing(stats: QueryStats) -> str:
+    value = f'db;dur={stats.total_time * 1000:.2f};desc="{stats.count} queries"'
+    if stats.slowest_statement is not None:
+        value += f", db-slowest;dur={stats.slowest_time * 1000:.2f}"
+    return value
+
+
+class QueryInstrumentationMiddleware:
+    """
+    요청마다 SQL 수·DB 시간·가장 느린 문장·반복 문장을 모아
+    Server-Timing/X-DB-Query-Count 헤더, app.sql 로그, /metrics 로 내보낸다.
+    스트리밍 응답은 헤더를 보낸 뒤에도 쿼리가 실행되므로 헤더 값은 그 시점까지의 값이다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        with collect_queries() as stats:
+            async def send_with_headers(message):
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", _server_timing(stats).encode()))
+                    headers.append((QUERY_COUNT_HEADER.lower().encode(), str(stats.count).encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                self._report(scope, status, stats, time.perf_counter() - started)
+
+    def _report(self, scope, status: int, stats: QueryStats, elapsed: float):
+        route = _route_template(scope)
+        repeated = stats.repeated()
+        metrics_registry.observe_request(scope["method"], route, stats, bool(repeated))
+
+        slow = stats.slowest_time * 1000 >= settings.SQL_SLOW_QUERY_MS
+        level = logging.WARNING if repeated or slow else logging.INFO
+        if not logger.isEnabledFor(level):
+            return
+        logger.log(level, json.dumps({
+            "method": scope["method"],
+            "route": route,
+            "status": status,
+            "duration_ms": round(elapsed * 1000, 2),
+            "db_queries": stats.count,
+            "db_ms": round(stats.total_time * 1000, 2),
+            "slowest_ms": round(stats.slowest_time * 1000, 2),
+            "slowest_statement": stats.slowest_statement,
+            "repeated_statements": [{"count": n, "statement": pattern} for pattern, n in repeated],
+        }, ensure_ascii=False))
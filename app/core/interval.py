@@ -0,0 +1,53 @@
+from bisect import bisect_left
+from typing import Any, Generic, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class IntervalTree(Generic[T]):
+    """
+    반열린 구간 [start, end) 의 정적 구간 트리. 시작 시각 순으로 정렬한 배열을 암묵적인 균형 이진 트리로 보고
+    노드마다 부분 트리의 가장 늦은 종료 시각을 둔다. 겹치는 구간 k 개를 O(log n + k) 에 찾는다.
+    항목이 바뀌면 새로 만든다.
+    """
+
+    def __init__(self, items: Iterable[Tuple[Any, Any, T]]):
+        entries = sorted(items, key=lambda item: item[0])
+        self._starts = [start for start, _, _ in entries]
+        self._ends = [end for _, end, _ in entries]
+        self._values: List[T] = [value for _, _, value in entries]
+        self._max_ends = list(self._ends)
+        self._build(0, len(entries))
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _build(self, lo: int, hi: int):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        max_end = self._ends[mid]
+        for child in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child is not None and child > max_end:
+                max_end = child
+        self._max_ends[mid] = max_end
+        return max_end
+
+    def overlapping(self, start: Any, end: Any) -> List[T]:
+        """[start, end) 와 겹치는 항목을 시작 시각 순으로 돌려준다."""
+        result: List[T] = []
+        # 이 위치부터는 시작 시각이 end 이상이라 겹칠 수 없다
+        limit = bisect_left(self._starts, end)
+        self._collect(0, len(self._values), start, limit, result)
+        return result
+
+    def _collect(self, lo: int, hi: int, start: Any, limit: int, result: List[T]):
+        if lo >= hi or lo >= limit:
+            return
+        mid = (lo + hi) // 2
+        if self._max_ends[mid] <= start:
+            return
+        self._collect(lo, mid, start, limit, result)
+        if mid < limit and self._ends[mid] > start:
+            result.append(self._values[mid])
+        self._collect(mid + 1, hi, start, limit, result)
@@ -0,0 +1,19 @@
+import zlib
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+
+def advisory_lock_key(name: str) -> int:
+    # hash() 는 프로세스마다 값이 달라 인스턴스끼리 같은 키를 얻지 못한다
+    return zlib.crc32(name.encode())
+
+
+def try_advisory_xact_lock(db: Session, name: str) -> bool:
+    """
+    PostgreSQL 트랜잭션 범위 advisory lock 을 기다리지 않고 잡아 본다. 다른 인스턴스가 잡고 있으면 False.
+    커밋·롤백하면 풀린다. PostgreSQL 이 아니면(단일 프로세스 SQLite) 항상 True.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return True
+    return bool(db.execute(select(func.pg_try_advisory_xact_lock(advisory_lock_key(name)))).scalar())
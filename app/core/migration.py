@@ -0,0 +1,21 @@
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy.engine import Connection
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def run_migrations(revision: str = "head", connection: Optional[Connection] = None):
+    """
+    alembic 마이그레이션을 revision 까지 올린다. connection 을 넘기면 접속 설정 대신 그 커넥션에 적용한다.
+    넘긴 커넥션은 트랜잭션 밖이어야 한다 (0007 처럼 트랜잭션 밖에서 실행하는 마이그레이션이 앞선 트랜잭션을 커밋한다).
+    """
+    config = Config(str(PROJECT_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(PROJECT_ROOT / "migrations"))
+    # 애플리케이션 로깅 설정을 alembic.ini 로 덮어쓰지 않는다
+    config.attributes["configure_logger"] = False
+    config.attributes["connection"] = connection
+    command.upgrade(config, revision)
\ No newline at end of file
@@ -0,0 +1,29 @@
+import base64
+from typing import Optional
+
+from fastapi import HTTPException
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(last_id: int) -> str:
+    return base64.urlsafe_b64encode(f"id:{last_id}".encode()).decode().rstrip("=")
+
+
+def next_cursor(last_id: Optional[int]) -> Optional[str]:
+    """마지막 페이지면 None."""
+    return encode_cursor(last_id) if last_id is not None else None
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        prefix, last_id = base64.urlsafe_b64decode(padded).decode().split(":", 1)
+        if prefix != "id":
+            raise ValueError(prefix)
+        return int(last_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
\ No newline at end of file
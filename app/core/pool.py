@@ -0,0 +1,118 @@
+import threading
+import time
+import uuid
+from typing import Any, Dict, List
+
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+
+class PoolWaitStats:
+    """커넥션을 빌리는 데 걸린 시간과 타임아웃 횟수. 풀 크기 자체는 풀에서 직접 읽는다."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.timeouts = 0
+        self._lock = threading.Lock()
+
+    def observe(self, elapsed: float, timed_out: bool):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.checkouts += 1
+            self.wait_seconds += elapsed
+            self.max_wait_seconds = max(self.max_wait_seconds, elapsed)
+
+
+class _WaitTimingMixin:
+    wait_stats: PoolWaitStats
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.wait_stats.observe(time.perf_counter() - started, timed_out=True)
+            raise
+        self.wait_stats.observe(time.perf_counter() - started, timed_out=False)
+        return connection
+
+    def recreate(self):
+        # dispose()/재접속으로 풀이 새로 만들어져도 누적값은 이어 간다
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+
+class InstrumentedAsyncAdaptedQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+def engine_options(url: str, is_async: bool = False) -> Dict[str, Any]:
+    """Settings 의 DB_POOL_* / DB_PGBOUNCER 값을 create_engine 인자로 옮긴다."""
+    options: Dict[str, Any] = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if _is_memory_sqlite(url):
+        return options
+
+    options.update(
+        poolclass=InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_use_lifo=settings.DB_POOL_USE_LIFO,
+    )
+    if settings.DB_PGBOUNCER and is_async and make_url(url).get_backend_name() == "postgresql":
+        # 트랜잭션 풀링 모드의 PgBouncer 는 같은 서버 커넥션을 보장하지 않으므로 prepared statement 를
+        # 캐시하지 않고, 어쩔 수 없이 만드는 것도 이름이 겹치지 않게 한다
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    return options
+
+
+_POOL_SERIES = (
+    ("db_pool_size", "gauge", "설정된 풀 크기", lambda pool: pool.size()),
+    ("db_pool_checked_out", "gauge", "현재 빌려 간 커넥션 수", lambda pool: pool.checkedout()),
+    ("db_pool_checked_in", "gauge", "풀에서 쉬고 있는 커넥션 수", lambda pool: pool.checkedin()),
+    ("db_pool_overflow", "gauge", "pool_size 를 넘겨 연 커넥션 수 (음수면 아직 열지 않은 기본 커넥션 수)", lambda pool: pool.overflow()),
+    ("db_pool_max_overflow", "gauge", "설정된 최대 overflow", lambda pool: pool._max_overflow),
+    ("db_pool_checkouts_total", "counter", "커넥션을 빌린 횟수", lambda pool: pool.wait_stats.checkouts),
+    ("db_pool_wait_seconds_total", "counter", "커넥션을 빌리려고 기다린 시간 합(초)", lambda pool: pool.wait_stats.wait_seconds),
+    ("db_pool_wait_seconds_max", "gauge", "가장 오래 기다린 시간(초)", lambda pool: pool.wait_stats.max_wait_seconds),
+    ("db_pool_timeouts_total", "counter", "pool_timeout 안에 커넥션을 못 빌린 횟수", lambda pool: pool.wait_stats.timeouts),
+)
+
+
+def pool_metrics(engines: Dict[str, Any]) -> List[str]:
+    """engines: {"sync": engine, "async": async_engine.sync_engine}. 계측 풀이 아닌 엔진은 건너뛴다."""
+    pools = {name: engine.pool for name, engine in engines.items()
+             if isinstance(engine.pool, _WaitTimingMixin)}
+    lines = []
+    for name, kind, help_text, read in _POOL_SERIES:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for engine_name, pool in pools.items():
+            lines.append(f'{name}{{engine="{engine_name}"}} {read(pool)}')
+    return lines
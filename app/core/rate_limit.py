@@ -0,0 +1,201 @@
+import math
+import threading
+import time
+from collections import OrderedDict, Counter
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+
+from app.core.auth import resolve_subject
+from app.core.cache import CacheBackend
+from app.core.config import settings
+from app.core.instrumentation import metrics_registry
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    rate: float
+    burst: int
+
+
+def _gcra(tat: Optional[float], now: float, limit: RateLimit) -> Tuple[Optional[float], float]:
+    """
+    토큰 버킷을 '버킷이 다시 가득 차는 시각'(TAT) 하나로 계산한다 (GCRA).
+    (새 TAT, 기다려야 하는 초). 거절하면 새 TAT 는 None 이고 저장된 값은 그대로 둔다.
+    """
+    interval = 1.0 / limit.rate
+    tat = now if tat is None else max(tat, now)
+    wait = tat - now - (limit.burst - 1) * interval
+    if wait > 0:
+        return None, wait
+    return tat + interval, 0.0
+
+
+class RateLimitStore:
+    """
+    버킷 저장소 인터페이스. acquire 는 키의 버킷에서 요청 하나를 꺼내고, 모자라면 다시 시도할 수 있을 때까지의 초를 돌려준다.
+    여러 인스턴스가 한도를 나눠 쓰려면 Redis 같은 공유 저장소에서 _gcra 를 원자적으로 실행하는 구현을 붙인다.
+    """
+
+    def acquire(self, key: str, limit: RateLimit) -> float:
+        raise NotImplementedError
+
+    def size(self) -> Optional[int]:
+        return None
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """
+    프로세스 로컬 저장소. 키마다 TAT(float) 하나만 둔다. TAT 가 지난 키는 버킷이 가득 찬 것과 같으므로
+    오래 쓰지 않은 키부터 지우고, 그래도 max_keys 를 넘으면 가장 오래 쓰지 않은 키를 버린다.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._tats: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, limit: RateLimit) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tat, wait = _gcra(self._tats.get(key), now, limit)
+            if tat is not None:
+                self._tats[key] = tat
+                self._tats.move_to_end(key)
+                self._evict(now)
+            return wait
+
+    def _evict(self, now: float):
+        while self._tats:
+            key, tat = next(iter(self._tats.items()))
+            if tat > now and len(self._tats) <= self.max_keys:
+                break
+            del self._tats[key]
+
+    def size(self) -> Optional[int]:
+        return len(self._tats)
+
+
+class CacheRateLimitStore(RateLimitStore):
+    """
+    CacheBackend(공유 저장소)에 TAT 를 두는 저장소. 키는 버킷이 가득 차는 시각에 만료된다.
+    읽고 쓰는 사이가 원자적이지 않아 여러 인스턴스에 동시에 들어온 요청은 한도보다 조금 더 통과할 수 있다.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+
+    def acquire(self, key: str, limit: RateLimit) -> float:
+        now = time.time()
+        value = self.backend.get(key)
+        tat, wait = _gcra(float(value) if value is not None else None, now, limit)
+        if tat is not None:
+            self.backend.set(key, repr(tat).encode(), tat - now)
+        return wait
+
+
+class RateLimiter:
+    def __init__(self, store: RateLimitStore):
+        self.store = store
+        self.allowed: Counter = Counter()
+        self.rejected: Counter = Counter()
+
+    def use_store(self, store: RateLimitStore):
+        self.store = store
+
+    def acquire(self, endpoint: str, client: str, limit: RateLimit) -> float:
+        wait = self.store.acquire(f"rate-limit:{endpoint}:{client}", limit)
+        if wait > 0:
+            self.rejected[endpoint] += 1
+        else:
+            self.allowed[endpoint] += 1
+        return wait
+
+
+rate_limiter = RateLimiter(MemoryRateLimitStore(settings.RATE_LIMIT_MAX_KEYS))
+
+
+def _endpoint_limit(method: str, path: str) -> Optional[Tuple[str, RateLimit, bool]]:
+    """(엔드포인트, 한도, 사용자별인지). 제한하지 않는 요청이면 None."""
+    endpoint = f"{method} {path.rstrip('/')}"
+    if endpoint == "POST /reservations":
+        limit = RateLimit(settings.RATE_LIMIT_RESERVATION_PER_SECOND, settings.RATE_LIMIT_RESERVATION_BURST)
+        return endpoint, limit, True
+    if endpoint in ("GET /exam-schedules/available", "GET /exam-schedules/search"):
+        limit = RateLimit(settings.RATE_LIMIT_SCHEDULE_PER_SECOND, settings.RATE_LIMIT_SCHEDULE_BURST)
+        return endpoint, limit, False
+    return None
+
+
+def _client_ip(scope, headers: Headers) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED_FOR:
+        forwarded = headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[-1].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _client_key(scope, per_user: bool) -> str:
+    headers = Headers(scope=scope)
+    if per_user:
+        try:
+            return f"user:{resolve_subject(headers.get('authorization'))}"
+        except HTTPException:
+            # 인증에 실패할 요청도 IP 로 세어 잘못된 토큰을 바꿔 가며 보내는 요청을 막는다
+            pass
+    return f"ip:{_client_ip(scope, headers)}"
+
+
+class RateLimitMiddleware:
+    """
+    RATE_LIMIT_ENABLED 일 때 예약 생성(사용자별)과 일정 조회(IP 별) 요청 수를 토큰 버킷으로 제한한다.
+    사용자는 get_current_user 와 같은 방법으로 토큰에서 읽되 DB 는 읽지 않으므로, 거절된 요청은 라우팅·DB 세션까지 가지 않는다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.RATE_LIMIT_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        matched = _endpoint_limit(scope["method"], scope["path"])
+        if matched is None:
+            await self.app(scope, receive, send)
+            return
+
+        endpoint, limit, per_user = matched
+        wait = rate_limiter.acquire(endpoint, _client_key(scope, per_user), limit)
+        if wait > 0:
+            response = JSONResponse(
+                {"detail": "요청이 너무 많습니다. 잠시 후 다시 시도해 주세요."},
+                status_code=429,
+                headers={"Retry-After": str(math.ceil(wait))},
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+def _rate_limit_metrics() -> List[str]:
+    lines = [
+        "# HELP rate_limit_requests_total 요청 수 제한을 거친 요청 수",
+        "# TYPE rate_limit_requests_total counter",
+    ]
+    for result, counts in (("allowed", rate_limiter.allowed), ("rejected", rate_limiter.rejected)):
+        for endpoint, count in sorted(counts.items()):
+            lines.append(f'rate_limit_requests_total{{endpoint="{endpoint}",result="{result}"}} {count}')
+    size = rate_limiter.store.size()
+    if size is not None:
+        lines.append("# HELP rate_limit_keys 프로세스 로컬 저장소가 기억하는 버킷 수")
+        lines.append("# TYPE rate_limit_keys gauge")
+        lines.append(f"rate_limit_keys {size}")
+    return lines
+
+
+metrics_registry.register_collector(_rate_limit_metrics)
@@ -0,0 +1,102 @@
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Optional, TypeVar, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+T = TypeVar("T")
+
+REPLICA_BIND_KEY = "replica_bind"
+_USE_REPLICA_KEY = "use_replica"
+_PRIMARY_ONLY_KEY = "primary_only"
+
+# 현재 요청의 사용자. 인증 의존성이 심고, 쓰기 커밋과 읽기 라우팅이 참조한다
+_current_subject: ContextVar[Optional[int]] = ContextVar("current_subject", default=None)
+
+# 최근에 쓰기를 커밋한 사용자. 이 기간에는 자기 쓰기가 복제본에 반영되지 않았을 수 있으므로 읽기도 primary 로 보낸다
+_recent_writers: TTLCache[int, bool] = TTLCache(
+    settings.READ_YOUR_WRITES_MAX_ENTRIES,
+    ttl=settings.READ_YOUR_WRITES_SECONDS,
+)
+
+
+class RoutingSession(Session):
+    """
+    replica_read 로 감싼 읽기만 복제본 엔진으로 보내고 나머지는 모두 primary 로 보낸다.
+    복제본 엔진은 sessionmaker(info={REPLICA_BIND_KEY: engine}) 로 넘긴다.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        replica = self.info.get(REPLICA_BIND_KEY)
+        if replica is not None and self.info.get(_USE_REPLICA_KEY):
+            return replica
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+def set_current_subject(user_id: Optional[int]):
+    _current_subject.set(user_id)
+
+
+def mark_recent_write():
+    user_id = _current_subject.get()
+    if user_id is not None:
+        _recent_writers.set(user_id, True)
+
+
+@contextmanager
+def primary_only(db: Union[Session, AsyncSession]):
+    """블록 안의 모든 문장을 primary 로 보낸다. 쓰기 트랜잭션 안에서 부른 읽기 메서드도 마찬가지다."""
+    previous = db.info.get(_PRIMARY_ONLY_KEY, False)
+    db.info[_PRIMARY_ONLY_KEY] = True
+    try:
+        yield
+    finally:
+        db.info[_PRIMARY_ONLY_KEY] = previous
+
+
+def _can_use_replica(db: Union[Session, AsyncSession]) -> bool:
+    if db.info.get(REPLICA_BIND_KEY) is None or db.info.get(_PRIMARY_ONLY_KEY):
+        return False
+    if db.new or db.dirty or db.deleted:
+        return False
+    user_id = _current_subject.get()
+    return user_id is None or _recent_writers.get(user_id) is None
+
+
+@contextmanager
+def _replica_scope(db: Union[Session, AsyncSession]):
+    if not _can_use_replica(db):
+        yield
+        return
+    db.info[_USE_REPLICA_KEY] = True
+    try:
+        yield
+    finally:
+        db.info.pop(_USE_REPLICA_KEY, None)
+
+
+def replica_read(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    읽기 전용 리포지토리 메서드를 복제본으로 보낸다. 복제본이 없거나, 쓰기 트랜잭션 안이거나,
+    현재 사용자가 READ_YOUR_WRITES_SECONDS 안에 쓰기를 커밋했다면 primary 를 그대로 쓴다.
+    """
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(self, *args: Any, **kwargs: Any):
+            with _replica_scope(self.db):
+                return await func(self, *args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(self, *args: Any, **kwargs: Any):
+        with _replica_scope(self.db):
+            return func(self, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,36 @@
+from typing import Any, List, Optional, Sequence
+
+import orjson
+from fastapi import Response
+from sqlalchemy import Row
+
+# UTC 시각은 Pydantic 응답(단건 POST/PATCH)과 같이 +00:00 대신 Z 로 쓴다
+_OPTIONS = orjson.OPT_UTC_Z
+
+
+def _as_dicts(rows: Sequence[Row]) -> List[dict]:
+    # Row._asdict() 는 행마다 필드 목록을 다시 만들어 zip 보다 몇 배 느리다
+    if not rows:
+        return []
+    fields = rows[0]._fields
+    return [dict(zip(fields, row)) for row in rows]
+
+
+def encode_rows(rows: Sequence[Row]) -> bytes:
+    """
+    컬럼 Row 목록을 JSON 배열로 바로 인코딩한다. 행마다 Pydantic 모델을 만들지 않는다.
+    datetime 은 Pydantic 과 같은 ISO 8601 형식, Enum 은 값으로 나간다.
+    """
+    return orjson.dumps(_as_dicts(rows), option=_OPTIONS)
+
+
+def encode_page(rows: Sequence[Row], next_cursor: Optional[str]) -> bytes:
+    return orjson.dumps({"items": _as_dicts(rows), "next_cursor": next_cursor}, option=_OPTIONS)
+
+
+def encode_json(value: Any) -> bytes:
+    return orjson.dumps(value, option=_OPTIONS)
+
+
+def json_response(body: bytes, status_code: int = 200) -> Response:
+    return Response(content=body, status_code=status_code, media_type="application/json")
@@ -0,0 +1,119 @@
+import base64
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import rsa
+
+from app.core.config import settings
+
+_HEADER = {"alg": "RS256", "typ": "JWT"}
+_MISSING_KEY_MESSAGE = "AUTH_PUBLIC_KEY_FILE 이 필요합니다. 키 없이 임시 키를 쓰려면 AUTH_ALLOW_DEV_TOKENS 를 켭니다."
+
+
+class InvalidToken(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    subject: int
+    expires_at: int
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _read_key(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+
+class _KeyStore:
+    """
+    RS256 키. AUTH_PUBLIC_KEY_FILE / AUTH_PRIVATE_KEY_FILE(PKCS#1 PEM)가 없으면
+    개발용 토큰을 켠 경우에만 처음 쓸 때 임시 키쌍을 만든다. 임시 키로 발급한 토큰은 재시작하면 무효가 된다.
+    """
+
+    def __init__(self):
+        self._keys: Optional[Tuple[rsa.PublicKey, Optional[rsa.PrivateKey]]] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Tuple[rsa.PublicKey, Optional[rsa.PrivateKey]]:
+        if self._keys is None:
+            with self._lock:
+                if self._keys is None:
+                    self._keys = self._load()
+        return self._keys
+
+    def check(self):
+        """기동 시 확인. 키 파일을 지정했으면 지금 읽어 보고, 지정하지 않았는데 개발용 토큰도 꺼져 있으면 실패한다."""
+        if settings.AUTH_PUBLIC_KEY_FILE:
+            self.get()
+        elif not settings.AUTH_ALLOW_DEV_TOKENS:
+            raise RuntimeError(_MISSING_KEY_MESSAGE)
+
+    @staticmethod
+    def _load() -> Tuple[rsa.PublicKey, Optional[rsa.PrivateKey]]:
+        if settings.AUTH_PUBLIC_KEY_FILE:
+            public_key = rsa.PublicKey.load_pkcs1(_read_key(settings.AUTH_PUBLIC_KEY_FILE))
+            private_key = None
+            if settings.AUTH_PRIVATE_KEY_FILE:
+                private_key = rsa.PrivateKey.load_pkcs1(_read_key(settings.AUTH_PRIVATE_KEY_FILE))
+            return public_key, private_key
+        if not settings.AUTH_ALLOW_DEV_TOKENS:
+            raise RuntimeError(_MISSING_KEY_MESSAGE)
+        return rsa.newkeys(2048)
+
+
+_keys = _KeyStore()
+
+
+def check_keys():
+    _keys.check()
+
+
+def create_access_token(user_id: int, ttl: Optional[float] = None) -> str:
+    _, private_key = _keys.get()
+    if private_key is None:
+        raise RuntimeError("AUTH_PRIVATE_KEY_FILE 이 없어 토큰을 발급할 수 없습니다.")
+
+    expires_at = int(time.time() + (settings.AUTH_TOKEN_TTL_SECONDS if ttl is None else ttl))
+    payload = {"sub": str(user_id), "exp": expires_at}
+    signing_input = ".".join(
+        _b64encode(json.dumps(part, separators=(",", ":")).encode()) for part in (_HEADER, payload)
+    )
+    signature = rsa.sign(signing_input.encode(), private_key, "SHA-256")
+    return f"{signing_input}.{_b64encode(signature)}"
+
+
+def verify_access_token(token: str) -> TokenClaims:
+    """서명과 만료를 확인한다. 형식·서명·만료 중 하나라도 틀리면 InvalidToken."""
+    try:
+        header_segment, payload_segment, signature_segment = token.split(".")
+        header = json.loads(_b64decode(header_segment))
+        if header.get("alg") != _HEADER["alg"]:
+            raise InvalidToken("지원하지 않는 서명 알고리즘입니다.")
+
+        public_key, _ = _keys.get()
+        signing_input = f"{header_segment}.{payload_segment}".encode()
+        if rsa.verify(signing_input, _b64decode(signature_segment), public_key) != "SHA-256":
+            raise InvalidToken("지원하지 않는 해시 알고리즘입니다.")
+
+        payload = json.loads(_b64decode(payload_segment))
+        claims = TokenClaims(subject=int(payload["sub"]), expires_at=int(payload["exp"]))
+    except InvalidToken:
+        raise
+    except (ValueError, KeyError, TypeError, rsa.VerificationError) as e:
+        raise InvalidToken("잘못된 토큰입니다.") from e
+
+    if claims.expires_at <= time.time():
+        raise InvalidToken("만료된 토큰입니다.")
+    return claims
@@ -1,37 +1,148 @@
+import asyncio
+import random
+import time
 from functools import wraps
-from typing import Callable, TypeVar, Any
-from contextlib import contextmanager
+from typing import Callable, TypeVar, Any, Awaitable, Union, Optional
+from contextlib import contextmanager, asynccontextmanager
 
 from fastapi import Depends
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.replica import mark_recent_write, primary_only
 
 T = TypeVar("T")
 
+# serialization_failure, deadlock_detected: 같은 트랜잭션을 다시 실행하면 성공할 수 있는 오류
+RETRYABLE_SQLSTATES = {"40001", "40P01"}
+
+_AFTER_COMMIT_KEY = "after_commit"
+
+
+def on_commit(db: Union[Session, AsyncSession], callback: Callable[[], None]):
+    """현재 트랜잭션이 커밋된 뒤에 실행할 콜백을 등록한다. 롤백되면 버려진다."""
+    db.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+def _run_after_commit(db: Union[Session, AsyncSession]):
+    mark_recent_write()
+    for callback in db.info.pop(_AFTER_COMMIT_KEY, []):
+        callback()
+
 
 @contextmanager
-def transaction_context(db: Session):
+def transaction_context(db: Session, isolation_level: Optional[str] = None):
     try:
-        yield db
-        db.commit()
+        with primary_only(db):
+            if isolation_level:
+                db.connection(execution_options={"isolation_level": isolation_level})
+            yield db
+            db.commit()
     except Exception as e:
         db.rollback()
+        db.info.pop(_AFTER_COMMIT_KEY, None)
         raise e
+    _run_after_commit(db)
 
 
-def transactional(func: Callable[..., T]) -> Callable[..., T]:
-
-    @wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> T:
-        db = next((arg for arg in args if isinstance(arg, Session)), kwargs.get('db'))
-        if not db:
-            raise ValueError("Database session not found in arguments")
-
-        with transaction_context(db):
-            return func(*args, **kwargs)
-
-    return wrapper
+@asynccontextmanager
+async def async_transaction_context(db: AsyncSession, isolation_level: Optional[str] = None):
+    try:
+        with primary_only(db):
+            if isolation_level:
+                await db.connection(execution_options={"isolation_level": isolation_level})
+            yield db
+            await db.commit()
+    except Exception as e:
+        await db.rollback()
+        db.info.pop(_AFTER_COMMIT_KEY, None)
+        raise e
+    _run_after_commit(db)
+
+
+def _resolve_session(args: tuple, kwargs: dict, session_type: type = Session):
+    db = next((arg for arg in args if isinstance(arg, session_type)), kwargs.get('db'))
+    if db is None and args:
+        repository = getattr(args[0], 'repository', None)
+        db = getattr(repository, 'db', None)
+    return db
+
+
+def is_retryable_error(error: DBAPIError) -> bool:
+    sqlstate = getattr(error.orig, "pgcode", None) or getattr(error.orig, "sqlstate", None)
+    return sqlstate in RETRYABLE_SQLSTATES
+
+
+def _retry_delay(attempt: int) -> float:
+    base = settings.TRANSACTION_RETRY_BACKOFF_SECONDS * (2 ** attempt)
+    return base + random.uniform(0, base)
+
+
+def transactional(
+        func: Optional[Callable[..., T]] = None,
+        *,
+        isolation_level: Optional[str] = None,
+        retryable: bool = False
+):
+    """
+    서비스 메서드를 하나의 트랜잭션으로 감싼다.
+    retryable=True 이면 직렬화 실패/데드락으로 롤백됐을 때 TRANSACTION_MAX_RETRIES 번까지 처음부터 다시 실행한다.
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            db = _resolve_session(args, kwargs)
+            if not db:
+                raise ValueError("Database session not found in arguments")
+
+            attempt = 0
+            while True:
+                try:
+                    with transaction_context(db, isolation_level):
+                        return func(*args, **kwargs)
+                except DBAPIError as e:
+                    if not retryable or attempt >= settings.TRANSACTION_MAX_RETRIES or not is_retryable_error(e):
+                        raise
+                    time.sleep(_retry_delay(attempt))
+                    attempt += 1
+
+        return wrapper
+
+    return decorator(func) if func is not None else decorator
+
+
+def async_transactional(
+        func: Optional[Callable[..., Awaitable[T]]] = None,
+        *,
+        isolation_level: Optional[str] = None,
+        retryable: bool = False
+):
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            db = _resolve_session(args, kwargs, AsyncSession)
+            if not db:
+                raise ValueError("Database session not found in arguments")
+
+            attempt = 0
+            while True:
+                try:
+                    async with async_transaction_context(db, isolation_level):
+                        return await func(*args, **kwargs)
+                except DBAPIError as e:
+                    if not retryable or attempt >= settings.TRANSACTION_MAX_RETRIES or not is_retryable_error(e):
+                        raise
+                    await asyncio.sleep(_retry_delay(attempt))
+                    attempt += 1
+
+        return wrapper
+
+    return decorator(func) if func is not None else decorator
 
 
 class BaseRepository:
@@ -55,4 +166,28 @@ class BaseRepository:
 
     def refresh(self, obj):
         self.db.refresh(obj)
+        return obj
+
+
+class AsyncBaseRepository:
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @asynccontextmanager
+    async def transaction(self):
+        async with async_transaction_context(self.db) as session:
+            yield session
+
+    async def save(self, obj):
+        self.db.add(obj)
+        await self.db.flush()
+        return obj
+
+    async def delete(self, obj):
+        await self.db.delete(obj)
+        await self.db.flush()
+
+    async def refresh(self, obj):
+        await self.db.refresh(obj)
         return obj
\ No newline at end of file
@@ -1,9 +1,13 @@
+from app.models.idempotency import IdempotencyKey
 from app.models.reservation import Reservation
 from app.models.schedule import ExamSchedule
 from app.models.user import User
+from app.models.waitlist import WaitlistEntry
 
 __all__ = [
     "Reservation",
     "ExamSchedule",
-    "User"
+    "User",
+    "WaitlistEntry",
+    "IdempotencyKey"
 ]
\ No newline at end of file
@@ -10,3 +10,4 @@ class ReservationStatus(str, Enum):
     PENDING = "pending"
     CONFIRMED = "confirmed"
     CANCELLED = "cancelled"
+    WAITLISTED = "waitlisted"
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, DateTime, String, LargeBinary
+
+from app.core.database import Base
+
+
+class IdempotencyKey(Base):
+    """
+    Idempotency-Key 로 처리한 요청의 결과. 여러 인스턴스가 같은 키를 공유할 때 쓴다(IDEMPOTENCY_BACKEND=db).
+    status_code 가 NULL 이면 아직 처리 중이다.
+    """
+    __tablename__ = "idempotency_keys"
+
+    key = Column(String(400), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(LargeBinary, nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -1,6 +1,4 @@
-from datetime import datetime
-
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Enum, Index, func, text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -9,14 +7,30 @@ from app.models.enums import ReservationStatus
 
 class Reservation(Base):
     __tablename__ = "reservations"
+    __table_args__ = (
+        Index("ix_reservations_exam_id_status", "exam_id", "status"),
+        Index("ix_reservations_user_id_created_at", "user_id", "created_at"),
+        # 오래된 PENDING 예약 만료 작업용. 만료 대상만 담는 부분 인덱스
+        Index(
+            "ix_reservations_pending_created_at",
+            "created_at",
+            "id",
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     exam_id = Column(Integer, ForeignKey("exam_schedules.id"), nullable=False)
     status = Column(Enum(ReservationStatus), default=ReservationStatus.PENDING, nullable=False)
     requested_seats = Column(Integer, nullable=False)
-    created_at = Column(DateTime, default=datetime.now())
-    updated_at = Column(DateTime, default=datetime.now(), onupdate=datetime.now())
+    # 시각은 DB 가 정한다. 여러 행을 한 번에 넣어도 행마다 파이썬에서 값을 만들지 않고,
+    # 서버마다 시계가 달라도 만료·정렬 기준이 어긋나지 않는다. ORM 밖의 UPDATE 는 트리거가 맞춘다 (migration 0008)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+
+    __mapper_args__ = {"eager_defaults": True}
 
     user = relationship("User", back_populates="reservations")
     exam_schedule = relationship("ExamSchedule", back_populates="reservations")
@@ -1,6 +1,4 @@
-from datetime import datetime
-
-from sqlalchemy import DateTime, Column, Integer
+from sqlalchemy import DateTime, Column, Index, Integer, UniqueConstraint, func, literal_column
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -8,12 +6,25 @@ from app.core.database import Base
 
 class ExamSchedule(Base):
     __tablename__ = "exam_schedules"
+    __table_args__ = (
+        UniqueConstraint("start_time", "end_time", name="uq_exam_schedules_start_time_end_time"),
+        # 시간대 겹침 검색용 GiST 인덱스. PostgreSQL 에만 만든다
+        Index(
+            "ix_exam_schedules_time_range",
+            func.tsrange(literal_column("start_time"), literal_column("end_time"), literal_column("'[)'")),
+            postgresql_using="gist",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     start_time = Column(DateTime, nullable=False)
     end_time = Column(DateTime, nullable=False)
     max_seats = Column(Integer, nullable=False, default=50000)
-    created_at = Column(DateTime, default=datetime.now())
-    updated_at = Column(DateTime, default=datetime.now(), onupdate=datetime.now())
+    confirmed_seats = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+
+    # DB 가 채운 시각을 INSERT/UPDATE ... RETURNING 으로 같이 받는다. 나중에 따로 SELECT 하지 않는다
+    __mapper_args__ = {"eager_defaults": True}
 
     reservations = relationship("Reservation", back_populates="exam_schedule")
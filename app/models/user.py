@@ -1,6 +1,4 @@
-from datetime import datetime
-
-from sqlalchemy import Column, Integer, String, DateTime, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Enum, func
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -14,7 +12,9 @@ class User(Base):
     name = Column(String, nullable=False)
     password = Column(String, nullable=False)
     role = Column(Enum(UserRole), nullable=False)
-    created_at = Column(DateTime, default=datetime.now())
-    updated_at = Column(DateTime, default=datetime.now(), onupdate=datetime.now())
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+
+    __mapper_args__ = {"eager_defaults": True}
 
     reservations = relationship("Reservation", back_populates="user")
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, func
+
+from app.core.database import Base
+
+
+class WaitlistEntry(Base):
+    """
+    정원이 차서 확정하지 못한 예약의 대기열. 일정별로 id 순(FIFO)으로 승격한다.
+    예약 하나는 대기열에 한 번만 들어간다.
+    """
+    __tablename__ = "reservation_waitlist"
+    __table_args__ = (
+        Index("ix_reservation_waitlist_exam_id_id", "exam_id", "id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    exam_id = Column(Integer, ForeignKey("exam_schedules.id", ondelete="CASCADE"), nullable=False)
+    reservation_id = Column(
+        Integer,
+        ForeignKey("reservations.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True
+    )
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
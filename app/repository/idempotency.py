@@ -0,0 +1,72 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete, select, update, Row
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.core.transaction import BaseRepository
+from app.models import IdempotencyKey
+
+
+def _insert_key_stmt(dialect_name: str):
+    """같은 키를 동시에 넣으면 한쪽만 들어가고 나머지는 조용히 무시된다."""
+    insert_stmt = sqlite.insert if dialect_name == "sqlite" else postgresql.insert
+    return insert_stmt(IdempotencyKey).on_conflict_do_nothing(index_elements=["key"])
+
+
+class IdempotencyRepository(BaseRepository):
+    def claim(self, key: str, fingerprint: str, now: datetime, expires_at: datetime) -> bool:
+        """키를 처리 중으로 선점한다. 이미 있는 키는 now 에 만료된 경우에만 새로 가져간다."""
+        stmt = (
+            _insert_key_stmt(self.db.get_bind().dialect.name)
+            .values(key=key, fingerprint=fingerprint, expires_at=expires_at)
+            .returning(IdempotencyKey.key)
+        )
+        if self.db.execute(stmt).scalar_one_or_none() is not None:
+            return True
+
+        stmt = (
+            update(IdempotencyKey)
+            .where(IdempotencyKey.key == key, IdempotencyKey.expires_at <= now)
+            .values(fingerprint=fingerprint, status_code=None, response_body=None, expires_at=expires_at)
+            .returning(IdempotencyKey.key)
+            .execution_options(synchronize_session=False)
+        )
+        return self.db.execute(stmt).scalar_one_or_none() is not None
+
+    def get(self, key: str, now: datetime) -> Optional[Row]:
+        """(fingerprint, status_code, response_body, expired). 만료 여부는 저장된 시각과 같은 형식으로 DB 에서 비교한다."""
+        stmt = select(
+            IdempotencyKey.fingerprint,
+            IdempotencyKey.status_code,
+            IdempotencyKey.response_body,
+            (IdempotencyKey.expires_at <= now).label("expired"),
+        ).where(IdempotencyKey.key == key)
+        return self.db.execute(stmt).first()
+
+    def complete(self, key: str, status_code: int, body: bytes, expires_at: datetime):
+        stmt = (
+            update(IdempotencyKey)
+            .where(IdempotencyKey.key == key)
+            .values(status_code=status_code, response_body=body, expires_at=expires_at)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.execute(stmt)
+
+    def release(self, key: str):
+        """처리 중인 키만 지운다. 완료된 결과는 남긴다."""
+        stmt = (
+            delete(IdempotencyKey)
+            .where(IdempotencyKey.key == key, IdempotencyKey.status_code.is_(None))
+            .execution_options(synchronize_session=False)
+        )
+        self.db.execute(stmt)
+
+    def purge_expired(self, now: datetime, limit: int) -> int:
+        expired = select(IdempotencyKey.key).where(IdempotencyKey.expires_at <= now).limit(limit)
+        stmt = (
+            delete(IdempotencyKey)
+            .where(IdempotencyKey.key.in_(expired))
+            .execution_options(synchronize_session=False)
+        )
+        return self.db.execute(stmt).rowcount
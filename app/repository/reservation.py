@@ -1,12 +1,119 @@
 from datetime import datetime
-from typing import Type, Optional
+from typing import Type, Optional, Sequence, Tuple, Iterator, Iterable, Dict
 
-from sqlalchemy import and_, func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, delete, select, update, insert, tuple_, Row
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, load_only
 
-from app.core.transaction import BaseRepository
-from app.models import ExamSchedule, Reservation
+from app.core.replica import replica_read
+from app.core.transaction import BaseRepository, AsyncBaseRepository
+from app.models import ExamSchedule, Reservation, WaitlistEntry
 from app.models.enums import ReservationStatus
+from app.schemas.reservation import ReservationFilter
+
+
+# 예약 생성에 필요한 컬럼만 읽는다. (start_time, end_time) 유니크 인덱스를 타고 예약 행은 건드리지 않는다.
+_SCHEDULE_LOOKUP_COLUMNS = load_only(
+    ExamSchedule.id,
+    ExamSchedule.start_time,
+    ExamSchedule.end_time,
+    ExamSchedule.max_seats,
+    ExamSchedule.confirmed_seats,
+)
+
+# 목록·내보내기 응답에 쓰는 컬럼. ReservationResponse 의 필드와 같은 이름·순서다
+RESERVATION_COLUMNS = (
+    Reservation.id,
+    Reservation.user_id,
+    Reservation.exam_id,
+    Reservation.status,
+    Reservation.requested_seats,
+    Reservation.created_at,
+    Reservation.updated_at,
+)
+
+
+def _insert_exam_schedule_stmt(dialect_name: str):
+    """같은 시간대 일정이 동시에 만들어져도 (start_time, end_time) 유니크 제약에 걸린 쪽은 조용히 무시한다."""
+    insert_stmt = sqlite.insert if dialect_name == "sqlite" else postgresql.insert
+    return insert_stmt(ExamSchedule).on_conflict_do_nothing(index_elements=["start_time", "end_time"])
+
+
+def _confirmed_seats_stmt(exam_id: int):
+    return select(ExamSchedule.confirmed_seats).where(ExamSchedule.id == exam_id)
+
+
+# 좌석 카운터 UPDATE 가 돌려주는 값. 갱신된 남은 좌석이며, 정원 초과로 갱신하지 못하면 행이 없다
+_AVAILABLE_SEATS = ExamSchedule.max_seats - ExamSchedule.confirmed_seats
+
+
+def _increment_confirmed_seats_stmt(exam_id: int, seats: int):
+    return (
+        update(ExamSchedule)
+        .where(
+            ExamSchedule.id == exam_id,
+            ExamSchedule.confirmed_seats + seats <= ExamSchedule.max_seats
+        )
+        .values(confirmed_seats=ExamSchedule.confirmed_seats + seats)
+        .returning(_AVAILABLE_SEATS)
+    )
+
+
+def _decrement_confirmed_seats_stmt(exam_id: int, seats: int):
+    return (
+        update(ExamSchedule)
+        .where(ExamSchedule.id == exam_id)
+        .values(confirmed_seats=ExamSchedule.confirmed_seats - seats)
+        .returning(_AVAILABLE_SEATS)
+    )
+
+
+def _has_waitlist_stmt(exam_id: int):
+    return select(WaitlistEntry.id).where(WaitlistEntry.exam_id == exam_id).limit(1)
+
+
+def _remove_from_waitlist_stmt(reservation_ids: Iterable[int]):
+    return delete(WaitlistEntry).where(WaitlistEntry.reservation_id.in_(list(reservation_ids)))
+
+
+def _waitlist_entry(reservation: Reservation) -> WaitlistEntry:
+    reservation.status = ReservationStatus.WAITLISTED
+    return WaitlistEntry(exam_id=reservation.exam_id, reservation_id=reservation.id)
+
+
+def _reservation_conditions(filters: ReservationFilter, user_id: Optional[int] = None) -> list:
+    conditions = []
+    if user_id is not None:
+        conditions.append(Reservation.user_id == user_id)
+    if filters.status is not None:
+        conditions.append(Reservation.status == filters.status)
+    if filters.exam_id is not None:
+        conditions.append(Reservation.exam_id == filters.exam_id)
+    if filters.created_from is not None:
+        conditions.append(Reservation.created_at >= filters.created_from)
+    if filters.created_to is not None:
+        conditions.append(Reservation.created_at < filters.created_to)
+    return conditions
+
+
+def _reservation_page_stmt(
+        filters: ReservationFilter,
+        after_id: Optional[int],
+        limit: int,
+        user_id: Optional[int] = None
+):
+    conditions = _reservation_conditions(filters, user_id)
+    if after_id is not None:
+        conditions.append(Reservation.id > after_id)
+
+    # 다음 페이지 존재 여부를 알기 위해 한 건 더 읽는다
+    return select(*RESERVATION_COLUMNS).where(*conditions).order_by(Reservation.id).limit(limit + 1)
+
+
+def _split_page(rows: Sequence[Row], limit: int) -> Tuple[Sequence[Row], Optional[int]]:
+    if len(rows) > limit:
+        return rows[:limit], rows[limit - 1].id
+    return rows, None
 
 
 class ReservationRepository(BaseRepository):
@@ -19,29 +126,236 @@ class ReservationRepository(BaseRepository):
                     ExamSchedule.end_time == end_time
                 )
             )
-            .options(joinedload(ExamSchedule.reservations))
+            .options(_SCHEDULE_LOOKUP_COLUMNS)
             .first()
         )
 
+    def get_or_create_exam_schedule(self, start_time: datetime, end_time: datetime) -> Tuple[ExamSchedule, bool]:
+        exam_schedule = self.find_exam_schedule(start_time, end_time)
+        if exam_schedule:
+            return exam_schedule, False
+
+        stmt = (
+            _insert_exam_schedule_stmt(self.db.get_bind().dialect.name)
+            .values(start_time=start_time, end_time=end_time)
+            .returning(ExamSchedule.id)
+        )
+        created = self.db.execute(stmt).scalar_one_or_none() is not None
+        return self.find_exam_schedule(start_time, end_time), created
+
+    def get_exam_schedule(self, exam_id: int) -> Optional[ExamSchedule]:
+        return self.db.get(ExamSchedule, exam_id)
+
+    def find_exam_schedules(self, time_slots: Iterable[Tuple[datetime, datetime]]) -> Sequence[ExamSchedule]:
+        stmt = (
+            select(ExamSchedule)
+            .where(tuple_(ExamSchedule.start_time, ExamSchedule.end_time).in_(list(time_slots)))
+            .options(_SCHEDULE_LOOKUP_COLUMNS)
+        )
+        return self.db.execute(stmt).scalars().all()
+
+    def insert_missing_exam_schedules(self, time_slots: Iterable[Tuple[datetime, datetime]]):
+        values = [{"start_time": start_time, "end_time": end_time} for start_time, end_time in time_slots]
+        self.db.execute(_insert_exam_schedule_stmt(self.db.get_bind().dialect.name), values)
+
     def get_confirmed_seats_count(self, exam_id: int) -> int:
-        return (
-                self.db.query(func.sum(Reservation.requested_seats))
-                .filter(
-                    Reservation.exam_id == exam_id,
-                    Reservation.status == ReservationStatus.CONFIRMED
-                )
-                .scalar() or 0
+        return self.db.execute(_confirmed_seats_stmt(exam_id)).scalar() or 0
+
+    def get_available_seats(self, exam_ids: Iterable[int]) -> Dict[int, int]:
+        stmt = (
+            select(ExamSchedule.id, ExamSchedule.max_seats - ExamSchedule.confirmed_seats)
+            .where(ExamSchedule.id.in_(list(exam_ids)))
         )
+        return {exam_id: available for exam_id, available in self.db.execute(stmt)}
 
-    def get_reservation_by_id(self, reservation_id: int) -> Optional[Reservation]:
-        return self.db.query(Reservation).get(reservation_id)
+    def increment_confirmed_seats(self, exam_id: int, seats: int) -> Optional[int]:
+        """정원을 넘지 않을 때만 확정 좌석 수를 올리고, 남은 좌석 수를 돌려준다. 정원 초과면 None."""
+        return self.db.execute(_increment_confirmed_seats_stmt(exam_id, seats)).scalar_one_or_none()
 
-    def get_all_reservations(self) -> list[Type[Reservation]]:
-        return self.db.query(Reservation).all()
+    def decrement_confirmed_seats(self, exam_id: int, seats: int) -> Optional[int]:
+        """확정 좌석 수를 내리고 남은 좌석 수를 돌려준다."""
+        return self.db.execute(_decrement_confirmed_seats_stmt(exam_id, seats)).scalar_one_or_none()
 
-    def get_user_reservations(self, user_id: int) -> list[Type[Reservation]]:
-        return (
-            self.db.query(Reservation)
-            .filter(Reservation.user_id == user_id)
-            .all()
-        )
\ No newline at end of file
+    def get_reservation_by_id(self, reservation_id: int, for_update: bool = False) -> Optional[Reservation]:
+        return self.db.get(Reservation, reservation_id, with_for_update=for_update)
+
+    def get_reservations_by_ids(self, reservation_ids: Iterable[int], for_update: bool = False) -> Sequence[Reservation]:
+        # 잠금 순서를 id 순으로 고정해 동시에 들어온 일괄 확정끼리 데드락이 나지 않게 한다
+        stmt = select(Reservation).where(Reservation.id.in_(list(reservation_ids))).order_by(Reservation.id)
+        if for_update:
+            stmt = stmt.with_for_update()
+        return self.db.execute(stmt).scalars().all()
+
+    def insert_reservations(self, values: list[dict]) -> Sequence[Reservation]:
+        """여러 예약을 한 번의 INSERT ... VALUES (...), (...) RETURNING 으로 넣는다."""
+        return self.db.scalars(insert(Reservation).returning(Reservation), values).all()
+
+    def insert_reservation_rows(self, values: list[dict]) -> Sequence[Row]:
+        """insert_reservations 와 같지만 ORM 객체 대신 RESERVATION_COLUMNS 행을 넣은 순서대로 돌려준다."""
+        stmt = insert(Reservation).returning(*RESERVATION_COLUMNS, sort_by_parameter_order=True)
+        return self.db.execute(stmt, values).all()
+
+    def mark_confirmed(self, reservation_ids: Iterable[int]):
+        stmt = (
+            update(Reservation)
+            .where(Reservation.id.in_(list(reservation_ids)))
+            .values(status=ReservationStatus.CONFIRMED)
+        )
+        self.db.execute(stmt)
+
+    def has_waitlist(self, exam_id: int) -> bool:
+        return self.db.execute(_has_waitlist_stmt(exam_id)).first() is not None
+
+    def add_to_waitlist(self, reservation: Reservation):
+        """예약을 WAITLISTED 로 바꾸고 일정 대기열의 맨 뒤에 넣는다."""
+        self.db.add(_waitlist_entry(reservation))
+
+    def remove_from_waitlist(self, reservation_ids: Iterable[int]):
+        self.db.execute(_remove_from_waitlist_stmt(reservation_ids))
+
+    def lock_available_seats(self, exam_id: int) -> Optional[int]:
+        """일정 행을 잠그고 남은 좌석 수를 돌려준다. 같은 일정의 대기열 승격이 동시에 돌지 않게 한다."""
+        stmt = (
+            select(ExamSchedule.max_seats - ExamSchedule.confirmed_seats)
+            .where(ExamSchedule.id == exam_id)
+            .with_for_update()
+        )
+        return self.db.execute(stmt).scalar_one_or_none()
+
+    def get_waitlist_head(self, exam_id: int, limit: int) -> Sequence[Row]:
+        """대기열 앞에서부터 (reservation_id, requested_seats) 를 limit 건 읽는다."""
+        stmt = (
+            select(WaitlistEntry.reservation_id, Reservation.requested_seats)
+            .join(Reservation, Reservation.id == WaitlistEntry.reservation_id)
+            .where(WaitlistEntry.exam_id == exam_id)
+            .order_by(WaitlistEntry.id)
+            .limit(limit)
+        )
+        return self.db.execute(stmt).all()
+
+    def get_waitlisted_exam_ids(self) -> Sequence[int]:
+        return self.db.execute(select(WaitlistEntry.exam_id).distinct()).scalars().all()
+
+    def get_stale_pending_ids(self, created_before: datetime, limit: int) -> Sequence[int]:
+        stmt = (
+            select(Reservation.id)
+            .where(Reservation.status == ReservationStatus.PENDING, Reservation.created_at < created_before)
+            .order_by(Reservation.created_at, Reservation.id)
+            .limit(limit)
+        )
+        return self.db.execute(stmt).scalars().all()
+
+    def cancel_pending(self, reservation_ids: Iterable[int]) -> int:
+        """아직 PENDING 인 예약만 CANCELLED 로 바꾼다. 그사이 확정·대기열에 들어간 예약은 건드리지 않는다."""
+        stmt = (
+            update(Reservation)
+            .where(Reservation.id.in_(list(reservation_ids)), Reservation.status == ReservationStatus.PENDING)
+            .values(status=ReservationStatus.CANCELLED)
+            .execution_options(synchronize_session=False)
+        )
+        return self.db.execute(stmt).rowcount
+
+    @replica_read
+    def get_all_reservations(
+            self,
+            filters: ReservationFilter,
+            after_id: Optional[int],
+            limit: int
+    ) -> Tuple[Sequence[Row], Optional[int]]:
+        rows = self.db.execute(_reservation_page_stmt(filters, after_id, limit)).all()
+        return _split_page(rows, limit)
+
+    @replica_read
+    def get_user_reservations(
+            self,
+            user_id: int,
+            filters: ReservationFilter,
+            after_id: Optional[int],
+            limit: int
+    ) -> Tuple[Sequence[Row], Optional[int]]:
+        stmt = _reservation_page_stmt(filters, after_id, limit, user_id=user_id)
+        rows = self.db.execute(stmt).all()
+        return _split_page(rows, limit)
+
+    def stream_reservation_rows(self, filters: ReservationFilter, batch_size: int) -> Iterator[Sequence[Row]]:
+        """서버 사이드 커서로 예약을 컬럼 튜플 묶음(batch_size 건) 단위로 읽는다. ORM 객체는 만들지 않는다."""
+        stmt = (
+            select(*RESERVATION_COLUMNS)
+            .where(*_reservation_conditions(filters))
+            .order_by(Reservation.id)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self.db.execute(stmt).partitions()
+
+
+class AsyncReservationRepository(AsyncBaseRepository):
+    async def find_exam_schedule(self, start_time: datetime, end_time: datetime) -> Optional[ExamSchedule]:
+        stmt = (
+            select(ExamSchedule)
+            .where(
+                ExamSchedule.start_time == start_time,
+                ExamSchedule.end_time == end_time
+            )
+            .options(_SCHEDULE_LOOKUP_COLUMNS)
+            .limit(1)
+        )
+        return (await self.db.execute(stmt)).scalars().first()
+
+    async def get_or_create_exam_schedule(self, start_time: datetime, end_time: datetime) -> Tuple[ExamSchedule, bool]:
+        exam_schedule = await self.find_exam_schedule(start_time, end_time)
+        if exam_schedule:
+            return exam_schedule, False
+
+        stmt = (
+            _insert_exam_schedule_stmt(self.db.get_bind().dialect.name)
+            .values(start_time=start_time, end_time=end_time)
+            .returning(ExamSchedule.id)
+        )
+        created = (await self.db.execute(stmt)).scalar_one_or_none() is not None
+        return await self.find_exam_schedule(start_time, end_time), created
+
+    async def get_exam_schedule(self, exam_id: int) -> Optional[ExamSchedule]:
+        return await self.db.get(ExamSchedule, exam_id)
+
+    async def get_confirmed_seats_count(self, exam_id: int) -> int:
+        return (await self.db.execute(_confirmed_seats_stmt(exam_id))).scalar() or 0
+
+    async def increment_confirmed_seats(self, exam_id: int, seats: int) -> Optional[int]:
+        return (await self.db.execute(_increment_confirmed_seats_stmt(exam_id, seats))).scalar_one_or_none()
+
+    async def decrement_confirmed_seats(self, exam_id: int, seats: int) -> Optional[int]:
+        return (await self.db.execute(_decrement_confirmed_seats_stmt(exam_id, seats))).scalar_one_or_none()
+
+    async def get_reservation_by_id(self, reservation_id: int, for_update: bool = False) -> Optional[Reservation]:
+        return await self.db.get(Reservation, reservation_id, with_for_update=for_update)
+
+    async def has_waitlist(self, exam_id: int) -> bool:
+        return (await self.db.execute(_has_waitlist_stmt(exam_id))).first() is not None
+
+    async def add_to_waitlist(self, reservation: Reservation):
+        self.db.add(_waitlist_entry(reservation))
+
+    async def remove_from_waitlist(self, reservation_ids: Iterable[int]):
+        await self.db.execute(_remove_from_waitlist_stmt(reservation_ids))
+
+    @replica_read
+    async def get_all_reservations(
+            self,
+            filters: ReservationFilter,
+            after_id: Optional[int],
+            limit: int
+    ) -> Tuple[Sequence[Row], Optional[int]]:
+        rows = (await self.db.execute(_reservation_page_stmt(filters, after_id, limit))).all()
+        return _split_page(rows, limit)
+
+    @replica_read
+    async def get_user_reservations(
+            self,
+            user_id: int,
+            filters: ReservationFilter,
+            after_id: Optional[int],
+            limit: int
+    ) -> Tuple[Sequence[Row], Optional[int]]:
+        stmt = _reservation_page_stmt(filters, after_id, limit, user_id=user_id)
+        rows = (await self.db.execute(stmt)).all()
+        return _split_page(rows, limit)
\ No newline at end of file
@@ -1,31 +1,117 @@
 # repository.py
 from datetime import datetime
-from typing import Sequence
+from typing import Iterable, Optional, Sequence
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session, contains_eager
+from sqlalchemy import and_, literal_column, select, update, func, Row
+from sqlalchemy.orm import Session
 
-from app.core.transaction import BaseRepository
+from app.core.replica import replica_read
+from app.core.transaction import BaseRepository, AsyncBaseRepository
 from app.models import ExamSchedule, Reservation
 from app.models.enums import ReservationStatus
 
 
+def _available_schedules_stmt(min_date: datetime):
+    return (
+        select(
+            ExamSchedule.id,
+            ExamSchedule.start_time,
+            ExamSchedule.end_time,
+            ExamSchedule.max_seats,
+            (ExamSchedule.max_seats - ExamSchedule.confirmed_seats).label("available_seats"),
+            ExamSchedule.created_at,
+            ExamSchedule.updated_at,
+        )
+        .where(ExamSchedule.start_time >= min_date)
+        .order_by(ExamSchedule.start_time)
+    )
+
+
+def _overlapping_schedules_stmt(
+        dialect_name: str,
+        start_time: datetime,
+        end_time: datetime,
+        min_seats: int,
+        min_date: datetime
+):
+    """[start_time, end_time) 와 겹치고 남은 좌석이 min_seats 이상인 예약 가능 일정."""
+    if dialect_name == "postgresql":
+        # ix_exam_schedules_time_range 와 같은 식이어야 GiST 인덱스를 탄다
+        overlaps = func.tsrange(ExamSchedule.start_time, ExamSchedule.end_time, literal_column("'[)'")).op("&&")(
+            func.tsrange(start_time, end_time, literal_column("'[)'"))
+        )
+    else:
+        overlaps = and_(ExamSchedule.start_time < end_time, ExamSchedule.end_time > start_time)
+    return _available_schedules_stmt(min_date).where(
+        overlaps,
+        ExamSchedule.max_seats - ExamSchedule.confirmed_seats >= min_seats,
+    )
+
+
 class ExamScheduleRepository(BaseRepository):
-    def find_available_schedules(self, min_date: datetime) -> Sequence[ExamSchedule]:
+    @replica_read
+    def find_available_schedules(self, min_date: datetime) -> Sequence[Row]:
+        return self.db.execute(_available_schedules_stmt(min_date)).all()
+
+    @replica_read
+    def find_overlapping_schedules(
+            self,
+            start_time: datetime,
+            end_time: datetime,
+            min_seats: int,
+            min_date: datetime
+    ) -> Sequence[Row]:
+        stmt = _overlapping_schedules_stmt(self.db.get_bind().dialect.name, start_time, end_time, min_seats, min_date)
+        return self.db.execute(stmt).all()
+
+    def lock_exam_schedule_ids(self, after_id: int, limit: int) -> Sequence[int]:
+        """
+        after_id 다음 일정 limit 개를 id 순으로 잠근다. 확정·삭제 트랜잭션은 카운터를 먼저 갱신하므로
+        잠근 뒤에 다시 센 합계는 커밋된 예약 상태와 어긋나지 않는다.
+        """
         stmt = (
-            select(ExamSchedule)
-            .options(contains_eager(ExamSchedule.reservations))
-            .join(ExamSchedule.reservations, isouter=True)
-            .filter(
-                ExamSchedule.start_time >= min_date,
+            select(ExamSchedule.id)
+            .where(ExamSchedule.id > after_id)
+            .order_by(ExamSchedule.id)
+            .limit(limit)
+            .with_for_update()
+        )
+        return self.db.execute(stmt).scalars().all()
+
+    def reconcile_confirmed_seats(self, exam_ids: Optional[Iterable[int]] = None) -> Sequence[int]:
+        """reservations 테이블 기준으로 확정 좌석 카운터를 다시 계산하고, 보정된 일정 id 를 돌려준다."""
+        confirmed = (
+            select(func.coalesce(func.sum(Reservation.requested_seats), 0))
+            .where(
+                Reservation.exam_id == ExamSchedule.id,
                 Reservation.status == ReservationStatus.CONFIRMED
             )
+            .scalar_subquery()
+        )
+        stmt = (
+            update(ExamSchedule)
+            .where(ExamSchedule.confirmed_seats != confirmed)
+            .values(confirmed_seats=confirmed)
+            .returning(ExamSchedule.id)
+            .execution_options(synchronize_session=False)
         )
-        return self.db.execute(stmt).unique().scalars().all()
-
-    def get_confirmed_seats_count(self, schedule: ExamSchedule) -> int:
-        return sum(
-            r.requested_seats
-            for r in schedule.reservations
-            if r.status == ReservationStatus.CONFIRMED
-        )
\ No newline at end of file
+        if exam_ids is not None:
+            stmt = stmt.where(ExamSchedule.id.in_(list(exam_ids)))
+        return self.db.execute(stmt).scalars().all()
+
+
+class AsyncExamScheduleRepository(AsyncBaseRepository):
+    @replica_read
+    async def find_available_schedules(self, min_date: datetime) -> Sequence[Row]:
+        return (await self.db.execute(_available_schedules_stmt(min_date))).all()
+
+    @replica_read
+    async def find_overlapping_schedules(
+            self,
+            start_time: datetime,
+            end_time: datetime,
+            min_seats: int,
+            min_date: datetime
+    ) -> Sequence[Row]:
+        stmt = _overlapping_schedules_stmt(self.db.get_bind().dialect.name, start_time, end_time, min_seats, min_date)
+        return (await self.db.execute(stmt)).all()
@@ -1,7 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from enum import Enum
+from typing import Optional, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.models.enums import ReservationStatus
 
 
 class ReservationResponse(BaseModel):
@@ -17,6 +20,18 @@ class ReservationResponse(BaseModel):
         from_attributes = True
 
 
+class ReservationPage(BaseModel):
+    items: List[ReservationResponse]
+    next_cursor: Optional[str] = None
+
+
+class ReservationFilter(BaseModel):
+    status: Optional[ReservationStatus] = None
+    exam_id: Optional[int] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+
 class ReservationUpdate(BaseModel):
     requested_seats: Optional[int] = None
     start_time: Optional[datetime] = None
@@ -40,3 +55,28 @@ class CreateReservationRequest(BaseModel):
     start_time: datetime
     end_time: datetime
     requested_seats: int
+
+
+class BulkPolicy(str, Enum):
+    PARTIAL = "partial"                  # 가능한 항목만 처리
+    ALL_OR_NOTHING = "all_or_nothing"    # 하나라도 실패하면 전체 롤백
+
+
+class BulkCreateReservationRequest(BaseModel):
+    items: List[CreateReservationRequest] = Field(min_length=1)
+
+
+class BulkConfirmReservationRequest(BaseModel):
+    reservation_ids: List[int] = Field(min_length=1)
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    success: bool
+    reservation: Optional[ReservationResponse] = None
+    detail: Optional[str] = None
+
+
+class BulkReservationResponse(BaseModel):
+    policy: BulkPolicy
+    results: List[BulkItemResult]
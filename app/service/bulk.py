@@ -0,0 +1,184 @@
+from collections import defaultdict
+from typing import List, Dict
+
+from fastapi import HTTPException
+
+from app.core.transaction import transactional
+from app.core.auth import Principal
+from app.models import Reservation
+from app.models.enums import UserRole, ReservationStatus
+from app.schemas.reservation import (
+    BulkItemResult,
+    BulkPolicy,
+    BulkReservationResponse,
+    CreateReservationRequest,
+    ReservationResponse,
+)
+from app.service.reservation import ReservationService
+
+WAITLISTED_DETAIL = "정원이 찼거나 대기 중인 예약이 있어 대기열에 등록했습니다. 좌석이 나면 순서대로 확정됩니다."
+
+
+class BulkReservationService(ReservationService):
+    """
+    여러 건의 예약 생성/확정을 한 트랜잭션에서 처리한다.
+    일정 조회와 좌석 확인은 일정 단위로 묶어 한 번씩만 질의한다.
+    """
+
+    @transactional(retryable=True)
+    def create_reservations(
+            self,
+            items: List[CreateReservationRequest],
+            current_user: Principal,
+            policy: BulkPolicy
+    ) -> BulkReservationResponse:
+        results: Dict[int, BulkItemResult] = {}
+        for index, item in enumerate(items):
+            try:
+                self._validate_reservation_date(item.start_time)
+                self._validate_time_slot(item.start_time, item.end_time)
+            except HTTPException as e:
+                results[index] = BulkItemResult(index=index, success=False, detail=e.detail)
+
+        time_slots = {(item.start_time, item.end_time) for index, item in enumerate(items) if index not in results}
+        schedules = {
+            (schedule.start_time, schedule.end_time): schedule
+            for schedule in self.repository.find_exam_schedules(time_slots)
+        } if time_slots else {}
+
+        missing_slots = time_slots - schedules.keys()
+        if missing_slots:
+            self.repository.insert_missing_exam_schedules(missing_slots)
+            for schedule in self.repository.find_exam_schedules(missing_slots):
+                schedules[(schedule.start_time, schedule.end_time)] = schedule
+            self._invalidate_available_schedules()
+
+        accepted = []
+        for index, item in enumerate(items):
+            if index in results:
+                continue
+            schedule = schedules[(item.start_time, item.end_time)]
+            try:
+                self._validate_available_seats(schedule, item.requested_seats)
+            except HTTPException as e:
+                results[index] = BulkItemResult(index=index, success=False, detail=e.detail)
+                continue
+            accepted.append((index, {
+                "user_id": current_user.id,
+                "exam_id": schedule.id,
+                "requested_seats": item.requested_seats,
+                "status": ReservationStatus.PENDING,
+            }))
+
+        self._abort_if_required(results, policy)
+
+        if accepted:
+            created = self.repository.insert_reservations([values for _, values in accepted])
+            for (index, _), reservation in zip(accepted, created):
+                results[index] = self._success(index, reservation)
+
+        return self._response(results, policy)
+
+    @transactional(retryable=True)
+    def confirm_reservations(
+            self,
+            reservation_ids: List[int],
+            current_user: Principal,
+            policy: BulkPolicy
+    ) -> BulkReservationResponse:
+        if current_user.role != UserRole.ADMIN:
+            raise HTTPException(status_code=403, detail="관리자만 예약을 확정할 수 있습니다.")
+
+        reservations = {r.id: r for r in self.repository.get_reservations_by_ids(set(reservation_ids), for_update=True)}
+        exam_ids = {r.exam_id for r in reservations.values()}
+        available_seats = self.repository.get_available_seats(exam_ids)
+        # 단건 확정과 같이, 앞선 대기 예약이 있는 일정의 예약은 좌석이 남아 있어도 대기열 뒤에 세운다
+        queued_exam_ids = {exam_id for exam_id in exam_ids if self.repository.has_waitlist(exam_id)}
+
+        results: Dict[int, BulkItemResult] = {}
+        admitted: Dict[int, List[int]] = defaultdict(list)
+        seen = set()
+        for index, reservation_id in enumerate(reservation_ids):
+            reservation = reservations.get(reservation_id)
+            if reservation is None:
+                results[index] = BulkItemResult(index=index, success=False, detail="예약을 찾을 수 없습니다.")
+            elif reservation_id in seen:
+                results[index] = BulkItemResult(index=index, success=False, detail="중복된 예약 ID입니다.")
+            elif reservation.status == ReservationStatus.CONFIRMED:
+                results[index] = self._success(index, reservation)
+            elif reservation.status == ReservationStatus.CANCELLED:
+                results[index] = BulkItemResult(
+                    index=index,
+                    success=False,
+                    detail="취소되었거나 만료된 예약은 확정할 수 없습니다."
+                )
+            elif reservation.status == ReservationStatus.WAITLISTED:
+                results[index] = BulkItemResult(
+                    index=index,
+                    success=False,
+                    detail="대기열에 있는 예약입니다. 좌석이 나면 순서대로 확정됩니다."
+                )
+            elif (
+                    reservation.exam_id in queued_exam_ids
+                    or reservation.requested_seats > available_seats[reservation.exam_id]
+            ):
+                # 단건 확정과 같이 정원이 차도 대기열에 넣는다. 배치의 뒤 예약도 좌석이 남든 말든 그 뒤에 선다
+                self.repository.add_to_waitlist(reservation)
+                queued_exam_ids.add(reservation.exam_id)
+                results[index] = BulkItemResult(index=index, success=False, detail=WAITLISTED_DETAIL)
+            else:
+                available_seats[reservation.exam_id] -= reservation.requested_seats
+                admitted[reservation.exam_id].append(index)
+            seen.add(reservation_id)
+
+        confirmed_ids = []
+        for exam_id, indexes in admitted.items():
+            seats = sum(reservations[reservation_ids[i]].requested_seats for i in indexes)
+            # 조회 이후 다른 트랜잭션이 좌석을 가져갔다면 이 일정의 예약은 모두 대기열에 넣는다
+            if self.repository.increment_confirmed_seats(exam_id, seats) is None:
+                for i in indexes:
+                    self.repository.add_to_waitlist(reservations[reservation_ids[i]])
+                    results[i] = BulkItemResult(index=i, success=False, detail=WAITLISTED_DETAIL)
+                queued_exam_ids.add(exam_id)
+                continue
+            confirmed_ids.extend(reservation_ids[i] for i in indexes)
+            self._publish_seats(exam_id)
+
+        self._abort_if_required(results, policy)
+
+        for exam_id in queued_exam_ids:
+            self._notify_waitlist(exam_id)
+
+        if confirmed_ids:
+            self.repository.mark_confirmed(confirmed_ids)
+            self._invalidate_available_schedules()
+            for exam_id, indexes in admitted.items():
+                for i in indexes:
+                    if i not in results:
+                        results[i] = self._success(i, reservations[reservation_ids[i]])
+
+        return self._response(results, policy)
+
+    @staticmethod
+    def _success(index: int, reservation: Reservation) -> BulkItemResult:
+        return BulkItemResult(
+            index=index,
+            success=True,
+            reservation=ReservationResponse.model_validate(reservation)
+        )
+
+    @staticmethod
+    def _abort_if_required(results: Dict[int, BulkItemResult], policy: BulkPolicy):
+        failures = [result for result in results.values() if not result.success]
+        if policy == BulkPolicy.ALL_OR_NOTHING and failures:
+            raise HTTPException(
+                status_code=400,
+                detail=[failure.model_dump(mode="json") for failure in sorted(failures, key=lambda r: r.index)]
+            )
+
+    @staticmethod
+    def _response(results: Dict[int, BulkItemResult], policy: BulkPolicy) -> BulkReservationResponse:
+        return BulkReservationResponse(
+            policy=policy,
+            results=[results[index] for index in sorted(results)]
+        )
\ No newline at end of file
@@ -0,0 +1,68 @@
+import csv
+import io
+from enum import Enum
+from typing import Iterator, Sequence
+
+import orjson
+from sqlalchemy import Row
+
+from app.core.database import SessionLocal
+from app.repository.reservation import ReservationRepository
+from app.schemas.reservation import ReservationFilter
+
+EXPORT_FIELDS = ("id", "user_id", "exam_id", "status", "requested_seats", "created_at", "updated_at")
+EXPORT_BATCH_SIZE = 1000
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        return "application/x-ndjson" if self is ExportFormat.NDJSON else "text/csv"
+
+
+def _to_values(row: Row) -> tuple:
+    reservation_id, user_id, exam_id, status, requested_seats, created_at, updated_at = row
+    return (
+        reservation_id,
+        user_id,
+        exam_id,
+        status.value,
+        requested_seats,
+        created_at.isoformat() if created_at else None,
+        updated_at.isoformat() if updated_at else None,
+    )
+
+
+def _encode_ndjson(rows: Sequence[Row]) -> bytes:
+    return b"".join(orjson.dumps(dict(zip(EXPORT_FIELDS, row)), option=orjson.OPT_APPEND_NEWLINE) for row in rows)
+
+
+def _encode_csv(rows: Sequence[tuple]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+
+def _encode_csv_rows(rows: Sequence[Row]) -> bytes:
+    return _encode_csv([_to_values(row) for row in rows])
+
+
+def stream_reservations(filters: ReservationFilter, export_format: ExportFormat) -> Iterator[bytes]:
+    """
+    예약 전체를 묶음 단위로 인코딩해 흘려보낸다.
+    요청 스코프 세션은 응답 스트리밍 전에 닫히므로, 스트림이 끝날 때까지 쓸 세션을 직접 연다.
+    """
+    if export_format is ExportFormat.CSV:
+        yield _encode_csv([EXPORT_FIELDS])
+
+    encode = _encode_csv_rows if export_format is ExportFormat.CSV else _encode_ndjson
+    db = SessionLocal()
+    try:
+        repository = ReservationRepository(db)
+        for rows in repository.stream_reservation_rows(filters, EXPORT_BATCH_SIZE):
+            yield encode(rows)
+    finally:
+        db.close()
\ No newline at end of file
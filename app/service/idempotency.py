@@ -0,0 +1,233 @@
+import asyncio
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional
+
+from fastapi import HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.serialization import json_response
+from app.core.transaction import transaction_context
+from app.repository.idempotency import IdempotencyRepository
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+# 같은 키의 앞선 요청이 끝나기를 기다릴 때 확인 간격
+_POLL_SECONDS = 0.02
+_MAX_POLL_SECONDS = 0.5
+
+
+@dataclass(frozen=True)
+class IdempotencyRecord:
+    fingerprint: str
+    status_code: Optional[int] = None
+    body: Optional[bytes] = None
+
+    @property
+    def completed(self) -> bool:
+        return self.status_code is not None
+
+
+class IdempotencyStore:
+    """
+    Idempotency-Key 저장소. claim 은 원자적이어야 한다: 같은 키로 동시에 불러도 한 호출만 None 을 받는다.
+    blocking=True 인 저장소는 이벤트 루프에서 직접 부르지 않고 스레드풀로 넘긴다.
+    """
+    blocking = False
+
+    def claim(self, key: str, fingerprint: str, lock_ttl: float) -> Optional[IdempotencyRecord]:
+        """키를 처음 보면 처리 중으로 표시하고 None, 이미 있으면 기존 기록을 돌려준다."""
+        raise NotImplementedError
+
+    def complete(self, key: str, record: IdempotencyRecord, ttl: float):
+        raise NotImplementedError
+
+    def release(self, key: str):
+        """처리에 실패한 키를 풀어 재시도가 다시 처리되게 한다."""
+        raise NotImplementedError
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """프로세스 로컬 LRU. 인스턴스가 하나일 때 DB 를 거치지 않고 재시도를 걸러 낸다."""
+
+    def __init__(self, max_entries: int):
+        self._records: TTLCache[str, IdempotencyRecord] = TTLCache(max_entries, ttl=0)
+        self._lock = threading.Lock()
+
+    def claim(self, key: str, fingerprint: str, lock_ttl: float) -> Optional[IdempotencyRecord]:
+        with self._lock:
+            record = self._records.get(key)
+            if record is None:
+                self._records.set(key, IdempotencyRecord(fingerprint), lock_ttl)
+            return record
+
+    def complete(self, key: str, record: IdempotencyRecord, ttl: float):
+        self._records.set(key, record, ttl)
+
+    def release(self, key: str):
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None and not record.completed:
+                self._records.delete(key)
+
+
+class DatabaseIdempotencyStore(IdempotencyStore):
+    """
+    idempotency_keys 테이블. 인스턴스가 여러 개여도 같은 키는 한 번만 처리된다. 연산마다 짧은 트랜잭션을 쓴다.
+    만료 시각은 서버 시간대와 상관없도록 UTC 로 쓴다.
+    """
+    blocking = True
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        self._session_factory = session_factory
+
+    def claim(self, key: str, fingerprint: str, lock_ttl: float) -> Optional[IdempotencyRecord]:
+        now = datetime.now(timezone.utc)
+        with self._session_factory() as db, transaction_context(db):
+            repository = IdempotencyRepository(db)
+            # 재시도는 대부분 이미 있는 키이므로 읽기 한 번으로 끝낸다
+            row = repository.get(key, now)
+            if row is None or row.expired:
+                if repository.claim(key, fingerprint, now, now + timedelta(seconds=lock_ttl)):
+                    return None
+                row = repository.get(key, now)
+        # 앞선 요청이 그사이 실패해 키가 풀렸다면 처리 중으로 보고 다음 확인 때 다시 선점한다
+        return IdempotencyRecord(row.fingerprint, row.status_code, row.response_body) if row else IdempotencyRecord(fingerprint)
+
+    def complete(self, key: str, record: IdempotencyRecord, ttl: float):
+        with self._session_factory() as db, transaction_context(db):
+            IdempotencyRepository(db).complete(
+                key, record.status_code, record.body, datetime.now(timezone.utc) + timedelta(seconds=ttl)
+            )
+
+    def release(self, key: str):
+        with self._session_factory() as db, transaction_context(db):
+            IdempotencyRepository(db).release(key)
+
+
+_store: Optional[IdempotencyStore] = None
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    global _store
+    if _store is None:
+        if settings.IDEMPOTENCY_BACKEND == "db":
+            _store = DatabaseIdempotencyStore()
+        else:
+            _store = MemoryIdempotencyStore(settings.IDEMPOTENCY_MAX_ENTRIES)
+    return _store
+
+
+def use_idempotency_store(store: IdempotencyStore):
+    global _store
+    _store = store
+
+
+def request_fingerprint(request: BaseModel) -> str:
+    """같은 키로 다른 내용을 보냈는지 가리기 위한 요청 본문 해시."""
+    return hashlib.blake2b(request.model_dump_json().encode(), digest_size=16).hexdigest()
+
+
+def _scoped_key(key: str, scope: str) -> str:
+    if not key or len(key) > MAX_KEY_LENGTH:
+        raise HTTPException(status_code=400, detail=f"{IDEMPOTENCY_HEADER} 는 1~{MAX_KEY_LENGTH}자여야 합니다.")
+    return f"{scope}:{key}"
+
+
+def _replay(record: IdempotencyRecord, fingerprint: str) -> Optional[Response]:
+    if record.fingerprint != fingerprint:
+        raise HTTPException(
+            status_code=422,
+            detail=f"같은 {IDEMPOTENCY_HEADER} 로 다른 요청을 보냈습니다. 새 요청에는 새 키를 사용하세요."
+        )
+    if not record.completed:
+        return None
+    response = json_response(record.body, status_code=record.status_code)
+    response.headers[REPLAYED_HEADER] = "true"
+    return response
+
+
+def _in_progress() -> HTTPException:
+    return HTTPException(status_code=409, detail=f"같은 {IDEMPOTENCY_HEADER} 의 요청을 처리하고 있습니다. 잠시 후 다시 시도하세요.")
+
+
+def idempotent_response(key: str, scope: str, fingerprint: str, compute: Callable[[], bytes]) -> Response:
+    """
+    scope(사용자·엔드포인트) 안에서 key 로 처음 들어온 요청만 compute 를 실행하고 결과 JSON 을 저장한다.
+    재시도는 저장된 응답을 그대로 돌려주고, 앞선 요청이 처리 중이면 IDEMPOTENCY_WAIT_SECONDS 까지 기다린다.
+    compute 가 예외(4xx 포함)를 던지면 트랜잭션이 롤백되어 한 일이 없으므로 결과를 남기지 않고 키를 푼다.
+    좌석 부족처럼 상태에 따라 달라지는 거절은 재시도 때 다시 판단한다.
+    """
+    store = get_idempotency_store()
+    scoped = _scoped_key(key, scope)
+    deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+    delay = _POLL_SECONDS
+    while True:
+        record = store.claim(scoped, fingerprint, settings.IDEMPOTENCY_LOCK_SECONDS)
+        if record is None:
+            break
+        replay = _replay(record, fingerprint)
+        if replay is not None:
+            return replay
+        if time.monotonic() >= deadline:
+            raise _in_progress()
+        time.sleep(delay)
+        delay = min(delay * 2, _MAX_POLL_SECONDS)
+
+    try:
+        body = compute()
+    except BaseException:
+        store.release(scoped)
+        raise
+    store.complete(scoped, IdempotencyRecord(fingerprint, 200, body), settings.IDEMPOTENCY_TTL_SECONDS)
+    return json_response(body)
+
+
+async def _call(store: IdempotencyStore, func: Callable, *args):
+    if store.blocking:
+        return await run_in_threadpool(func, *args)
+    return func(*args)
+
+
+async def idempotent_response_async(
+        key: str,
+        scope: str,
+        fingerprint: str,
+        compute: Callable[[], Awaitable[bytes]]
+) -> Response:
+    """idempotent_response 의 비동기 판. 저장소 입출력이 이벤트 루프를 막지 않는다."""
+    store = get_idempotency_store()
+    scoped = _scoped_key(key, scope)
+    deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+    delay = _POLL_SECONDS
+    while True:
+        record = await _call(store, store.claim, scoped, fingerprint, settings.IDEMPOTENCY_LOCK_SECONDS)
+        if record is None:
+            break
+        replay = _replay(record, fingerprint)
+        if replay is not None:
+            return replay
+        if time.monotonic() >= deadline:
+            raise _in_progress()
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, _MAX_POLL_SECONDS)
+
+    try:
+        body = await compute()
+    except BaseException:
+        await _call(store, store.release, scoped)
+        raise
+    await _call(
+        store, store.complete, scoped, IdempotencyRecord(fingerprint, 200, body), settings.IDEMPOTENCY_TTL_SECONDS
+    )
+    return json_response(body)
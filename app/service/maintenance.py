@@ -0,0 +1,59 @@
+from datetime import datetime
+from typing import Optional, Sequence, Tuple
+
+from app.core.cache import schedule_cache, AVAILABLE_SCHEDULES_CACHE_KEY
+from app.core.locks import try_advisory_xact_lock
+from app.core.transaction import transactional, on_commit
+from app.repository.reservation import ReservationRepository
+from app.repository.schedule import ExamScheduleRepository
+from app.service.seat_feed import seat_feed
+from app.worker.waitlist import waitlist_worker
+
+EXPIRE_PENDING_LOCK = "jobs:expire_pending_reservations"
+RECONCILE_SEATS_LOCK = "jobs:reconcile_confirmed_seats"
+
+
+class PendingExpiryService:
+    def __init__(self, repository: ReservationRepository):
+        self.repository = repository
+
+    @transactional(retryable=True)
+    def expire_batch(self, created_before: datetime, batch_size: int) -> Optional[int]:
+        """
+        created_before 이전에 만든 PENDING 예약을 batch_size 건까지 CANCELLED 로 바꾸고 바꾼 건수를 돌려준다.
+        다른 인스턴스가 같은 작업을 돌리고 있으면 None.
+        """
+        if not try_advisory_xact_lock(self.repository.db, EXPIRE_PENDING_LOCK):
+            return None
+        reservation_ids = self.repository.get_stale_pending_ids(created_before, batch_size)
+        if not reservation_ids:
+            return 0
+        return self.repository.cancel_pending(reservation_ids)
+
+
+class SeatReconcileService:
+    def __init__(self, repository: ExamScheduleRepository):
+        self.repository = repository
+
+    @transactional(retryable=True)
+    def reconcile_batch(self, after_id: int, batch_size: int) -> Optional[Tuple[Sequence[int], Optional[int]]]:
+        """
+        after_id 다음 일정 batch_size 개의 확정 좌석 카운터를 다시 맞춘다.
+        (보정한 일정 id, 다음 배치의 after_id — 마지막 배치면 None)을 돌려주고,
+        다른 인스턴스가 같은 작업을 돌리고 있으면 None.
+        """
+        if not try_advisory_xact_lock(self.repository.db, RECONCILE_SEATS_LOCK):
+            return None
+        exam_ids = self.repository.lock_exam_schedule_ids(after_id, batch_size)
+        if not exam_ids:
+            return [], None
+
+        corrected = self.repository.reconcile_confirmed_seats(exam_ids)
+        if corrected:
+            on_commit(self.repository.db, lambda: schedule_cache.invalidate(AVAILABLE_SCHEDULES_CACHE_KEY))
+            for exam_id in corrected:
+                # 카운터가 줄어든 일정은 대기 예약이 들어갈 수 있다
+                on_commit(self.repository.db, lambda exam_id=exam_id: waitlist_worker.notify(exam_id))
+                # 구독자가 보던 남은 좌석도 보정된 값으로 다시 발행한다
+                on_commit(self.repository.db, lambda exam_id=exam_id: seat_feed.notify(exam_id))
+        return corrected, exam_ids[-1] if len(exam_ids) == batch_size else None
@@ -1,93 +1,357 @@
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
 from fastapi import HTTPException
 
-from app.core.transaction import transactional
-from app.models import User, ExamSchedule, Reservation
+from app.core.cache import schedule_cache, AVAILABLE_SCHEDULES_CACHE_KEY
+from app.core.transaction import transactional, async_transactional, on_commit
+from app.core.auth import Principal
+from app.models import ExamSchedule, Reservation
 from app.models.enums import UserRole, ReservationStatus
-from app.repository.reservation import ReservationRepository
+from app.repository.reservation import ReservationRepository, AsyncReservationRepository
 from app.schemas.reservation import ReservationUpdate, CreateReservationRequest
+from app.service.seat_feed import seat_feed
+from app.worker.waitlist import waitlist_worker
+
+# 예약 가능 일정 조회(ExamScheduleService)와 같은 기준: 시험 시작 3일 전까지만 예약/변경할 수 있다
+RESERVATION_DEADLINE = timedelta(days=3)
+
+
+# 아래 함수들은 DB 를 읽거나 쓰지 않는 판단만 담는다. 동기·비동기 서비스는 같은 함수를 부르고 저장소 호출만 다르다.
+
+def _new_reservation(
+        exam_schedule: ExamSchedule,
+        request: CreateReservationRequest,
+        current_user: Principal
+) -> Reservation:
+    return Reservation(
+        user_id=current_user.id,
+        exam_id=exam_schedule.id,
+        requested_seats=request.requested_seats,
+        status=ReservationStatus.PENDING
+    )
+
+
+def _check_can_confirm(current_user: Principal):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="관리자만 예약을 확정할 수 있습니다.")
+
+
+def _needs_confirmation(reservation: Reservation) -> bool:
+    """이미 확정됐거나 대기 중이면 False (그대로 돌려준다). 취소된 예약이면 400."""
+    if reservation.status in (ReservationStatus.CONFIRMED, ReservationStatus.WAITLISTED):
+        return False
+    if reservation.status == ReservationStatus.CANCELLED:
+        raise HTTPException(status_code=400, detail="취소되었거나 만료된 예약은 확정할 수 없습니다.")
+    return True
+
+
+def _check_can_modify(reservation: Reservation, current_user: Principal, action: str):
+    """action 은 "변경" 또는 "삭제". 관리자가 아니면 자기 예약만, 확정되지 않은 것만 바꿀 수 있다."""
+    is_admin = current_user.role == UserRole.ADMIN
+    if not is_admin and reservation.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail=f"다른 사용자의 예약을 {action}할 수 없습니다.")
+    if not is_admin and reservation.status == ReservationStatus.CONFIRMED:
+        raise HTTPException(status_code=400, detail=f"확정된 예약은 {action}할 수 없습니다.")
+
+
+def _updated_time_slot(update_data: ReservationUpdate, current_schedule: ExamSchedule) -> Tuple[datetime, datetime]:
+    return update_data.start_time or current_schedule.start_time, update_data.end_time or current_schedule.end_time
+
+
+def _found_or_404(reservation: Optional[Reservation]) -> Reservation:
+    if not reservation:
+        raise HTTPException(status_code=404, detail="예약을 찾을 수 없습니다.")
+    return reservation
+
+
+def _seats_moved(reservation: Reservation, previous_exam_id: int, previous_seats: int) -> bool:
+    return reservation.exam_id != previous_exam_id or reservation.requested_seats != previous_seats
+
+
+def _check_seats_moved(reservation: Reservation, available_seats: Optional[int]):
+    """확정 예약을 옮긴 뒤 새 일정의 increment_confirmed_seats 결과가 None 이면 정원을 넘은 것이다."""
+    if available_seats is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"예약인원 최대치를 초과했습니다. 요청인원: {reservation.requested_seats}"
+        )
 
 
 class ReservationService:
     def __init__(self, repository: ReservationRepository):
         self.repository = repository
 
-    @transactional
-    def create_reservation(self, request: CreateReservationRequest, current_user: User) -> Reservation:
-        exam_schedule = self.repository.find_exam_schedule(
+    @transactional(retryable=True)
+    def create_reservation(self, request: CreateReservationRequest, current_user: Principal) -> Reservation:
+        self._validate_time_slot(request.start_time, request.end_time)
+        exam_schedule, created = self.repository.get_or_create_exam_schedule(
             request.start_time,
             request.end_time
         )
+        self._check_schedule_for_booking(exam_schedule, created, request.requested_seats)
+        return self.repository.save(_new_reservation(exam_schedule, request, current_user))
 
-        if not exam_schedule:
-            exam_schedule = ExamSchedule(
-                start_time=request.start_time,
-                end_time=request.end_time
-            )
-            self.repository.save(exam_schedule)
+    @transactional(retryable=True)
+    def confirm_reservation(self, reservation_id: int, current_user: Principal) -> Reservation:
+        _check_can_confirm(current_user)
+        reservation = self._get_reservation_or_404(reservation_id)
+        if not _needs_confirmation(reservation):
+            return reservation
 
-        self._validate_reservation_date(exam_schedule.start_time)
-        self._validate_available_seats(exam_schedule, request.requested_seats)
+        # 앞선 대기 예약이 있으면 좌석이 남아 있어도 새치기하지 않고 대기열 뒤에 선다
+        available_seats = None
+        if not self.repository.has_waitlist(reservation.exam_id):
+            available_seats = self.repository.increment_confirmed_seats(reservation.exam_id, reservation.requested_seats)
+        if available_seats is None:
+            self.repository.add_to_waitlist(reservation)
+        self._record_confirmation(reservation, confirmed=available_seats is not None)
+        return self.repository.save(reservation)
 
-        new_reservation = Reservation(
-            user_id=current_user.id,
-            exam_id=exam_schedule.id,
-            requested_seats=request.requested_seats,
-            status=ReservationStatus.PENDING
-        )
+    @transactional(retryable=True)
+    def update_reservation(
+            self,
+            reservation_id: int,
+            update_data: ReservationUpdate,
+            current_user: Principal
+    ) -> Reservation:
+        reservation = self._get_reservation_or_404(reservation_id)
+        _check_can_modify(reservation, current_user, "변경")
+
+        previous_exam_id = reservation.exam_id
+        previous_seats = reservation.requested_seats
+
+        if update_data.start_time:
+            self._validate_reservation_date(update_data.start_time)
+
+        if update_data.start_time or update_data.end_time:
+            current_schedule = self.repository.get_exam_schedule(reservation.exam_id)
+            start_time, end_time = _updated_time_slot(update_data, current_schedule)
+            self._validate_time_slot(start_time, end_time)
+            exam_schedule, created = self.repository.get_or_create_exam_schedule(start_time, end_time)
+            self._move_to_schedule(reservation, exam_schedule, created)
 
-        return self.repository.save(new_reservation)
+        if update_data.requested_seats:
+            reservation.requested_seats = update_data.requested_seats
 
-    @transactional
-    def confirm_reservation(self, reservation_id: int, current_user: User) -> Reservation:
-        if current_user.role != UserRole.ADMIN:
-            raise HTTPException(status_code=403, detail="관리자만 예약을 확정할 수 있습니다.")
+        if reservation.status == ReservationStatus.CONFIRMED:
+            self._move_confirmed_seats(reservation, previous_exam_id, previous_seats)
+        elif reservation.status == ReservationStatus.WAITLISTED:
+            self._move_waitlist_entry(reservation, previous_exam_id, previous_seats)
 
+        return self.repository.save(reservation)
+
+    @transactional(retryable=True)
+    def delete_reservation(self, reservation_id: int, current_user: Principal):
         reservation = self._get_reservation_or_404(reservation_id)
-        total_confirmed_seats = self.repository.get_confirmed_seats_count(reservation.exam_id)
+        _check_can_modify(reservation, current_user, "삭제")
+
+        if reservation.status == ReservationStatus.CONFIRMED:
+            self.repository.decrement_confirmed_seats(reservation.exam_id, reservation.requested_seats)
+        elif reservation.status == ReservationStatus.WAITLISTED:
+            self.repository.remove_from_waitlist([reservation.id])
+        self._record_release(reservation)
+
+        self.repository.delete(reservation)
 
-        if total_confirmed_seats + reservation.requested_seats > reservation.exam_schedule.max_seats:
+    def _move_confirmed_seats(self, reservation: Reservation, previous_exam_id: int, previous_seats: int):
+        if not _seats_moved(reservation, previous_exam_id, previous_seats):
+            return
+
+        self.repository.decrement_confirmed_seats(previous_exam_id, previous_seats)
+        available_seats = self.repository.increment_confirmed_seats(
+            reservation.exam_id,
+            reservation.requested_seats
+        )
+        _check_seats_moved(reservation, available_seats)
+        self._record_confirmed_move(reservation, previous_exam_id)
+
+    def _move_waitlist_entry(self, reservation: Reservation, previous_exam_id: int, previous_seats: int):
+        if reservation.exam_id != previous_exam_id:
+            # 다른 일정으로 옮긴 대기 예약은 그 일정 대기열의 맨 뒤에 다시 선다
+            self.repository.remove_from_waitlist([reservation.id])
+            self.repository.add_to_waitlist(reservation)
+        self._record_waitlist_move(reservation, previous_exam_id, previous_seats)
+
+    def _get_reservation_or_404(self, reservation_id: int) -> Reservation:
+        # 상태/좌석 변경 전에 예약 행을 잠가 같은 예약을 동시에 확정·수정해 좌석이 이중으로 반영되지 않게 한다
+        reservation = self.repository.get_reservation_by_id(reservation_id, for_update=True)
+        return _found_or_404(reservation)
+
+    # 아래 메서드는 DB 를 읽거나 쓰지 않는다. 판단과 커밋 뒤 알림(on_commit)만 하므로 비동기 서비스도 그대로 쓴다
+
+    def _check_schedule_for_booking(self, exam_schedule: ExamSchedule, created: bool, requested_seats: int):
+        if created:
+            self._invalidate_available_schedules()
+        self._validate_reservation_date(exam_schedule.start_time)
+        self._validate_available_seats(exam_schedule, requested_seats)
+
+    def _move_to_schedule(self, reservation: Reservation, exam_schedule: ExamSchedule, created: bool):
+        if created:
+            self._invalidate_available_schedules()
+        reservation.exam_id = exam_schedule.id
+
+    def _record_confirmation(self, reservation: Reservation, confirmed: bool):
+        if not confirmed:
+            self._notify_waitlist(reservation.exam_id)
+            return
+        reservation.status = ReservationStatus.CONFIRMED
+        self._invalidate_available_schedules()
+        self._publish_seats(reservation.exam_id)
+
+    def _record_release(self, reservation: Reservation):
+        """확정·대기 예약을 지운 뒤. 좌석이 나거나 대기열 맨 앞이 빠지면 뒤 예약이 들어갈 수 있다."""
+        if reservation.status == ReservationStatus.CONFIRMED:
+            self._invalidate_available_schedules()
+            self._publish_seats(reservation.exam_id)
+            self._notify_waitlist(reservation.exam_id)
+        elif reservation.status == ReservationStatus.WAITLISTED:
+            self._notify_waitlist(reservation.exam_id)
+
+    def _record_confirmed_move(self, reservation: Reservation, previous_exam_id: int):
+        self._invalidate_available_schedules()
+        self._publish_seats(previous_exam_id)
+        self._publish_seats(reservation.exam_id)
+        self._notify_waitlist(previous_exam_id)
+
+    def _record_waitlist_move(self, reservation: Reservation, previous_exam_id: int, previous_seats: int):
+        if reservation.exam_id != previous_exam_id:
+            self._notify_waitlist(previous_exam_id)
+            self._notify_waitlist(reservation.exam_id)
+        elif reservation.requested_seats < previous_seats:
+            self._notify_waitlist(reservation.exam_id)
+
+    def _validate_reservation_date(self, start_time: datetime):
+        if start_time < datetime.now() + RESERVATION_DEADLINE:
+            raise HTTPException(status_code=400, detail="예약은 시험 시작 3일 전까지만 가능합니다.")
+
+    def _validate_time_slot(self, start_time: datetime, end_time: datetime):
+        if end_time <= start_time:
+            raise HTTPException(status_code=400, detail="종료 시각은 시작 시각보다 커야합니다.")
+
+    def _validate_available_seats(self, exam_schedule: ExamSchedule, requested_seats: int):
+        self._validate_seats_left(exam_schedule.max_seats - exam_schedule.confirmed_seats, requested_seats)
+
+    def _validate_seats_left(self, available_seats: int, requested_seats: int):
+        if requested_seats > available_seats:
             raise HTTPException(
                 status_code=400,
-                detail=f"예약인원 최대치를 초과했습니다. 현재 확정인원: {total_confirmed_seats}, 요청인원: {reservation.requested_seats}"
+                detail=f"충분한 자리가 없습니다. 남은 좌석: {available_seats}, 요청인원: {requested_seats}"
             )
 
-        reservation.status = ReservationStatus.CONFIRMED
-        return self.repository.save(reservation)
+    def _invalidate_available_schedules(self):
+        on_commit(self.repository.db, lambda: schedule_cache.invalidate(AVAILABLE_SCHEDULES_CACHE_KEY))
 
-    @transactional
-    def update_reservation(
+    def _notify_waitlist(self, exam_id: int):
+        """커밋된 뒤에 대기열 워커를 깨운다. 롤백되면 알리지 않는다."""
+        on_commit(self.repository.db, lambda: waitlist_worker.notify(exam_id))
+
+    def _publish_seats(self, exam_id: int):
+        """커밋된 뒤에 남은 좌석 피드에 알린다. 값은 피드가 커밋된 DB 에서 다시 읽으므로 커밋 순서가 뒤바뀌어도 최신 값이 남는다."""
+        on_commit(self.repository.db, lambda: seat_feed.notify(exam_id))
+
+
+class AsyncReservationService(ReservationService):
+    """
+    AsyncSession 기반 예약 서비스. 판단·검증·커밋 뒤 알림은 ReservationService 의 것을 그대로 쓰고,
+    저장소를 await 하는 흐름만 따로 둔다.
+    """
+
+    def __init__(self, repository: AsyncReservationRepository):
+        self.repository = repository
+
+    @async_transactional(retryable=True)
+    async def create_reservation(self, request: CreateReservationRequest, current_user: Principal) -> Reservation:
+        self._validate_time_slot(request.start_time, request.end_time)
+        exam_schedule, created = await self.repository.get_or_create_exam_schedule(
+            request.start_time,
+            request.end_time
+        )
+        self._check_schedule_for_booking(exam_schedule, created, request.requested_seats)
+        return await self.repository.save(_new_reservation(exam_schedule, request, current_user))
+
+    @async_transactional(retryable=True)
+    async def confirm_reservation(self, reservation_id: int, current_user: Principal) -> Reservation:
+        _check_can_confirm(current_user)
+        reservation = await self._get_reservation_or_404(reservation_id)
+        if not _needs_confirmation(reservation):
+            return reservation
+
+        available_seats = None
+        if not await self.repository.has_waitlist(reservation.exam_id):
+            available_seats = await self.repository.increment_confirmed_seats(
+                reservation.exam_id,
+                reservation.requested_seats
+            )
+        if available_seats is None:
+            await self.repository.add_to_waitlist(reservation)
+        self._record_confirmation(reservation, confirmed=available_seats is not None)
+        return await self.repository.save(reservation)
+
+    @async_transactional(retryable=True)
+    async def update_reservation(
             self,
             reservation_id: int,
             update_data: ReservationUpdate,
-            current_user: User
+            current_user: Principal
     ) -> Reservation:
-        reservation = self._get_reservation_or_404(reservation_id)
-
-        if not self._can_modify_reservation(reservation, current_user):
-            raise HTTPException(status_code=403, detail="다른 사용자의 예약을 변경할 수 없습니다.")
+        reservation = await self._get_reservation_or_404(reservation_id)
+        _check_can_modify(reservation, current_user, "변경")
 
-        if self._is_confirmed_and_not_admin(reservation, current_user):
-            raise HTTPException(status_code=400, detail="확정된 예약은 변경할 수 없습니다.")
+        previous_exam_id = reservation.exam_id
+        previous_seats = reservation.requested_seats
 
         if update_data.start_time:
             self._validate_reservation_date(update_data.start_time)
 
         if update_data.start_time or update_data.end_time:
-            self._update_schedule(reservation, update_data, current_user)
+            current_schedule = await self.repository.get_exam_schedule(reservation.exam_id)
+            start_time, end_time = _updated_time_slot(update_data, current_schedule)
+            self._validate_time_slot(start_time, end_time)
+            exam_schedule, created = await self.repository.get_or_create_exam_schedule(start_time, end_time)
+            self._move_to_schedule(reservation, exam_schedule, created)
 
         if update_data.requested_seats:
             reservation.requested_seats = update_data.requested_seats
 
-        return self.repository.save(reservation)
+        if reservation.status == ReservationStatus.CONFIRMED:
+            await self._move_confirmed_seats(reservation, previous_exam_id, previous_seats)
+        elif reservation.status == ReservationStatus.WAITLISTED:
+            await self._move_waitlist_entry(reservation, previous_exam_id, previous_seats)
 
-    @transactional
-    def delete_reservation(self, reservation_id: int, current_user: User):
-        reservation = self._get_reservation_or_404(reservation_id)
+        return await self.repository.save(reservation)
 
-        if not self._can_modify_reservation(reservation, current_user):
-            raise HTTPException(status_code=403, detail="다른 사용자의 예약을 삭제할 수 없습니다.")
+    @async_transactional(retryable=True)
+    async def delete_reservation(self, reservation_id: int, current_user: Principal):
+        reservation = await self._get_reservation_or_404(reservation_id)
+        _check_can_modify(reservation, current_user, "삭제")
 
-        if self._is_confirmed_and_not_admin(reservation, current_user):
-            raise HTTPException(status_code=400, detail="확정된 예약은 삭제할 수 없습니다.")
+        if reservation.status == ReservationStatus.CONFIRMED:
+            await self.repository.decrement_confirmed_seats(reservation.exam_id, reservation.requested_seats)
+        elif reservation.status == ReservationStatus.WAITLISTED:
+            await self.repository.remove_from_waitlist([reservation.id])
+        self._record_release(reservation)
 
-        self.repository.delete(reservation)
+        await self.repository.delete(reservation)
+
+    async def _move_confirmed_seats(self, reservation: Reservation, previous_exam_id: int, previous_seats: int):
+        if not _seats_moved(reservation, previous_exam_id, previous_seats):
+            return
+
+        await self.repository.decrement_confirmed_seats(previous_exam_id, previous_seats)
+        available_seats = await self.repository.increment_confirmed_seats(
+            reservation.exam_id,
+            reservation.requested_seats
+        )
+        _check_seats_moved(reservation, available_seats)
+        self._record_confirmed_move(reservation, previous_exam_id)
+
+    async def _move_waitlist_entry(self, reservation: Reservation, previous_exam_id: int, previous_seats: int):
+        if reservation.exam_id != previous_exam_id:
+            await self.repository.remove_from_waitlist([reservation.id])
+            await self.repository.add_to_waitlist(reservation)
+        self._record_waitlist_move(reservation, previous_exam_id, previous_seats)
+
+    async def _get_reservation_or_404(self, reservation_id: int) -> Reservation:
+        reservation = await self.repository.get_reservation_by_id(reservation_id, for_update=True)
+        return _found_or_404(reservation)
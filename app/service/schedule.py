@@ -1,22 +1,121 @@
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+import orjson
+from fastapi import HTTPException
+from sqlalchemy import Row
+
+from app.core.cache import schedule_cache, CachedResponse, AVAILABLE_SCHEDULES_CACHE_KEY
+from app.core.config import settings
+from app.core.interval import IntervalTree
+from app.core.serialization import encode_json, encode_rows
+from app.repository.schedule import ExamScheduleRepository, AsyncExamScheduleRepository
+from app.service.reservation import RESERVATION_DEADLINE
+
+
+def encode_available_schedules(schedules: Sequence[Row]) -> bytes:
+    """AvailableExamScheduleResponse 목록과 같은 JSON. 행은 _available_schedules_stmt 의 컬럼 Row 다."""
+    return encode_rows(schedules)
+
+
+def _min_available_date() -> datetime:
+    """예약 가능 일정은 지금부터 예약 마감(시험 시작 3일 전)이 지나지 않은 일정이다."""
+    return datetime.now() + RESERVATION_DEADLINE
+
+
+def _to_schedule_time(value: datetime) -> datetime:
+    """일정 시각은 앱 서버 시간대의 naive 값으로 저장된다. 시간대가 붙은 입력(Z, +09:00)은 그 시간대로 바꿔 비교한다."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+def _validate_search_window(start_time: datetime, end_time: datetime) -> Tuple[datetime, datetime]:
+    start_time, end_time = _to_schedule_time(start_time), _to_schedule_time(end_time)
+    if end_time <= start_time:
+        raise HTTPException(status_code=400, detail="종료 시각은 시작 시각보다 커야합니다.")
+    return start_time, end_time
+
+
+class ScheduleSearchIndex:
+    """
+    예약 가능 일정 응답(캐시된 JSON)으로 만든 구간 트리. 응답의 ETag 가 바뀔 때만 다시 만들므로
+    일정 캐시와 같은 시점에 무효화되고, 공유 캐시 백엔드를 쓰면 다른 프로세스의 무효화도 따라간다.
+    """
+
+    def __init__(self):
+        self._current: Optional[Tuple[str, IntervalTree[dict]]] = None
+        self._lock = threading.Lock()
+
+    def _tree(self, cached: CachedResponse) -> IntervalTree[dict]:
+        current = self._current
+        if current is not None and current[0] == cached.etag:
+            return current[1]
+        with self._lock:
+            current = self._current
+            if current is None or current[0] != cached.etag:
+                schedules = orjson.loads(cached.body)
+                tree = IntervalTree(
+                    (
+                        datetime.fromisoformat(schedule["start_time"]),
+                        datetime.fromisoformat(schedule["end_time"]),
+                        schedule,
+                    )
+                    for schedule in schedules
+                )
+                current = self._current = (cached.etag, tree)
+        return current[1]
+
+    def search(self, cached: CachedResponse, start_time: datetime, end_time: datetime, min_seats: int) -> bytes:
+        schedules: List[dict] = [
+            schedule for schedule in self._tree(cached).overlapping(start_time, end_time)
+            if schedule["available_seats"] >= min_seats
+        ]
+        return encode_json(schedules)
+
+
+schedule_search_index = ScheduleSearchIndex()
 
-from app.core.transaction import transactional
-from app.repository.schedule import ExamScheduleRepository
-from app.schemas.schedule import AvailableExamScheduleResponse
 
 class ExamScheduleService:
     def __init__(self, repository: ExamScheduleRepository):
         self.repository = repository
 
-    @transactional
-    def get_available_schedules(self) -> list[AvailableExamScheduleResponse]:
-        min_available_date = datetime.now() + timedelta(days=3)
-        schedules = self.repository.find_available_schedules(min_available_date)
+    def get_available_schedules(self) -> Sequence[Row]:
+        return self.repository.find_available_schedules(_min_available_date())
 
-        return [
-            AvailableExamScheduleResponse(
-                **schedule.__dict__,
-                available_seats=schedule.max_seats - self.repository.get_confirmed_seats_count(schedule)
+    def search_available_schedules(self, start_time: datetime, end_time: datetime, min_seats: int) -> bytes:
+        """[start_time, end_time) 와 겹치고 남은 좌석이 min_seats 이상인 예약 가능 일정 JSON."""
+        start_time, end_time = _validate_search_window(start_time, end_time)
+        if settings.SCHEDULE_SEARCH_INDEX_ENABLED:
+            cached = schedule_cache.get_or_set(
+                AVAILABLE_SCHEDULES_CACHE_KEY,
+                lambda: encode_available_schedules(self.get_available_schedules())
             )
-            for schedule in schedules
-        ]
+            return schedule_search_index.search(cached, start_time, end_time, min_seats)
+
+        schedules = self.repository.find_overlapping_schedules(start_time, end_time, min_seats, _min_available_date())
+        return encode_available_schedules(schedules)
+
+
+class AsyncExamScheduleService(ExamScheduleService):
+    def __init__(self, repository: AsyncExamScheduleRepository):
+        self.repository = repository
+
+    async def get_available_schedules(self) -> Sequence[Row]:
+        return await self.repository.find_available_schedules(_min_available_date())
+
+    async def search_available_schedules(self, start_time: datetime, end_time: datetime, min_seats: int) -> bytes:
+        start_time, end_time = _validate_search_window(start_time, end_time)
+        if settings.SCHEDULE_SEARCH_INDEX_ENABLED:
+            async def compute() -> bytes:
+                return encode_available_schedules(await self.get_available_schedules())
+
+            cached = await schedule_cache.get_or_set_async(AVAILABLE_SCHEDULES_CACHE_KEY, compute)
+            return schedule_search_index.search(cached, start_time, end_time, min_seats)
+
+        schedules = await self.repository.find_overlapping_schedules(
+            start_time, end_time, min_seats, _min_available_date()
+        )
+        return encode_available_schedules(schedules)
@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, Collection, Dict, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.instrumentation import metrics_registry
+from app.core.serialization import encode_json
+from app.repository.reservation import ReservationRepository
+
+logger = logging.getLogger("app.seat_feed")
+
+# 브라우저 EventSource 가 연결이 끊긴 뒤 다시 붙기 전에 기다리는 시간(ms)
+_RETRY = b"retry: 3000\n\n"
+_KEEP_ALIVE = b": keep-alive\n\n"
+# 남은 좌석을 읽지 못했을 때 다시 읽기까지 기다리는 시간(초)
+_READ_RETRY_SECONDS = 1.0
+
+
+def _event(name: str, event_id: int, data: bytes) -> bytes:
+    return b"event: " + name.encode() + b"\nid: " + str(event_id).encode() + b"\ndata: " + data + b"\n\n"
+
+
+class SeatFeed:
+    """
+    일정별 남은 좌석 변경을 SSE 구독자에게 나눠 주는 프로세스 내 허브.
+    변경은 구독자마다 큐에 쌓지 않고 허브의 로그 하나에 일정마다 최신 값 하나로 둔다(버전 순).
+    구독자는 마지막으로 보낸 버전 이후의 변경만 읽으므로 발행 비용은 구독자 수와 상관없고,
+    느린 구독자는 밀린 변경 대신 최신 값만 받는다. 쉬는 구독자는 코루틴 하나와 버전 하나만 차지한다.
+    값은 커밋한 쪽이 넘기지 않고 읽기 스레드 하나가 커밋된 DB 에서 다시 읽는다. 커밋 콜백이 늦게 불려도
+    앞서 읽은 값보다 오래된 값을 발행하지 않는다.
+    """
+
+    def __init__(self, max_entries: int, read: Callable[[Collection[int]], Dict[int, int]]):
+        self.max_entries = max_entries
+        self.reads = 0
+        self.published = 0
+        self.sent = 0
+        self.subscribers = 0
+        self._version = 0
+        # 잊은 변경 중 가장 큰 버전. 이보다 앞에서 이어 받으려는 구독자는 목록을 다시 읽어야 한다
+        self._floor = 0
+        self._log: "OrderedDict[int, Tuple[int, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._changed: Optional[asyncio.Event] = None
+        self._wake_scheduled = False
+        self._closed = False
+        self._read = read
+        # 남은 좌석을 다시 읽어야 하는 일정. 읽기 스레드는 처음 notify 할 때 띄운다
+        self._stale: Set[int] = set()
+        self._stale_added = threading.Condition(self._lock)
+        self._reader: Optional[threading.Thread] = None
+
+    def notify(self, exam_id: int):
+        """남은 좌석이 바뀐 일정을 알린다. 커밋된 뒤에 부르며, 읽기 스레드가 모아서 한 번에 읽어 발행한다."""
+        with self._lock:
+            self._stale.add(exam_id)
+            self._stale_added.notify()
+            if self._reader is None and not self._closed:
+                self._reader = threading.Thread(target=self._read_stale, name="seat-feed-reader", daemon=True)
+                self._reader.start()
+
+    def _read_stale(self):
+        while True:
+            with self._lock:
+                while not self._stale and not self._closed:
+                    self._stale_added.wait()
+                if self._closed:
+                    self._reader = None
+                    return
+                exam_ids, self._stale = self._stale, set()
+            try:
+                available = self._read(exam_ids)
+            except Exception:
+                logger.exception("남은 좌석을 읽지 못했습니다. %s초 뒤 다시 읽습니다.", _READ_RETRY_SECONDS)
+                with self._lock:
+                    self._stale |= exam_ids
+                time.sleep(_READ_RETRY_SECONDS)
+                continue
+            self.reads += 1
+            for exam_id, available_seats in available.items():
+                self.publish(exam_id, available_seats)
+
+    def publish(self, exam_id: int, available_seats: int):
+        """남은 좌석을 로그에 남기고 구독자를 깨운다. 읽기 스레드에서 부른다."""
+        with self._lock:
+            self._version += 1
+            self._log[exam_id] = (self._version, available_seats)
+            self._log.move_to_end(exam_id)
+            while len(self._log) > self.max_entries:
+                _, (self._floor, _) = self._log.popitem(last=False)
+            self.published += 1
+            loop = self._loop
+            # 구독자를 깨우는 콜백은 다음 루프 차례까지 한 번만 건다. 그 사이의 발행은 함께 읽힌다
+            if loop is None or self._wake_scheduled:
+                return
+            self._wake_scheduled = True
+        try:
+            loop.call_soon_threadsafe(self._wake)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫혔다. 그 루프의 구독자도 함께 끝났다
+            with self._lock:
+                self._wake_scheduled = False
+
+    def close(self):
+        """열린 스트림을 모두 끝낸다. 종료할 때 부른다."""
+        self._closed = True
+        with self._lock:
+            self._stale_added.notify()
+            changed = self._changed
+        if changed is not None:
+            changed.set()
+
+    def _wake(self):
+        with self._lock:
+            self._wake_scheduled = False
+            changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def _current_event(self) -> asyncio.Event:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._loop is not loop:
+                self._loop = loop
+                self._changed = asyncio.Event()
+                self._wake_scheduled = False
+            return self._changed
+
+    def _resume_from(self, last_event_id: Optional[str]) -> Optional[int]:
+        """이어 보낼 버전. 이어 받을 수 없는 Last-Event-ID(다른 프로세스, 재시작, 잊은 변경)면 None."""
+        with self._lock:
+            version, floor = self._version, self._floor
+        if last_event_id is None:
+            return version
+        try:
+            seen = int(last_event_id)
+        except ValueError:
+            return None
+        return seen if floor <= seen <= version else None
+
+    def _changes_since(self, seen: int, exam_ids: Optional[Collection[int]]) -> Tuple[List[dict], int, bool]:
+        """(seen 이후 바뀐 일정의 최신 남은 좌석, 현재 버전, 이어 받을 수 없어 다시 읽어야 하는지)."""
+        with self._lock:
+            if seen < self._floor:
+                return [], self._version, True
+            changes = []
+            for exam_id, (version, available_seats) in reversed(self._log.items()):
+                if version <= seen:
+                    break
+                if exam_ids is None or exam_id in exam_ids:
+                    changes.append({"exam_id": exam_id, "available_seats": available_seats})
+            changes.reverse()
+            return changes, self._version, False
+
+    def stream(self, last_event_id: Optional[str], exam_ids: Optional[Collection[int]]) -> AsyncIterator[bytes]:
+        """
+        SSE 본문. seats 이벤트는 [{"exam_id", "available_seats"}] 를, reset 이벤트는 이어 보낼 수 없으니
+        예약 가능 일정을 다시 읽으라는 뜻이다. 이벤트 id 는 재연결 때 Last-Event-ID 로 돌아온다.
+        어디서부터 보낼지는 첫 바이트를 보낼 때가 아니라 요청을 받은 지금 정한다.
+        """
+        return self._stream(self._resume_from(last_event_id), exam_ids)
+
+    async def _stream(self, seen: Optional[int], exam_ids: Optional[Collection[int]]) -> AsyncIterator[bytes]:
+        self.subscribers += 1
+        try:
+            yield _RETRY
+            if seen is None:
+                seen = self._version
+                yield _event("reset", seen, b"{}")
+            while not self._closed:
+                changed = self._current_event()
+                changes, version, reset = self._changes_since(seen, exam_ids)
+                seen = version
+                if reset:
+                    yield _event("reset", seen, b"{}")
+                    continue
+                if changes:
+                    self.sent += 1
+                    yield _event("seats", seen, encode_json(changes))
+                    # 한 연결에 너무 자주 보내지 않는다. 그동안의 변경은 일정별 최신 값으로 합쳐진다
+                    await asyncio.sleep(settings.SEAT_FEED_MIN_INTERVAL_SECONDS)
+                    continue
+                try:
+                    await asyncio.wait_for(changed.wait(), settings.SEAT_FEED_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield _KEEP_ALIVE
+        finally:
+            self.subscribers -= 1
+
+
+def _read_available_seats(exam_ids: Collection[int]) -> Dict[int, int]:
+    # 복제본이 아니라 primary 에서 읽는다. 방금 커밋된 변경이 보여야 한다
+    with SessionLocal() as db:
+        return ReservationRepository(db).get_available_seats(exam_ids)
+
+
+seat_feed = SeatFeed(settings.SEAT_FEED_MAX_ENTRIES, _read_available_seats)
+
+
+def _seat_feed_metrics() -> List[str]:
+    series = (
+        ("seat_feed_subscribers", "gauge", "남은 좌석 피드 구독 연결 수", seat_feed.subscribers),
+        ("seat_feed_published_total", "counter", "피드에 발행한 남은 좌석 변경 수", seat_feed.published),
+        ("seat_feed_reads_total", "counter", "바뀐 일정의 남은 좌석을 DB 에서 다시 읽은 횟수", seat_feed.reads),
+        ("seat_feed_events_total", "counter", "구독자에게 보낸 seats 이벤트 수", seat_feed.sent),
+    )
+    lines = []
+    for name, kind, help_text, value in series:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"{name} {value}")
+    return lines
+
+
+metrics_registry.register_collector(_seat_feed_metrics)
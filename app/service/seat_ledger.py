@@ -0,0 +1,296 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from fastapi import HTTPException
+from sqlalchemy import Row
+
+from app.core.auth import Principal
+from app.core.cache import CacheBackend, LRUCacheBackend
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.instrumentation import metrics_registry
+from app.core.replica import mark_recent_write
+from app.core.transaction import transactional, on_commit
+from app.models import ExamSchedule
+from app.models.enums import ReservationStatus
+from app.repository.reservation import ReservationRepository
+from app.schemas.reservation import CreateReservationRequest
+from app.service.reservation import ReservationService, AsyncReservationService
+from app.worker.batch_writer import BatchWriter, QueueFull
+
+
+@dataclass(frozen=True)
+class LedgerEntry:
+    exam_id: int
+    available_seats: int
+
+
+@dataclass(frozen=True)
+class PendingBooking:
+    user_id: int
+    exam_id: int
+    start_time: datetime
+    end_time: datetime
+    requested_seats: int
+
+
+class SeatLedger:
+    """
+    일정(시작·종료 시각)별 남은 좌석. 예약 생성 요청을 DB 를 거치지 않고 받아들이거나 거절하는 데 쓴다.
+    값은 CacheBackend 에 두므로 공유 저장소로 바꾸면 여러 프로세스가 같은 원장을 본다.
+    기준은 언제나 DB 이며, 항목은 TTL 이 지나거나 예약 기록기가 배치를 쓸 때 DB 값으로 다시 맞춰진다.
+    빈 항목은 일정마다 한 요청만 DB 에서 읽어 채우고, 그동안 같은 일정으로 들어온 요청은 그 결과를 기다린다.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._loading: Dict[str, Future] = {}
+        self._loading_lock = threading.Lock()
+
+    def use_backend(self, backend: CacheBackend):
+        self.backend = backend
+
+    @staticmethod
+    def _key(start_time: datetime, end_time: datetime) -> str:
+        return f"seat-ledger:{start_time.isoformat()}/{end_time.isoformat()}"
+
+    def _peek(self, key: str) -> Optional[LedgerEntry]:
+        value = self.backend.get(key)
+        if value is None:
+            return None
+        exam_id, available_seats = value.split(b":")
+        return LedgerEntry(int(exam_id), int(available_seats))
+
+    def get(self, start_time: datetime, end_time: datetime) -> Optional[LedgerEntry]:
+        entry = self._peek(self._key(start_time, end_time))
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def put(self, start_time: datetime, end_time: datetime, entry: LedgerEntry):
+        value = f"{entry.exam_id}:{entry.available_seats}".encode()
+        self.backend.set(self._key(start_time, end_time), value, self.ttl)
+
+    def _claim(self, key: str) -> Tuple[Future, bool]:
+        """key 를 채우는 중인 Future 와, 이 호출이 직접 채워야 하는지를 돌려준다."""
+        with self._loading_lock:
+            future = self._loading.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            # 실행 중으로 표시해 두면 기다리던 쪽이 취소돼도 Future 자체는 취소되지 않는다
+            future.set_running_or_notify_cancel()
+            self._loading[key] = future
+            return future, True
+
+    def _settle(self, key: str, future: Future, entry: Optional[LedgerEntry]):
+        with self._loading_lock:
+            del self._loading[key]
+        future.set_result(entry)
+
+    def load(
+            self,
+            start_time: datetime,
+            end_time: datetime,
+            read: Callable[[], Optional[LedgerEntry]]
+    ) -> Optional[LedgerEntry]:
+        """
+        원장에 없는 일정을 read 로 DB 에서 읽어 채운다. 같은 일정을 이미 읽는 중이면 그 결과를 기다린다.
+        일정이 없거나 먼저 읽던 요청이 실패하면 None 이다.
+        """
+        key = self._key(start_time, end_time)
+        future, leader = self._claim(key)
+        if not leader:
+            return future.result()
+        entry = None
+        try:
+            # 앞선 요청이 방금 채웠을 수 있다
+            entry = self._peek(key) or read()
+        finally:
+            self._settle(key, future, entry)
+        return entry
+
+    async def load_async(
+            self,
+            start_time: datetime,
+            end_time: datetime,
+            read: Callable[[], Awaitable[Optional[LedgerEntry]]]
+    ) -> Optional[LedgerEntry]:
+        """load 의 비동기 버전. 기다리는 동안 이벤트 루프를 막지 않는다."""
+        key = self._key(start_time, end_time)
+        future, leader = self._claim(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+        entry = None
+        try:
+            entry = self._peek(key) or await read()
+        finally:
+            self._settle(key, future, entry)
+        return entry
+
+
+seat_ledger = SeatLedger(LRUCacheBackend(settings.SEAT_LEDGER_MAX_ENTRIES), ttl=settings.SEAT_LEDGER_TTL_SECONDS)
+
+
+def _write_bookings(bookings: List[PendingBooking]) -> Sequence[Union[Row, Exception]]:
+    with SessionLocal() as db:
+        return SeatLedgerService(ReservationRepository(db)).write(bookings)
+
+
+# 받아들인 예약 생성 요청을 모아 쓰는 기록기. 요청은 자기 예약이 커밋될 때까지 기다린다
+reservation_writer: BatchWriter[PendingBooking, Row] = BatchWriter(
+    "reservation-writer",
+    _write_bookings,
+    batch_size=settings.SEAT_LEDGER_BATCH_SIZE,
+    max_pending=settings.SEAT_LEDGER_MAX_PENDING,
+    linger=settings.SEAT_LEDGER_LINGER_SECONDS,
+)
+
+
+def _overloaded() -> HTTPException:
+    return HTTPException(status_code=503, detail="예약 요청이 몰려 처리하지 못했습니다. 잠시 후 다시 시도해 주세요.")
+
+
+def _remember(exam_schedule: ExamSchedule) -> LedgerEntry:
+    entry = LedgerEntry(exam_schedule.id, exam_schedule.max_seats - exam_schedule.confirmed_seats)
+    seat_ledger.put(exam_schedule.start_time, exam_schedule.end_time, entry)
+    return entry
+
+
+def _submit(entry: LedgerEntry, request: CreateReservationRequest, current_user: Principal) -> Future:
+    """받아들인 요청을 예약 기록기에 넘긴다. 기록기 대기열이 가득 차 있으면 503."""
+    booking = PendingBooking(
+        user_id=current_user.id,
+        exam_id=entry.exam_id,
+        start_time=request.start_time,
+        end_time=request.end_time,
+        requested_seats=request.requested_seats,
+    )
+    try:
+        return reservation_writer.submit(booking)
+    except QueueFull:
+        raise _overloaded()
+
+
+class SeatLedgerService(ReservationService):
+    """
+    SEAT_LEDGER_ENABLED 일 때의 예약 생성. 남은 좌석은 seat_ledger 로 바로 판단해 모자라면 DB 를 거치지 않고 거절하고,
+    받아들인 요청은 reservation_writer 가 다른 요청과 묶어 한 트랜잭션으로 쓴다. 응답은 커밋된 뒤에 나간다.
+    """
+
+    def create_reservation(self, request: CreateReservationRequest, current_user: Principal) -> Row:
+        self._validate_time_slot(request.start_time, request.end_time)
+        self._validate_reservation_date(request.start_time)
+
+        entry = seat_ledger.get(request.start_time, request.end_time)
+        if entry is None:
+            entry = seat_ledger.load(request.start_time, request.end_time, lambda: self._read_ledger_entry(request))
+            if entry is None:
+                # 일정을 새로 만들어야 하는 요청은 기존 경로로 처리한다
+                return super().create_reservation(request, current_user)
+        self._validate_seats_left(entry.available_seats, request.requested_seats)
+
+        reservation = _submit(entry, request, current_user).result()
+        mark_recent_write()
+        return reservation
+
+    def _read_ledger_entry(self, request: CreateReservationRequest) -> Optional[LedgerEntry]:
+        exam_schedule = self.repository.find_exam_schedule(request.start_time, request.end_time)
+        return _remember(exam_schedule) if exam_schedule is not None else None
+
+    @transactional(retryable=True)
+    def write(self, bookings: List[PendingBooking]) -> List[Union[Row, Exception]]:
+        """
+        모은 예약 생성 요청을 한 트랜잭션에서 쓴다. 남은 좌석을 DB 값으로 다시 확인해 모자란 요청만 거절하고
+        나머지는 INSERT 한 번으로 넣는다. 요청과 같은 순서로 예약 행이나 예외를 돌려준다.
+        """
+        available = self.repository.get_available_seats({booking.exam_id for booking in bookings})
+        results: List[Union[Row, Exception, None]] = []
+        accepted = []
+        for index, booking in enumerate(bookings):
+            try:
+                self._validate_seats_left(available.get(booking.exam_id, 0), booking.requested_seats)
+            except HTTPException as e:
+                results.append(e)
+                continue
+            results.append(None)
+            accepted.append(index)
+
+        if accepted:
+            rows = self.repository.insert_reservation_rows([
+                {
+                    "user_id": bookings[index].user_id,
+                    "exam_id": bookings[index].exam_id,
+                    "requested_seats": bookings[index].requested_seats,
+                    "status": ReservationStatus.PENDING,
+                }
+                for index in accepted
+            ])
+            for index, row in zip(accepted, rows):
+                results[index] = row
+
+        on_commit(self.repository.db, lambda: self._refresh_ledger(bookings, available))
+        return results
+
+    @staticmethod
+    def _refresh_ledger(bookings: List[PendingBooking], available: Dict[int, int]):
+        slots: Dict[int, Tuple[datetime, datetime]] = {
+            booking.exam_id: (booking.start_time, booking.end_time) for booking in bookings
+        }
+        for exam_id, (start_time, end_time) in slots.items():
+            if exam_id in available:
+                seat_ledger.put(start_time, end_time, LedgerEntry(exam_id, available[exam_id]))
+
+
+class AsyncSeatLedgerService(AsyncReservationService):
+    """AsyncSession 기반 SeatLedgerService. 쓰기는 같은 reservation_writer 를 쓰고 결과를 이벤트 루프에서 기다린다."""
+
+    async def create_reservation(self, request: CreateReservationRequest, current_user: Principal) -> Row:
+        self._validate_time_slot(request.start_time, request.end_time)
+        self._validate_reservation_date(request.start_time)
+
+        entry = seat_ledger.get(request.start_time, request.end_time)
+        if entry is None:
+            entry = await seat_ledger.load_async(
+                request.start_time, request.end_time, lambda: self._read_ledger_entry(request)
+            )
+            if entry is None:
+                return await super().create_reservation(request, current_user)
+        self._validate_seats_left(entry.available_seats, request.requested_seats)
+
+        reservation = await asyncio.wrap_future(_submit(entry, request, current_user))
+        mark_recent_write()
+        return reservation
+
+    async def _read_ledger_entry(self, request: CreateReservationRequest) -> Optional[LedgerEntry]:
+        exam_schedule = await self.repository.find_exam_schedule(request.start_time, request.end_time)
+        return _remember(exam_schedule) if exam_schedule is not None else None
+
+
+def _seat_ledger_metrics() -> List[str]:
+    series = (
+        ("seat_ledger_hits_total", "counter", "원장으로 좌석을 판단한 예약 생성 요청 수", seat_ledger.hits),
+        ("seat_ledger_misses_total", "counter", "원장에 없어 DB 에서 일정을 읽은 요청 수", seat_ledger.misses),
+        ("reservation_writer_batches_total", "counter", "예약 기록기가 커밋한 배치 수", reservation_writer.batches),
+        ("reservation_writer_items_total", "counter", "예약 기록기가 처리한 요청 수", reservation_writer.items),
+        ("reservation_writer_failures_total", "counter", "예약 기록기가 쓰지 못한 요청 수", reservation_writer.failures),
+        ("reservation_writer_pending", "gauge", "쓰기를 기다리는 예약 생성 요청 수", reservation_writer.pending),
+    )
+    lines = []
+    for name, kind, help_text, value in series:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"{name} {value}")
+    return lines
+
+
+metrics_registry.register_collector(_seat_ledger_metrics)
@@ -0,0 +1,41 @@
+from typing import Tuple
+
+from app.core.cache import schedule_cache, AVAILABLE_SCHEDULES_CACHE_KEY
+from app.core.transaction import transactional, on_commit
+from app.repository.reservation import ReservationRepository
+from app.service.seat_feed import seat_feed
+
+
+class WaitlistService:
+    def __init__(self, repository: ReservationRepository):
+        self.repository = repository
+
+    @transactional(retryable=True)
+    def promote(self, exam_id: int, batch_size: int) -> Tuple[int, bool]:
+        """
+        대기열 앞에서부터 남은 좌석에 들어가는 만큼 확정한다. 맨 앞 예약이 들어가지 않으면
+        뒤의 작은 예약이 먼저 확정되지 않도록 거기서 멈춘다(FIFO).
+        (확정한 건수, 같은 일정에 이어서 확정할 예약이 더 있을 수 있는지)를 돌려준다.
+        """
+        available_seats = self.repository.lock_available_seats(exam_id)
+        if available_seats is None or available_seats <= 0:
+            return 0, False
+
+        head = self.repository.get_waitlist_head(exam_id, batch_size)
+        admitted, seats = [], 0
+        for reservation_id, requested_seats in head:
+            if seats + requested_seats > available_seats:
+                break
+            admitted.append(reservation_id)
+            seats += requested_seats
+        if not admitted:
+            return 0, False
+
+        # 일정 행을 잠근 상태라 실패하지 않지만, 정원 검사는 언제나 카운터 UPDATE 에 맡긴다
+        if self.repository.increment_confirmed_seats(exam_id, seats) is None:
+            return 0, False
+        self.repository.mark_confirmed(admitted)
+        self.repository.remove_from_waitlist(admitted)
+        on_commit(self.repository.db, lambda: schedule_cache.invalidate(AVAILABLE_SCHEDULES_CACHE_KEY))
+        on_commit(self.repository.db, lambda: seat_feed.notify(exam_id))
+        return len(admitted), len(admitted) == batch_size
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Generic, List, Optional, Sequence, Tuple, TypeVar, Union
+
+logger = logging.getLogger("app.batch_writer")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class QueueFull(Exception):
+    pass
+
+
+class BatchWriter(Generic[T, R]):
+    """
+    submit 으로 받은 항목을 전용 스레드 하나가 모아 write(items) 한 번으로 쓴다. 앞 배치를 쓰는 동안 쌓인 항목이
+    다음 배치가 되므로 요청이 몰릴수록 배치가 커진다. write 는 항목마다 결과나 예외를 같은 순서로 돌려준다.
+    스레드는 처음 submit 할 때 띄운다.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            write: Callable[[List[T]], Sequence[Union[R, Exception]]],
+            batch_size: int,
+            max_pending: int,
+            linger: float = 0.0
+    ):
+        self.name = name
+        self.batch_size = batch_size
+        self.linger = linger
+        self.batches = 0
+        self.items = 0
+        self.failures = 0
+        self._write = write
+        self._queue: "queue.Queue[Optional[Tuple[T, Future]]]" = queue.Queue(max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, item: T) -> Future:
+        """항목을 다음 배치에 넣고 결과를 받을 Future 를 돌려준다. 대기열이 가득 차 있으면 QueueFull."""
+        self._ensure_started()
+        future: Future = Future()
+        try:
+            self._queue.put_nowait((item, future))
+        except queue.Full:
+            raise QueueFull(self.name)
+        return future
+
+    async def stop(self):
+        """이미 받은 항목을 모두 쓴 뒤 스레드를 멈춘다."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        await asyncio.to_thread(self._queue.put, None)
+        await asyncio.to_thread(thread.join)
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+    def _next_batch(self) -> Tuple[List[Tuple[T, Future]], bool]:
+        """(배치, 멈춰야 하는지). 첫 항목이 올 때까지 기다린 뒤 linger 동안 batch_size 까지 더 모은다."""
+        first = self._queue.get()
+        if first is None:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self.linger
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                entry = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is None:
+                return batch, True
+            batch.append(entry)
+        return batch, False
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch, stopping = self._next_batch()
+            if batch:
+                self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[T, Future]]):
+        try:
+            results = self._write([item for item, _ in batch])
+        except Exception as e:
+            if len(batch) > 1:
+                # 어느 항목 때문인지 알 수 없으므로 하나씩 다시 써서 문제가 된 항목만 실패시킨다
+                for entry in batch:
+                    self._flush([entry])
+                return
+            self.failures += 1
+            logger.exception("%s: 항목을 쓰지 못했습니다.", self.name)
+            batch[0][1].set_exception(e)
+            return
+
+        self.batches += 1
+        self.items += len(batch)
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,72 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.transaction import transaction_context
+from app.core.instrumentation import metrics_registry
+from app.repository.reservation import ReservationRepository
+from app.repository.idempotency import IdempotencyRepository
+from app.repository.schedule import ExamScheduleRepository
+from app.service.maintenance import PendingExpiryService, SeatReconcileService
+from app.worker.scheduler import Scheduler
+
+EXPIRE_PENDING_JOB = "expire_pending_reservations"
+RECONCILE_SEATS_JOB = "reconcile_confirmed_seats"
+PURGE_IDEMPOTENCY_KEYS_JOB = "purge_idempotency_keys"
+_PURGE_BATCH_SIZE = 1000
+
+
+def expire_pending_reservations(stop: threading.Event) -> Optional[int]:
+    """PENDING_EXPIRY_SECONDS 보다 오래된 PENDING 예약을 배치마다 트랜잭션을 나눠 CANCELLED 로 바꾼다."""
+    # created_at 은 DB 가 채운 timestamptz 이므로 서버의 로컬 시각이 아니라 UTC 기준 시각과 비교한다
+    created_before = datetime.now(timezone.utc) - timedelta(seconds=settings.PENDING_EXPIRY_SECONDS)
+    batch_size = settings.PENDING_EXPIRY_BATCH_SIZE
+    expired = 0
+    while not stop.is_set():
+        with SessionLocal() as db:
+            count = PendingExpiryService(ReservationRepository(db)).expire_batch(created_before, batch_size)
+        if count is None:
+            return expired or None
+        expired += count
+        if count < batch_size:
+            break
+    return expired
+
+
+def reconcile_confirmed_seats(stop: threading.Event) -> Optional[int]:
+    """일정을 SEAT_RECONCILE_BATCH_SIZE 개씩 잠그고 확정 좌석 카운터를 다시 맞춘다. 보정한 일정 수를 돌려준다."""
+    after_id: Optional[int] = 0
+    corrected = 0
+    while after_id is not None and not stop.is_set():
+        with SessionLocal() as db:
+            result = SeatReconcileService(ExamScheduleRepository(db)).reconcile_batch(
+                after_id, settings.SEAT_RECONCILE_BATCH_SIZE
+            )
+        if result is None:
+            return corrected or None
+        exam_ids, after_id = result
+        corrected += len(exam_ids)
+    return corrected
+
+
+def purge_idempotency_keys(stop: threading.Event) -> Optional[int]:
+    """만료된 Idempotency-Key 기록을 지운다. 여러 인스턴스가 같이 돌려도 같은 행을 두 번 지우지 않을 뿐 해가 없다."""
+    purged = 0
+    while not stop.is_set():
+        with SessionLocal() as db, transaction_context(db):
+            count = IdempotencyRepository(db).purge_expired(datetime.now(timezone.utc), _PURGE_BATCH_SIZE)
+        purged += count
+        if count < _PURGE_BATCH_SIZE:
+            break
+    return purged
+
+
+scheduler = Scheduler()
+scheduler.add_job(EXPIRE_PENDING_JOB, settings.PENDING_EXPIRY_INTERVAL_SECONDS, expire_pending_reservations)
+scheduler.add_job(RECONCILE_SEATS_JOB, settings.SEAT_RECONCILE_INTERVAL_SECONDS, reconcile_confirmed_seats)
+if settings.IDEMPOTENCY_BACKEND == "db":
+    scheduler.add_job(PURGE_IDEMPOTENCY_KEYS_JOB, settings.IDEMPOTENCY_PURGE_INTERVAL_SECONDS, purge_idempotency_keys)
+
+metrics_registry.register_collector(scheduler.metrics)
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger("app.jobs")
+
+# stop: 종료 요청 신호. 배치를 여러 번 도는 작업은 배치 사이에 확인해 일찍 끝낸다.
+# 반환값: 처리한 행 수. 다른 인스턴스가 잠금을 잡고 있어 건너뛰었으면 None.
+JobFunc = Callable[[threading.Event], Optional[int]]
+
+
+@dataclass
+class Job:
+    name: str
+    interval: float
+    func: JobFunc
+    runs: int = 0
+    skipped: int = 0
+    failures: int = 0
+    rows: int = 0
+    last_duration: float = 0.0
+
+
+class Scheduler:
+    """
+    주기 작업을 작업마다 asyncio 태스크 하나로 돌린다. DB 작업은 스레드풀에서 실행해 이벤트 루프를 막지 않는다.
+    stop() 은 진행 중인 배치 트랜잭션을 끝까지 마친 뒤 돌아온다.
+    """
+
+    def __init__(self):
+        self.jobs: Dict[str, Job] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._stopping: Optional[asyncio.Event] = None
+        self._stop_requested = threading.Event()
+
+    def add_job(self, name: str, interval: float, func: JobFunc):
+        """interval 이 0 이하면 주기 실행하지 않는다(run_job 으로만 실행)."""
+        self.jobs[name] = Job(name, interval, func)
+
+    async def start(self):
+        if self._tasks:
+            return
+        self._stopping = asyncio.Event()
+        self._stop_requested.clear()
+        self._tasks = [
+            asyncio.create_task(self._loop(job), name=f"job:{job.name}")
+            for job in self.jobs.values() if job.interval > 0
+        ]
+
+    async def stop(self):
+        if not self._tasks:
+            return
+        self._stopping.set()
+        self._stop_requested.set()
+        await asyncio.gather(*self._tasks)
+        self._tasks = []
+
+    async def run_job(self, name: str) -> Optional[int]:
+        job = self.jobs[name]
+        started = time.perf_counter()
+        try:
+            rows = await asyncio.to_thread(job.func, self._stop_requested)
+        except Exception:
+            job.failures += 1
+            logger.exception("주기 작업이 실패했습니다. job=%s", job.name)
+            return None
+        finally:
+            job.last_duration = time.perf_counter() - started
+
+        if rows is None:
+            job.skipped += 1
+        else:
+            job.runs += 1
+            job.rows += rows
+        return rows
+
+    async def _loop(self, job: Job):
+        # 여러 인스턴스가 동시에 떠도 같은 순간에 몰리지 않도록 첫 실행을 흩뜨린다
+        delay = random.uniform(0, job.interval)
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+                return
+            except asyncio.TimeoutError:
+                pass
+            await self.run_job(job.name)
+            delay = job.interval
+
+    def metrics(self) -> List[str]:
+        series = (
+            ("scheduler_job_runs_total", "counter", "완료한 실행 횟수", lambda job: job.runs),
+            ("scheduler_job_skipped_total", "counter", "다른 인스턴스가 잠금을 잡고 있어 건너뛴 횟수", lambda job: job.skipped),
+            ("scheduler_job_failures_total", "counter", "오류로 끝난 실행 횟수", lambda job: job.failures),
+            ("scheduler_job_rows_total", "counter", "처리한 행 수", lambda job: job.rows),
+            ("scheduler_job_last_duration_seconds", "gauge", "마지막 실행에 걸린 시간(초)", lambda job: job.last_duration),
+        )
+        lines = []
+        for name, kind, help_text, read in series:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for job in self.jobs.values():
+                lines.append(f'{name}{{job="{job.name}"}} {read(job)}')
+        return lines
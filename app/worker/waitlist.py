@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import threading
+from typing import List, Optional, Set
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.instrumentation import metrics_registry
+from app.repository.reservation import ReservationRepository
+from app.service.waitlist import WaitlistService
+
+logger = logging.getLogger("app.waitlist")
+
+
+def promote_waitlist(exam_id: int, batch_size: int) -> int:
+    """일정 하나의 대기열을 더 확정할 수 없을 때까지 batch_size 건씩 승격한다. 배치마다 트랜잭션을 따로 쓴다."""
+    promoted = 0
+    while True:
+        with SessionLocal() as db:
+            count, more = WaitlistService(ReservationRepository(db)).promote(exam_id, batch_size)
+        promoted += count
+        if not more:
+            return promoted
+
+
+def _waitlisted_exam_ids() -> List[int]:
+    with SessionLocal() as db:
+        return list(ReservationRepository(db).get_waitlisted_exam_ids())
+
+
+class WaitlistWorker:
+    """
+    좌석이 풀린 일정을 notify 로 전달받아 그 일정의 대기열만 승격한다. 일정을 주기적으로 훑지 않고
+    커밋 후 콜백이 깨울 때만 돈다. WAITLIST_SWEEP_SECONDS 는 놓친 알림을 주워 담는 안전망이다.
+    """
+
+    def __init__(self):
+        self.promoted = 0
+        self.wakeups = 0
+        self.failures = 0
+        self._dirty: Set[int] = set()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def notify(self, exam_id: int):
+        """좌석이 풀렸거나 대기열이 바뀐 일정을 알린다. 동기 엔드포인트의 스레드풀에서 불러도 된다."""
+        with self._lock:
+            self._dirty.add(exam_id)
+            loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫혔다. 남은 일정은 다음 기동 때 대기열 전체를 훑으며 처리한다
+            pass
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._dirty)
+
+    async def start(self):
+        if self._task is not None:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+        self._task = asyncio.create_task(self._run(), name="waitlist-worker")
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        # 진행 중인 승격 트랜잭션은 끝까지 마친다
+        await self._task
+        self._task = None
+        with self._lock:
+            self._loop = None
+
+    async def _sweep(self):
+        try:
+            exam_ids = await asyncio.to_thread(_waitlisted_exam_ids)
+        except Exception:
+            self.failures += 1
+            logger.exception("대기열이 있는 일정을 읽지 못했습니다.")
+            return
+        with self._lock:
+            self._dirty.update(exam_ids)
+        if exam_ids:
+            self._wakeup.set()
+
+    async def _run(self):
+        timeout = settings.WAITLIST_SWEEP_SECONDS or None
+        # 재시작 전에 쌓인 대기열은 알림이 오지 않으므로 한 번 훑는다. 기동을 막지 않도록 태스크 안에서 한다
+        await self._sweep()
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                await self._sweep()
+            self._wakeup.clear()
+            self.wakeups += 1
+            await self._drain()
+
+    async def _drain(self):
+        while not self._stopping:
+            with self._lock:
+                exam_ids = sorted(self._dirty)
+                self._dirty.clear()
+            if not exam_ids:
+                return
+            for exam_id in exam_ids:
+                try:
+                    self.promoted += await asyncio.to_thread(
+                        promote_waitlist, exam_id, settings.WAITLIST_PROMOTION_BATCH_SIZE
+                    )
+                except Exception:
+                    self.failures += 1
+                    logger.exception("대기열 승격에 실패했습니다. exam_id=%s", exam_id)
+
+
+waitlist_worker = WaitlistWorker()
+
+
+def _waitlist_metrics() -> List[str]:
+    series = (
+        ("waitlist_promotions_total", "counter", "대기열에서 확정된 예약 수", waitlist_worker.promoted),
+        ("waitlist_worker_wakeups_total", "counter", "워커가 깨어난 횟수", waitlist_worker.wakeups),
+        ("waitlist_promotion_failures_total", "counter", "승격·대기열 조회 중 난 오류 수", waitlist_worker.failures),
+        ("waitlist_pending_exams", "gauge", "승격을 기다리는 일정 수", waitlist_worker.pending),
+    )
+    lines = []
+    for name, kind, help_text, value in series:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"{name} {value}")
+    return lines
+
+
+metrics_registry.register_collector(_waitlist_metrics)
@@ -0,0 +1,191 @@
+"""
+부하 테스트/벤치마크 실행기.
+
+    python -m benchmarks run --reservations 1000000 --requests 5000 --concurrency 32 --save main
+    python -m benchmarks run --workload http --compare main
+    python -m benchmarks slot-scaling --sizes 100 1000 10000 100000
+    python -m benchmarks confirm-storm --database-url postgresql://user@localhost/bench
+    python -m benchmarks --reuse auth-cost
+    python -m benchmarks --reuse serialization --sizes 10000 100000
+    python -m benchmarks replica-routing
+    python -m benchmarks waitlist
+    python -m benchmarks maintenance
+    python -m benchmarks startup
+    python -m benchmarks idempotency
+    python -m benchmarks schedule-search --count 50000
+    python -m benchmarks seat-ledger --bookings 5000 --concurrency 64
+
+앱은 ASGI 트랜스포트로 같은 프로세스 안에서 호출한다. 기본 대상은 로컬 SQLite 파일이고,
+--database-url 로 로컬 PostgreSQL 을 지정할 수 있다. 잠금/동시성 검증(confirm-storm)은 PostgreSQL 에서 돌려야 의미가 있다.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from benchmarks import environment
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--database-url", default=f"sqlite:///{PROJECT_ROOT / 'bench.db'}")
+    parser.add_argument("--driver", choices=["sync", "async"], default="sync")
+    parser.add_argument("--reuse", action="store_true", help="기존 데이터를 지우지 않고 그대로 사용")
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--schedules", type=int, default=2_000)
+    parser.add_argument("--reservations", type=int, default=100_000)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="혼합 워크로드를 재생하고 엔드포인트별 지표를 출력")
+    run.add_argument("--workload", choices=["mixed", "http"], default="mixed")
+    run.add_argument("--http-file", type=Path, default=PROJECT_ROOT / "test_main.http")
+    run.add_argument("--requests", type=int, default=2_000)
+    run.add_argument("--concurrency", type=int, default=16)
+    run.add_argument("--save", metavar="NAME", help="결과를 benchmarks/baselines/NAME.json 으로 저장")
+    run.add_argument("--compare", metavar="NAME", help="저장된 기준선과 비교해 회귀가 있으면 실패")
+    run.add_argument("--tolerance", type=float, default=0.2)
+
+    scaling = commands.add_parser("slot-scaling", help="일정당 예약 수에 따른 예약 생성 비용")
+    scaling.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000])
+    scaling.add_argument("--requests", type=int, default=200)
+
+    storm = commands.add_parser("confirm-storm", help="동시 확정/동시 예약 시 초과 확정과 중복 일정 검증")
+    storm.add_argument("--confirms", type=int, default=2_000)
+    storm.add_argument("--seats", type=int, default=10)
+    storm.add_argument("--max-seats", type=int, default=5_000)
+    storm.add_argument("--duplicate-bookings", type=int, default=200)
+    storm.add_argument("--concurrency", type=int, default=64)
+
+    waitlist = commands.add_parser("waitlist", help="정원 초과 확정의 대기열 등록과 좌석 반환 후 자동 승격 확인")
+    waitlist.add_argument("--confirms", type=int, default=500)
+    waitlist.add_argument("--seats", type=int, default=10)
+    waitlist.add_argument("--max-seats", type=int, default=2_000)
+    waitlist.add_argument("--released", type=int, default=50)
+    waitlist.add_argument("--concurrency", type=int, default=16)
+
+    maintenance = commands.add_parser("maintenance", help="PENDING 예약 만료·좌석 카운터 보정 작업의 결과와 멱등성 확인")
+    maintenance.add_argument("--pending", type=int, default=20_000)
+    maintenance.add_argument("--stale", type=int, default=15_000)
+    maintenance.add_argument("--drift", type=int, default=7)
+
+    idempotency = commands.add_parser("idempotency", help="같은 Idempotency-Key 의 동시·순차 재시도 처리 확인 (memory, db)")
+    idempotency.add_argument("--duplicates", type=int, default=20)
+    idempotency.add_argument("--retries", type=int, default=200)
+
+    search = commands.add_parser("schedule-search", help="시간대 겹침 검색의 구간 트리 경로와 DB 경로 비교")
+    search.add_argument("--count", type=int, default=20_000, help="추가로 만들 일정 수")
+    search.add_argument("--queries", type=int, default=500)
+
+    ledger = commands.add_parser("seat-ledger", help="한 일정에 몰린 예약 생성의 좌석 원장 모드 전후 비교")
+    ledger.add_argument("--bookings", type=int, default=2_000)
+    ledger.add_argument("--concurrency", type=int, default=64)
+
+    limit = commands.add_parser("rate-limit", help="한 사용자·IP 에 몰린 요청의 요청 수 제한(토큰 버킷) 확인 (memory, shared)")
+    limit.add_argument("--requests", type=int, default=500)
+    limit.add_argument("--concurrency", type=int, default=32)
+
+    feed = commands.add_parser("seat-feed", help="남은 좌석 SSE 피드의 구독 비용, 전파 시간, 변경 합치기 확인")
+    feed.add_argument("--subscribers", type=int, default=2_000)
+    feed.add_argument("--confirms", type=int, default=300)
+
+    startup = commands.add_parser("startup", help="콜드 스타트(import·문서 생성·기동 이벤트) 시간과 DB 비의존 확인")
+    startup.add_argument("--max-import-seconds", type=float, default=3.0)
+    startup.add_argument("--max-startup-seconds", type=float, default=0.5)
+
+    commands.add_parser(
+        "replica-routing",
+        help="SQLite 파일 두 개로 읽기 복제본 라우팅과 read-your-writes 확인 (복제본: bench_replica.db)"
+    )
+
+    serialization = commands.add_parser("serialization", help="예약 목록 응답의 조회+JSON 인코딩 비용 비교")
+    serialization.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    serialization.add_argument("--repeat", type=int, default=3)
+
+    auth_cost = commands.add_parser("auth-cost", help="요청 하나당 인증 의존성 비용 비교")
+    auth_cost.add_argument("--iterations", type=int, default=20_000)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    replica_url = None
+    if args.command == "replica-routing":
+        if not args.database_url.startswith("sqlite:///"):
+            print("replica-routing 은 SQLite 파일 DB 에서만 실행할 수 있습니다.")
+            return 2
+        replica_url = f"sqlite:///{PROJECT_ROOT / 'bench_replica.db'}"
+    environment.configure(args.database_url, args.driver, replica_url)
+
+    from app.core.dummy import SeedVolume
+    from benchmarks import auth, scenarios, serialization, startup, stats
+    from benchmarks.runner import run_replay
+    from benchmarks.workloads import http_file_workload, load_catalog, mixed_workload
+
+    volume = SeedVolume(users=args.users, schedules=args.schedules, reservations=args.reservations)
+    environment.prepare_database(volume, reuse=args.reuse)
+
+    if args.command == "slot-scaling":
+        scenarios.slot_scaling(args.sizes, args.requests)
+        return 0
+    if args.command == "replica-routing":
+        ok = scenarios.replica_routing(args.database_url[len("sqlite:///"):], replica_url[len("sqlite:///"):])
+        return 0 if ok else 1
+    if args.command == "serialization":
+        serialization.serialization_cost(args.sizes, args.repeat)
+        return 0
+    if args.command == "auth-cost":
+        auth.auth_cost(args.iterations)
+        return 0
+    if args.command == "waitlist":
+        ok = scenarios.waitlist_promotion(
+            args.confirms, args.seats, args.max_seats, args.released, args.concurrency
+        )
+        return 0 if ok else 1
+    if args.command == "idempotency":
+        ok = scenarios.idempotency(args.duplicates, args.retries)
+        return 0 if ok else 1
+    if args.command == "schedule-search":
+        ok = scenarios.schedule_search(args.count, args.queries)
+        return 0 if ok else 1
+    if args.command == "seat-ledger":
+        ok = scenarios.seat_ledger(args.bookings, args.concurrency)
+        return 0 if ok else 1
+    if args.command == "rate-limit":
+        ok = scenarios.rate_limit(args.requests, args.concurrency)
+        return 0 if ok else 1
+    if args.command == "seat-feed":
+        ok = scenarios.seat_feed(args.subscribers, args.confirms)
+        return 0 if ok else 1
+    if args.command == "startup":
+        ok = startup.startup_cost(args.max_import_seconds, args.max_startup_seconds)
+        return 0 if ok else 1
+    if args.command == "maintenance":
+        ok = scenarios.maintenance_jobs(args.pending, args.stale, args.drift)
+        return 0 if ok else 1
+    if args.command == "confirm-storm":
+        ok = scenarios.confirm_storm(
+            args.confirms, args.seats, args.max_seats, args.duplicate_bookings, args.concurrency
+        )
+        return 0 if ok else 1
+
+    if args.workload == "http":
+        planned = http_file_workload(args.http_file, args.requests)
+    else:
+        planned = mixed_workload(load_catalog(), args.requests)
+    samples, wall = run_replay(planned, args.concurrency)
+    summary = stats.summarize(samples, wall)
+    stats.print_report(summary)
+
+    if args.save:
+        print(f"baseline saved: {stats.save_baseline(args.save, summary)}")
+    if args.compare:
+        regressions = stats.compare_baseline(args.compare, summary, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
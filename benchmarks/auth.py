@@ -0,0 +1,67 @@
+import asyncio
+import time
+from typing import Callable, Awaitable, List, Tuple
+
+
+def _legacy_get_current_user(token: str):
+    """변경 전 get_current_user 와 같은 방식: 요청마다 저장하지 않을 User ORM 객체를 만든다."""
+    from app.models import User
+    from app.models.enums import UserRole
+
+    if token == "admin":
+        return User(id=1, name="admin", role=UserRole.ADMIN)
+    user_id = int(token.split("user")[1])
+    return User(id=user_id, name=f"user{user_id}", role=UserRole.USER)
+
+
+async def _measure(call: Callable[[], Awaitable[object]], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await call()
+    return (time.perf_counter() - started) / iterations
+
+
+def auth_cost(iterations: int):
+    """요청 하나당 인증 의존성 비용을 경로별로 비교한다."""
+    from app.core import auth
+    from app.core.token import create_access_token
+    from benchmarks.runner import dispose_async_engines
+
+    signed = f"Bearer {create_access_token(2)}"
+
+    async def legacy():
+        return _legacy_get_current_user("user2")
+
+    async def dev_token_cached():
+        return await auth.get_current_user("Bearer user2")
+
+    async def signed_token_cached():
+        return await auth.get_current_user(signed)
+
+    async def signed_token_verify():
+        auth._verified_tokens.clear()
+        return await auth.get_current_user(signed)
+
+    async def principal_lookup():
+        auth._principal_cache.clear()
+        return await auth.get_current_user("Bearer user2")
+
+    cases: List[Tuple[str, Callable[[], Awaitable[object]], int]] = [
+        ("legacy (User ORM object)", legacy, iterations),
+        ("dev token, cached", dev_token_cached, iterations),
+        ("signed token, cached", signed_token_cached, iterations),
+        ("signed token, RS256 verify", signed_token_verify, max(iterations // 20, 1)),
+        ("principal lookup, DB", principal_lookup, max(iterations // 20, 1)),
+    ]
+
+    async def run():
+        await dev_token_cached()
+        await signed_token_cached()
+        results = [(label, await _measure(call, n)) for label, call, n in cases]
+        await dispose_async_engines()
+        return results
+
+    print(f"{'path':<32} {'us/req':>10}")
+    print("-" * 43)
+    for label, elapsed in asyncio.run(run()):
+        print(f"{label:<32} {elapsed * 1_000_000:>10.2f}")
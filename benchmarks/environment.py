@@ -0,0 +1,28 @@
+import os
+from typing import Optional
+
+
+def configure(database_url: str, driver: str, replica_url: Optional[str] = None):
+    """설정과 엔진은 처음 쓸 때 만들어지므로 app 을 처음 쓰기 전에 호출해야 한다."""
+    os.environ["DATABASE_URL"] = database_url
+    if replica_url:
+        os.environ["DATABASE_REPLICA_URL"] = replica_url
+    os.environ["DATABASE_DRIVER"] = driver
+    # 시나리오는 "admin", "userN" 개발용 토큰과 임시 서명 키를 쓴다
+    os.environ.setdefault("AUTH_ALLOW_DEV_TOKENS", "true")
+
+
+def prepare_database(volume: Optional["SeedVolume"], reuse: bool = False):
+    import app.models  # noqa: F401
+    from app.core.database import Base, SessionLocal, get_engine
+    from app.core.dummy import create_seed_data
+
+    if not reuse:
+        Base.metadata.drop_all(get_engine())
+    Base.metadata.create_all(get_engine())
+
+    db = SessionLocal()
+    try:
+        create_seed_data(db, volume)
+    finally:
+        db.close()
@@ -0,0 +1,57 @@
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"}
+
+
+@dataclass
+class HttpFileRequest:
+    name: str
+    method: str
+    path: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Optional[str] = None
+
+    @property
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+def parse_http_file(path: Path) -> List[HttpFileRequest]:
+    """JetBrains HTTP Client 형식(test_main.http)의 요청 블록을 읽는다."""
+    requests = []
+    for block in path.read_text(encoding="utf-8").split("###"):
+        lines = block.strip("\n").splitlines()
+        first_token = lines[0].split()[0] if lines and lines[0].split() else None
+        name = ""
+        if first_token is not None and first_token not in _METHODS:
+            name = lines.pop(0).strip().lstrip("#").strip()
+        lines = [line for line in lines if not line.lstrip().startswith("#")]
+        request_index = next((i for i, line in enumerate(lines) if line.strip()), None)
+        if request_index is None:
+            continue
+
+        method, url = lines[request_index].split(maxsplit=1)
+        parts = urlsplit(url.strip())
+        request = HttpFileRequest(
+            name=name,
+            method=method.upper(),
+            path=parts.path + (f"?{parts.query}" if parts.query else "")
+        )
+
+        body_lines = []
+        in_body = False
+        for line in lines[request_index + 1:]:
+            if in_body:
+                body_lines.append(line)
+            elif not line.strip():
+                in_body = True
+            else:
+                key, value = line.split(":", 1)
+                request.headers[key.strip()] = value.strip()
+        request.body = "\n".join(body_lines).strip() or None
+        requests.append(request)
+    return requests
@@ -0,0 +1,68 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import httpx
+
+from app.core.instrumentation import collect_queries, instrument_engine
+from benchmarks.workloads import PlannedRequest
+
+
+@dataclass(frozen=True)
+class Sample:
+    label: str
+    status: int
+    elapsed: float
+    queries: int
+
+
+async def replay(app, planned: List[PlannedRequest], concurrency: int) -> Tuple[List[Sample], float]:
+    samples: List[Sample] = []
+    pending = iter(planned)
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", follow_redirects=True) as client:
+        async def worker():
+            for request in pending:
+                # ASGITransport 는 이 태스크 안에서 앱을 실행하므로 수집 범위가
+                # 스레드풀(동기 핸들러)과 greenlet(비동기 세션)까지 그대로 따라간다.
+                with collect_queries() as stats:
+                    started = time.perf_counter()
+                    response = await client.request(
+                        request.method,
+                        request.path,
+                        headers=request.headers,
+                        json=request.json
+                    )
+                    elapsed = time.perf_counter() - started
+                samples.append(Sample(request.label, response.status_code, elapsed, stats.count))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - started
+
+    return samples, wall
+
+
+async def dispose_async_engines():
+    """풀에 남은 aiosqlite 커넥션은 스레드를 붙잡고 있어 이벤트 루프를 닫기 전에 정리해야 한다."""
+    from app.core.database import dispose_engines
+
+    await dispose_engines()
+
+
+async def _replay_and_dispose(app, planned: List[PlannedRequest], concurrency: int) -> Tuple[List[Sample], float]:
+    try:
+        return await replay(app, planned, concurrency)
+    finally:
+        await dispose_async_engines()
+
+
+def run_replay(planned: List[PlannedRequest], concurrency: int) -> Tuple[List[Sample], float]:
+    from app.core.database import all_engines
+    from main import app
+
+    for engine in all_engines().values():
+        instrument_engine(engine)
+    return asyncio.run(_replay_and_dispose(app, planned, concurrency))
@@ -0,0 +1,911 @@
+import math
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple
+
+import orjson
+from sqlalchemy import func, insert
+
+from benchmarks.runner import dispose_async_engines, run_replay
+from benchmarks.stats import summarize
+from benchmarks.workloads import ADMIN, PlannedRequest, _booking
+
+
+def _far_future_slot(offset_days: int) -> Tuple[datetime, datetime]:
+    start_time = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=400 + offset_days)
+    return start_time, start_time + timedelta(hours=2)
+
+
+def _create_slot(time_slot: Tuple[datetime, datetime], max_seats: int, pending: int, seats: int) -> List[int]:
+    """일정 하나와 그 일정에 걸린 PENDING 예약 pending 건을 만들고 예약 id 목록을 돌려준다."""
+    from app.core.database import SessionLocal
+    from app.models import ExamSchedule, Reservation
+    from app.models.enums import ReservationStatus
+
+    db = SessionLocal()
+    try:
+        schedule = ExamSchedule(start_time=time_slot[0], end_time=time_slot[1], max_seats=max_seats)
+        db.add(schedule)
+        db.commit()
+        for offset in range(0, pending, 10_000):
+            db.execute(insert(Reservation), [
+                {"user_id": 2, "exam_id": schedule.id, "status": ReservationStatus.PENDING, "requested_seats": seats}
+                for _ in range(min(10_000, pending - offset))
+            ])
+        db.commit()
+        return [reservation_id for reservation_id, in db.query(Reservation.id).filter(Reservation.exam_id == schedule.id)]
+    finally:
+        db.close()
+
+
+def slot_scaling(sizes: List[int], requests_per_size: int):
+    """
+    일정에 걸린 예약 수를 늘려가며 같은 일정에 예약을 생성하는 비용을 잰다.
+    일정 조회가 예약 행을 읽지 않는다면 크기와 무관하게 지연과 쿼리 수가 일정해야 한다.
+    """
+    print(f"{'reservations/slot':>18} {'p50 ms':>9} {'p99 ms':>9} {'q/req':>6}")
+    for offset, size in enumerate(sizes):
+        time_slot = _far_future_slot(offset)
+        _create_slot(time_slot, max_seats=10 ** 9, pending=size, seats=1)
+        planned = [
+            PlannedRequest("POST /reservations", "POST", "/reservations/", {"Authorization": "Bearer user2"},
+                           _booking(time_slot, 1))
+            for _ in range(requests_per_size)
+        ]
+        samples, wall = run_replay(planned, concurrency=1)
+        row = summarize(samples, wall)["ALL"]
+        print(f"{size:>18} {row['p50_ms']:>9.2f} {row['p99_ms']:>9.2f} {row['queries_per_request']:>6.2f}")
+
+
+def confirm_storm(reservations: int, seats: int, max_seats: int, duplicate_bookings: int, concurrency: int) -> bool:
+    """
+    정원보다 많은 PENDING 예약을 동시에 확정하고, 같은 새 시간대로 동시에 예약을 넣은 뒤
+    확정 좌석이 정원을 넘지 않았는지, 카운터가 실제 합계와 같은지, 중복 일정이 없는지 확인한다.
+    """
+    from app.core.database import SessionLocal
+    from app.models import ExamSchedule, Reservation
+    from app.models.enums import ReservationStatus
+
+    storm_slot = _far_future_slot(-1)
+    reservation_ids = _create_slot(storm_slot, max_seats=max_seats, pending=reservations, seats=seats)
+    new_slot = _far_future_slot(-2)
+
+    planned = [
+        PlannedRequest("PATCH /reservations/{id}/confirm", "PATCH", f"/reservations/{reservation_id}/confirm", ADMIN)
+        for reservation_id in reservation_ids
+    ] + [
+        PlannedRequest("POST /reservations", "POST", "/reservations/", {"Authorization": "Bearer user2"},
+                       _booking(new_slot, 1))
+        for _ in range(duplicate_bookings)
+    ]
+    random.Random(1).shuffle(planned)
+    samples, wall = run_replay(planned, concurrency)
+
+    db = SessionLocal()
+    try:
+        schedule = db.query(ExamSchedule).filter(ExamSchedule.start_time == storm_slot[0]).one()
+        confirmed = (
+            db.query(func.coalesce(func.sum(Reservation.requested_seats), 0))
+            .filter(Reservation.exam_id == schedule.id, Reservation.status == ReservationStatus.CONFIRMED)
+            .scalar()
+        )
+        duplicates = (
+            db.query(func.count(ExamSchedule.id))
+            .filter(ExamSchedule.start_time == new_slot[0], ExamSchedule.end_time == new_slot[1])
+            .scalar()
+        )
+    finally:
+        db.close()
+
+    errors = sum(1 for sample in samples if sample.status >= 500)
+    print(f"requests: {len(samples)} in {wall:.2f}s, 5xx: {errors}")
+    print(f"max_seats: {schedule.max_seats}, confirmed (sum): {confirmed}, confirmed (counter): {schedule.confirmed_seats}")
+    print(f"schedules for the concurrently booked slot: {duplicates}")
+
+    ok = confirmed <= schedule.max_seats and confirmed == schedule.confirmed_seats and duplicates == 1 and errors == 0
+    print("PASS" if ok else "FAIL")
+    return ok
+
+
+def waitlist_promotion(reservations: int, seats: int, max_seats: int, released: int, concurrency: int) -> bool:
+    """
+    정원보다 많은 예약을 동시에 확정해 나머지를 대기열에 넣고, 확정 예약 released 건을 지운 뒤
+    워커가 대기열 앞에서부터 같은 수만큼 확정하는지, 카운터가 실제 합계와 같은지 확인한다.
+    """
+    import asyncio
+
+    import httpx
+
+    from app.core.database import SessionLocal, all_engines
+    from app.core.instrumentation import instrument_engine
+    from app.models import ExamSchedule, Reservation, WaitlistEntry
+    from app.models.enums import ReservationStatus
+    from app.worker.waitlist import waitlist_worker
+    from benchmarks.runner import replay
+    from main import app
+
+    db = SessionLocal()
+    try:
+        # --reuse 로 다시 돌려도 겹치지 않도록 가장 늦은 일정 다음 날을 쓴다
+        latest = db.query(func.max(ExamSchedule.start_time)).scalar()
+    finally:
+        db.close()
+    time_slot = (latest + timedelta(days=1), latest + timedelta(days=1, hours=2))
+    reservation_ids = _create_slot(time_slot, max_seats=max_seats, pending=reservations, seats=seats)
+    for engine in all_engines().values():
+        instrument_engine(engine)
+
+    def snapshot():
+        db = SessionLocal()
+        try:
+            schedule = db.query(ExamSchedule).filter(ExamSchedule.start_time == time_slot[0]).one()
+            statuses = dict(db.query(Reservation.id, Reservation.status).filter(Reservation.exam_id == schedule.id))
+            queue = [reservation_id for reservation_id, in
+                     db.query(WaitlistEntry.reservation_id).filter(WaitlistEntry.exam_id == schedule.id)
+                     .order_by(WaitlistEntry.id)]
+            return schedule, statuses, queue
+        finally:
+            db.close()
+
+    async def run():
+        await waitlist_worker.start()
+        try:
+            planned = [
+                PlannedRequest("PATCH /reservations/{id}/confirm", "PATCH", f"/reservations/{reservation_id}/confirm", ADMIN)
+                for reservation_id in reservation_ids
+            ]
+            samples, wall = await replay(app, planned, concurrency)
+            _, statuses, queue = snapshot()
+            confirmed_ids = [i for i, status in statuses.items() if status == ReservationStatus.CONFIRMED]
+
+            promoted_before, wakeups_before = waitlist_worker.promoted, waitlist_worker.wakeups
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                for reservation_id in confirmed_ids[:released]:
+                    await client.delete(f"/reservations/{reservation_id}", headers=ADMIN)
+
+            deadline = asyncio.get_running_loop().time() + 10
+            while waitlist_worker.promoted - promoted_before < released and asyncio.get_running_loop().time() < deadline:
+                await asyncio.sleep(0.01)
+            return samples, wall, queue, waitlist_worker.wakeups - wakeups_before
+        finally:
+            await waitlist_worker.stop()
+            await dispose_async_engines()
+
+    samples, wall, queue_before, wakeups = asyncio.run(run())
+    schedule, statuses, queue_after = snapshot()
+    confirmed = sum(seats for status in statuses.values() if status == ReservationStatus.CONFIRMED)
+    promoted = [i for i in queue_before if statuses.get(i) == ReservationStatus.CONFIRMED]
+    errors = sum(1 for sample in samples if sample.status != 200)
+
+    print(f"confirms: {len(samples)} in {wall:.2f}s, non-200: {errors}, waitlisted: {len(queue_before)}")
+    print(f"released: {released}, promoted: {len(promoted)}, worker wakeups after release: {wakeups}")
+    print(f"max_seats: {schedule.max_seats}, confirmed (sum): {confirmed}, confirmed (counter): {schedule.confirmed_seats}")
+
+    checks = [
+        ("over-capacity confirms are waitlisted, not rejected", errors == 0 and len(queue_before) > 0),
+        ("promoted exactly the released capacity", len(promoted) == min(released, len(queue_before))),
+        ("promotion follows queue order (FIFO)", promoted == queue_before[:len(promoted)]),
+        ("promoted reservations left the queue", queue_after == queue_before[len(promoted):]),
+        ("counter matches confirmed seats", confirmed == schedule.confirmed_seats <= schedule.max_seats),
+    ]
+    for label, ok in checks:
+        print(f"{'ok' if ok else 'NG'}  {label}")
+    ok = all(ok for _, ok in checks)
+    print("PASS" if ok else "FAIL")
+    return ok
+
+
+
+def maintenance_jobs(pending: int, stale: int, drift: int) -> bool:
+    """
+    오래된 PENDING 예약 stale 건과 카운터가 drift 만큼 어긋난 일정을 만들고 주기 작업을 한 번씩 돌린다.
+    만료·보정 건수가 기대와 같은지, 다시 돌리면 아무것도 바꾸지 않는지(멱등) 확인한다.
+    """
+    import asyncio
+
+    from sqlalchemy import text, update
+
+    from app.core.config import settings
+    from app.core.database import SessionLocal
+    from app.models import ExamSchedule, Reservation
+    from app.models.enums import ReservationStatus
+    from app.worker.jobs import EXPIRE_PENDING_JOB, RECONCILE_SEATS_JOB, scheduler
+
+    db = SessionLocal()
+    try:
+        latest = db.query(func.max(ExamSchedule.start_time)).scalar()
+    finally:
+        db.close()
+    time_slot = (latest + timedelta(days=1), latest + timedelta(days=1, hours=2))
+    reservation_ids = _create_slot(time_slot, max_seats=10 ** 9, pending=pending, seats=1)
+
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.PENDING_EXPIRY_SECONDS)
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(Reservation)
+            .where(Reservation.id.in_(reservation_ids[:stale]))
+            .values(created_at=cutoff - timedelta(hours=1))
+        )
+        db.execute(
+            update(ExamSchedule)
+            .where(ExamSchedule.start_time == time_slot[0])
+            .values(confirmed_seats=ExamSchedule.confirmed_seats + drift)
+        )
+        db.commit()
+        expected_expired = (
+            db.query(func.count(Reservation.id))
+            .filter(Reservation.status == ReservationStatus.PENDING, Reservation.created_at < cutoff)
+            .scalar()
+        )
+        plan = db.execute(text(
+            "EXPLAIN QUERY PLAN SELECT id FROM reservations "
+            "WHERE status = 'PENDING' AND created_at < :cutoff ORDER BY created_at, id LIMIT 1000"
+        ), {"cutoff": cutoff}).all() if db.get_bind().dialect.name == "sqlite" else []
+    finally:
+        db.close()
+
+    async def run():
+        timings = {}
+        results = {}
+        for name in (EXPIRE_PENDING_JOB, RECONCILE_SEATS_JOB):
+            started = time.perf_counter()
+            results[name] = await scheduler.run_job(name)
+            timings[name] = time.perf_counter() - started
+            results[f"{name} (again)"] = await scheduler.run_job(name)
+
+        await scheduler.start()
+        started = time.perf_counter()
+        await scheduler.stop()
+        await dispose_async_engines()
+        return results, timings, time.perf_counter() - started
+
+    results, timings, shutdown = asyncio.run(run())
+
+    db = SessionLocal()
+    try:
+        schedule = db.query(ExamSchedule).filter(ExamSchedule.start_time == time_slot[0]).one()
+        confirmed = (
+            db.query(func.coalesce(func.sum(Reservation.requested_seats), 0))
+            .filter(Reservation.exam_id == schedule.id, Reservation.status == ReservationStatus.CONFIRMED)
+            .scalar()
+        )
+        cancelled = (
+            db.query(func.count(Reservation.id))
+            .filter(Reservation.id.in_(reservation_ids[:stale]), Reservation.status == ReservationStatus.CANCELLED)
+            .scalar()
+        )
+    finally:
+        db.close()
+
+    for detail in plan:
+        print(f"plan: {detail[-1]}")
+    for name, rows in results.items():
+        suffix = f" in {timings[name]:.2f}s" if name in timings else ""
+        print(f"{name}: {rows} rows{suffix}")
+    print(f"scheduler shutdown: {shutdown * 1000:.1f} ms")
+
+    checks = [
+        ("expired every stale PENDING reservation", results[EXPIRE_PENDING_JOB] == expected_expired
+         and cancelled == stale),
+        ("second expiry run changes nothing", results[f"{EXPIRE_PENDING_JOB} (again)"] == 0),
+        ("drifted counter was corrected", results[RECONCILE_SEATS_JOB] >= 1 and schedule.confirmed_seats == confirmed),
+        ("second reconcile run changes nothing", results[f"{RECONCILE_SEATS_JOB} (again)"] == 0),
+    ]
+    for label, ok in checks:
+        print(f"{'ok' if ok else 'NG'}  {label}")
+    ok = all(ok for _, ok in checks)
+    print("PASS" if ok else "FAIL")
+    return ok
+
+
+def idempotency(duplicates: int, retries: int) -> bool:
+    """
+    같은 Idempotency-Key 로 동시에 여러 번, 이어서 순차로 여러 번 예약을 넣는다. 저장소(memory, db)마다
+    예약이 한 건만 생기는지, 모든 응답 본문이 같은지, 재시도가 예약 경로를 타지 않는지(쿼리 수) 확인한다.
+    """
+    import asyncio
+
+    import httpx
+
+    from app.core.database import SessionLocal, all_engines
+    from app.core.instrumentation import collect_queries, instrument_engine
+    from app.models import ExamSchedule, Reservation
+    from app.service.idempotency import (
+        IDEMPOTENCY_HEADER,
+        REPLAYED_HEADER,
+        DatabaseIdempotencyStore,
+        MemoryIdempotencyStore,
+        use_idempotency_store,
+    )
+    from benchmarks.stats import percentile
+    from main import app
+
+    for engine in all_engines().values():
+        instrument_engine(engine)
+
+    def fresh_slot() -> Tuple[datetime, datetime]:
+        db = SessionLocal()
+        try:
+            latest = db.query(func.max(ExamSchedule.start_time)).scalar()
+        finally:
+            db.close()
+        return latest + timedelta(days=1), latest + timedelta(days=1, hours=2)
+
+    def reservations_in(time_slot) -> int:
+        db = SessionLocal()
+        try:
+            return (
+                db.query(func.count(Reservation.id))
+                .join(ExamSchedule, ExamSchedule.id == Reservation.exam_id)
+                .filter(ExamSchedule.start_time == time_slot[0])
+                .scalar()
+            )
+        finally:
+            db.close()
+
+    async def post(client, headers, body):
+        with collect_queries() as stats:
+            started = time.perf_counter()
+            response = await client.post("/reservations/", headers=headers, json=body)
+            elapsed = time.perf_counter() - started
+        return response, elapsed, stats.count
+
+    async def run(backend: str, time_slot):
+        key = f"bench-{backend}-{time_slot[0].isoformat()}"
+        headers = {"Authorization": "Bearer user2", IDEMPOTENCY_HEADER: key}
+        body = _booking(time_slot, 1)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", follow_redirects=True) as client:
+            burst = await asyncio.gather(*(post(client, headers, body) for _ in range(duplicates)))
+            sequential = [await post(client, headers, body) for _ in range(retries)]
+            mismatch = await client.post("/reservations/", headers=headers, json=_booking(time_slot, 2))
+            plain_slot = (time_slot[0] + timedelta(hours=3), time_slot[1] + timedelta(hours=3))
+            plain = [await post(client, {"Authorization": "Bearer user2"}, _booking(plain_slot, 1))
+                     for _ in range(retries)]
+        await dispose_async_engines()
+        return burst, sequential, mismatch, plain
+
+    ok = True
+    for backend, store in (("memory", MemoryIdempotencyStore(10_000)), ("db", DatabaseIdempotencyStore())):
+        use_idempotency_store(store)
+        time_slot = fresh_slot()
+        burst, sequential, mismatch, plain = asyncio.run(run(backend, time_slot))
+        responses = [response for response, _, _ in burst + sequential]
+        executed = [response for response in responses if REPLAYED_HEADER not in response.headers]
+        retry_ms = sorted(elapsed * 1000 for _, elapsed, _ in sequential)
+        plain_ms = sorted(elapsed * 1000 for _, elapsed, _ in plain)
+
+        print(f"[{backend}] {duplicates} concurrent + {retries} sequential requests with one key")
+        print(f"  statuses: {sorted({response.status_code for response in responses})}, executed: {len(executed)}, "
+              f"reservations created: {reservations_in(time_slot)}")
+        print(f"  retry p50 {percentile(retry_ms, 50):.2f} ms, "
+              f"{sum(q for _, _, q in sequential) / len(sequential):.2f} q/req "
+              f"(no key: p50 {percentile(plain_ms, 50):.2f} ms, {sum(q for _, _, q in plain) / len(plain):.2f} q/req)")
+
+        checks = [
+            ("every request succeeded", all(response.status_code == 200 for response in responses)),
+            ("booking path ran once", len(executed) == 1 and reservations_in(time_slot) == 1),
+            ("replays return the same body", len({response.content for response in responses}) == 1),
+            ("body has the same shape as without a key", responses[0].json().keys() == plain[0][0].json().keys()),
+            ("same key with a different body is rejected", mismatch.status_code == 422),
+        ]
+        for label, passed in checks:
+            print(f"  {'ok' if passed else 'NG'}  {label}")
+        ok = ok and all(passed for _, passed in checks)
+    print("PASS" if ok else "FAIL")
+    return ok
+
+
+def schedule_search(schedules: int, queries: int) -> bool:
+    """
+    일정 schedules 개(길이 1시간~3일)를 더 만든 뒤 같은 시간대 검색을 구간 트리 경로와 DB 경로로 보내
+    결과가 같은지, 요청당 지연과 쿼리 수가 어떤지 비교한다. DB 경로는 PostgreSQL 이면 GiST 인덱스를 탄다.
+    """
+    import asyncio
+
+    import httpx
+
+    from app.core.cache import schedule_cache, AVAILABLE_SCHEDULES_CACHE_KEY
+    from app.core.config import get_settings
+    from app.core.database import SessionLocal, all_engines
+    from app.core.instrumentation import collect_queries, instrument_engine
+    from app.models import ExamSchedule
+    from benchmarks.stats import percentile
+    from main import app
+
+    for engine in all_engines().values():
+        instrument_engine(engine)
+
+    rng = random.Random(21)
+    db = SessionLocal()
+    try:
+        first = db.query(func.max(ExamSchedule.start_time)).scalar() + timedelta(days=1)
+        values = []
+        for index in range(schedules):
+            start_time = first + timedelta(minutes=30 * index)
+            values.append({
+                "start_time": start_time,
+                "end_time": start_time + timedelta(hours=rng.choice([1, 2, 3, 24, 72])),
+                "max_seats": 100,
+                "confirmed_seats": rng.randint(0, 100),
+            })
+        for offset in range(0, len(values), 10_000):
+            db.execute(insert(ExamSchedule), values[offset:offset + 10_000])
+        db.commit()
+    finally:
+        db.close()
+    schedule_cache.invalidate(AVAILABLE_SCHEDULES_CACHE_KEY)
+
+    span_minutes = 30 * schedules
+    windows = []
+    for _ in range(queries):
+        start_time = first + timedelta(minutes=rng.randrange(span_minutes))
+        windows.append((start_time, start_time + timedelta(hours=rng.choice([1, 4, 24])), rng.choice([1, 10, 50])))
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            results = []
+            for start_time, end_time, min_seats in windows:
+                params = {"start_time": start_time.isoformat(), "end_time": end_time.isoformat(), "min_seats": min_seats}
+                with collect_queries() as stats:
+                    started = time.perf_counter()
+                    response = await client.get("/exam-schedules/search", params=params)
+                    elapsed = time.perf_counter() - started
+                results.append((response, elapsed, stats.count))
+        await dispose_async_engines()
+        return results
+
+    runs = {}
+    for label, enabled in (("interval tree", True), ("database", False)):
+        get_settings().SCHEDULE_SEARCH_INDEX_ENABLED = enabled
+        started = time.perf_counter()
+        runs[label] = asyncio.run(run())
+        wall = time.perf_counter() - started
+        latencies = sorted(elapsed * 1000 for _, elapsed, _ in runs[label])
+        matched = sum(len(response.json()) for response, _, _ in runs[label]) / len(windows)
+        print(f"[{label}] {len(windows)} searches over {schedules} extra schedules in {wall:.2f}s: "
+              f"p50 {percentile(latencies, 50):.2f} ms, p99 {percentile(latencies, 99):.2f} ms, "
+              f"{sum(q for _, _, q in runs[label]) / len(windows):.2f} q/req, {matched:.1f} schedules/search")
+    get_settings().SCHEDULE_SEARCH_INDEX_ENABLED = True
+
+    tree, database = runs["interval tree"], runs["database"]
+    checks = [
+        ("every search succeeded", all(response.status_code == 200 for response, _, _ in tree + database)),
+        ("both paths return the same schedules",
+         all(a.json() == b.json() for (a, _, _), (b, _, _) in zip(tree, database))),
+        ("searches found overlapping schedules", any(response.json() for response, _, _ in tree)),
+    ]
+    for label, passed in checks:
+        print(f"  {'ok' if passed else 'NG'}  {label}")
+    ok = all(passed for _, passed in checks)
+    print("PASS" if ok else "FAIL")
+    return ok
+
+
+def seat_ledger(bookings: int, concurrency: int) -> bool:
+    """
+    인기 일정 하나에 예약 생성 요청을 몰아 넣는다. 좌석 원장을 끈 경우와 켠 경우의 처리량·지연·요청당 쿼리 수,
+    기록기 배치 크기를 비교하고, 200 응답 수와 실제로 생긴 예약 수가 같은지 확인한다.
+    이어서 일정을 매진시킨 뒤 같은 요청이 원장에서 DB 없이 거절되는지 본다.
+    """
+    from app.core import auth
+    from app.core.config import get_settings
+    from app.core.database import SessionLocal
+    from app.models import ExamSchedule, Reservation
+    from app.service.seat_ledger import reservation_writer
+
+    def fresh_slot() -> Tuple[datetime, datetime]:
+        db = SessionLocal()
+        try:
+            latest = db.query(func.max(ExamSchedule.start_time)).scalar()
+        finally:
+            db.close()
+        return latest + timedelta(days=1), latest + timedelta(days=1, hours=2)
+
+    def reservations_in(time_slot) -> int:
+        db = SessionLocal()
+        try:
+            return (
+                db.query(func.count(Reservation.id))
+                .join(ExamSchedule, ExamSchedule.id == Reservation.exam_id)
+                .filter(ExamSchedule.start_time == time_slot[0])
+                .scalar()
+            )
+        finally:
+            db.close()
+
+    def sell_out(time_slot):
+        db = SessionLocal()
+        try:
+            db.query(ExamSchedule).filter(ExamSchedule.start_time == time_slot[0]).update(
+                {ExamSchedule.confirmed_seats: ExamSchedule.max_seats}
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def book(time_slot, count: int) -> List[PlannedRequest]:
+        return [
+            PlannedRequest("POST /reservations", "POST", "/reservations/",
+                           {"Authorization": f"Bearer user{2 + index % 50}"}, _booking(time_slot, 1))
+            for index in range(count)
+        ]
+
+    def report(label: str, samples, wall: float):
+        row = summarize(samples, wall)["ALL"]
+        statuses = sorted({sample.status for sample in samples})
+        print(f"  {label:<9} {row['rps']:>8.1f} req/s  p50 {row['p50_ms']:>7.2f} ms  p99 {row['p99_ms']:>8.2f} ms  "
+              f"{row['queries_per_request']:>5.2f} q/req  statuses {statuses}")
+
+    ok = True
+    for mode, enabled in (("ledger off", False), ("ledger on", True)):
+        get_settings().SEAT_LEDGER_ENABLED = enabled
+        time_slot = fresh_slot()
+        _create_slot(time_slot, max_seats=10 ** 6, pending=0, seats=1)
+        batches, items = reservation_writer.batches, reservation_writer.items
+
+        print(f"[{mode}] {bookings} bookings on one schedule, concurrency {concurrency}")
+        samples, wall = run_replay(book(time_slot, bookings), concurrency)
+        report("open", samples, wall)
+        accepted = sum(1 for sample in samples if sample.status == 200)
+        if enabled:
+            written = reservation_writer.batches - batches
+            print(f"  writer: {written} batches, {(reservation_writer.items - items) / max(written, 1):.1f} bookings/batch")
+
+        sell_out(time_slot)
+        time.sleep(get_settings().SEAT_LEDGER_TTL_SECONDS + 0.1)
+        # 인증 사용자 캐시가 재생 도중 만료되면 그 조회가 섞이므로 미리 다시 채워 둔다
+        auth._principal_cache.clear()
+        run_replay(book(time_slot, 50), 1)
+        sold_out, sold_out_wall = run_replay(book(time_slot, bookings), concurrency)
+        report("sold out", sold_out, sold_out_wall)
+
+        checks = [
+            ("every booking accepted while seats remain", accepted == bookings),
+            ("one reservation per 200 response", reservations_in(time_slot) == accepted),
+            ("every booking rejected once sold out", all(sample.status == 400 for sample in sold_out)),
+        ]
+        if enabled:
+            checks.append((
+                "sold-out rejections skip the database",
+                sum(sample.queries for sample in sold_out) <= concurrency,
+            ))
+        for label, passed in checks:
+            print(f"  {'ok' if passed else 'NG'}  {label}")
+        ok = ok and all(passed for _, passed in checks)
+    get_settings().SEAT_LEDGER_ENABLED = False
+    print("PASS" if ok else "FAIL")
+    return ok
+
+
+def rate_limit(requests: int, concurrency: int) -> bool:
+    """
+    요청 수 제한을 켜고 한 사용자(봇)의 예약 생성 요청과 한 IP 의 예약 가능 일정 조회를 몰아 넣는다.
+    허용된 요청 수가 버킷 크기 + 초당 요청 수 x 걸린 시간을 넘지 않는지, 다른 사용자는 영향을 받지 않는지,
+    거절(429)이 DB 를 거치지 않고 Retry-After 를 주는지 저장소(memory, shared)별로 확인한다.
+    """
+    import asyncio
+
+    import httpx
+
+    from app.core.cache import FakeSharedCacheBackend
+    from app.core.config import get_settings
+    from app.core.instrumentation import metrics_registry
+    from app.core.rate_limit import CacheRateLimitStore, MemoryRateLimitStore, rate_limiter
+    from main import app
+
+    config = get_settings()
+
+    def within_limit(samples, wall: float, rate: float, burst: int) -> bool:
+        allowed = sum(1 for sample in samples if sample.status != 429)
+        return burst <= allowed <= burst + math.ceil(rate * wall) + 1
+
+    def report(label: str, samples, wall: float):
+        rejected = [sample for sample in samples if sample.status == 429]
+        print(f"  {label:<9} {len(samples) - len(rejected):>5} allowed  {len(rejected):>5} rejected  "
+              f"in {wall:.2f}s  {sum(s.queries for s in rejected) / max(len(rejected), 1):.2f} q/rejected")
+
+    async def retry_after() -> Tuple[int, str]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for _ in range(config.RATE_LIMIT_RESERVATION_BURST + 2):
+                response = await client.post("/reservations/", headers={"Authorization": "Bearer user2"},
+                                             json=_booking(time_slot, 1))
+                if response.status_code == 429:
+                    break
+        await dispose_async_engines()
+        return response.status_code, response.headers.get("retry-after", "")
+
+    ok = True
+    config.RATE_LIMIT_ENABLED = True
+    for index, (label, store) in enumerate((
+            ("memory", MemoryRateLimitStore(config.RATE_LIMIT_MAX_KEYS)),
+            ("shared", CacheRateLimitStore(FakeSharedCacheBackend())),
+    )):
+        rate_limiter.use_store(store)
+        time_slot = _far_future_slot(-4 - index)
+        _create_slot(time_slot, max_seats=10 ** 6, pending=0, seats=1)
+        print(f"[{label}] {requests} requests per client, concurrency {concurrency}")
+
+        bot = [
+            PlannedRequest("POST /reservations", "POST", "/reservations/",
+                           {"Authorization": "Bearer user2"}, _booking(time_slot, 1))
+            for _ in range(requests)
+        ]
+        bot_samples, bot_wall = run_replay(bot, concurrency)
+        report("bot", bot_samples, bot_wall)
+        status, retry = asyncio.run(retry_after())
+
+        crowd = [
+            PlannedRequest("POST /reservations", "POST", "/reservations/",
+                           {"Authorization": f"Bearer user{3 + user}"}, _booking(time_slot, 1))
+            for user in range(50)
+        ]
+        crowd_samples, crowd_wall = run_replay(crowd, concurrency)
+        report("crowd", crowd_samples, crowd_wall)
+
+        browse = [
+            PlannedRequest("GET /exam-schedules/available", "GET", "/exam-schedules/available", {})
+            for _ in range(requests)
+        ]
+        browse_samples, browse_wall = run_replay(browse, concurrency)
+        report("browse", browse_samples, browse_wall)
+
+        rejected = [sample for sample in bot_samples + browse_samples if sample.status == 429]
+        checks = [
+            ("bot bookings held to the user's bucket",
+             within_limit(bot_samples, bot_wall, config.RATE_LIMIT_RESERVATION_PER_SECOND,
+                          config.RATE_LIMIT_RESERVATION_BURST)),
+            ("other users are not limited", all(sample.status != 429 for sample in crowd_samples)),
+            ("schedule reads held to the client's bucket",
+             within_limit(browse_samples, browse_wall, config.RATE_LIMIT_SCHEDULE_PER_SECOND,
+                          config.RATE_LIMIT_SCHEDULE_BURST)),
+            ("rejections skip the database", bool(rejected) and all(sample.queries == 0 for sample in rejected)),
+            ("429 carries Retry-After", status == 429 and retry.isdigit() and int(retry) >= 1),
+        ]
+        for check, passed in checks:
+            print(f"  {'ok' if passed else 'NG'}  {check}")
+        ok = ok and all(passed for _, passed in checks)
+
+    exported = [line for line in metrics_registry.render().splitlines() if line.startswith("rate_limit_")]
+    print("\n".join(f"  {line}" for line in exported))
+    config.RATE_LIMIT_ENABLED = False
+    rate_limiter.use_store(MemoryRateLimitStore(config.RATE_LIMIT_MAX_KEYS))
+    print("PASS" if ok else "FAIL")
+    return ok
+
+
+def seat_feed(subscribers: int, confirms: int) -> bool:
+    """
+    남은 좌석 SSE 피드에 구독자 subscribers 개를 붙여 두고 한 일정의 예약 confirms 건을 확정한다.
+    쉬는 구독자의 메모리, 모든 구독자가 마지막 좌석 수를 받기까지의 시간과 받은 이벤트 수(합쳐졌는지),
+    읽지 않는 구독자가 다른 구독자를 막지 않는지, 일정 필터와 Last-Event-ID 재연결, 구독의 쿼리 비용을 확인한다.
+    """
+    import asyncio
+    import tracemalloc
+
+    import httpx
+
+    from app.core.database import SessionLocal, all_engines
+    from app.core.instrumentation import collect_queries, instrument_engine
+    from app.models import ExamSchedule
+    from app.service.seat_feed import seat_feed as feed
+    from main import app
+
+    for engine in all_engines().values():
+        instrument_engine(engine)
+
+    max_seats = 10 ** 6
+    time_slot = _far_future_slot(-6)
+    reservation_ids = _create_slot(time_slot, max_seats=max_seats, pending=confirms, seats=1)
+    db = SessionLocal()
+    try:
+        exam_id = db.query(ExamSchedule.id).filter(ExamSchedule.start_time == time_slot[0]).scalar()
+    finally:
+        db.close()
+    final_seats = max_seats - confirms
+
+    class Subscriber:
+        """앱을 ASGI 로 직접 불러 SSE 이벤트를 모은다. httpx.ASGITransport 는 응답이 끝날 때까지 본문을 모아 두므로 쓰지 않는다."""
+
+        def __init__(self, query: str = "", last_event_id: str = None, blocked: bool = False):
+            self.query = query
+            self.headers = [(b"last-event-id", last_event_id.encode())] if last_event_id else []
+            self.events: List[dict] = []
+            self.queries = 0
+            self.disconnected = asyncio.Event()
+            self.unblocked = asyncio.Event()
+            if not blocked:
+                self.unblocked.set()
+            self._buffer = b""
+
+        def last_seats(self):
+            for event in reversed(self.events):
+                if event.get("event") == "seats":
+                    return {change["exam_id"]: change["available_seats"] for change in orjson.loads(event["data"])}
+            return {}
+
+        async def run(self):
+            scope = {
+                "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+                "scheme": "http", "path": "/exam-schedules/available/events", "raw_path": b"", "root_path": "",
+                "query_string": self.query.encode(), "headers": self.headers,
+                "client": ("127.0.0.1", 50000), "server": ("bench", 80),
+            }
+
+            async def receive():
+                await self.disconnected.wait()
+                return {"type": "http.disconnect"}
+
+            async def send(message):
+                await self.unblocked.wait()
+                if message["type"] != "http.response.body":
+                    return
+                self._buffer += message.get("body", b"")
+                while b"\n\n" in self._buffer:
+                    block, self._buffer = self._buffer.split(b"\n\n", 1)
+                    fields = dict(
+                        line.split(": ", 1) for line in block.decode().splitlines()
+                        if ": " in line and not line.startswith(":")
+                    )
+                    if "event" in fields:
+                        self.events.append(fields)
+
+            with collect_queries() as stats:
+                await app(scope, receive, send)
+            self.queries = stats.count
+
+    async def until(condition, timeout: float) -> bool:
+        deadline = time.perf_counter() + timeout
+        while not condition():
+            if time.perf_counter() > deadline:
+                return False
+            await asyncio.sleep(0.01)
+        return True
+
+    async def run() -> List[Tuple[str, bool]]:
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        crowd = [Subscriber() for _ in range(subscribers)]
+        tasks = [asyncio.create_task(subscriber.run()) for subscriber in crowd]
+        await until(lambda: feed.subscribers >= subscribers, 30)
+        idle_bytes = (tracemalloc.get_traced_memory()[0] - baseline) / subscribers
+        tracemalloc.stop()
+        print(f"{subscribers} idle subscribers: {idle_bytes / 1024:.1f} KiB each (ASGI scope and buffers included)")
+
+        other = Subscriber(query=f"exam_id={exam_id + 10 ** 9}")
+        slow = Subscriber(blocked=True)
+        extra = [other, slow]
+        tasks += [asyncio.create_task(subscriber.run()) for subscriber in extra]
+        await until(lambda: feed.subscribers >= subscribers + 1, 10)
+
+        pending = iter(reservation_ids)
+        statuses = []
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            async def confirm():
+                for reservation_id in pending:
+                    response = await client.patch(f"/reservations/{reservation_id}/confirm", headers=ADMIN)
+                    statuses.append(response.status_code)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(confirm() for _ in range(8)))
+            confirmed = time.perf_counter()
+            settled = await until(lambda: all(s.last_seats().get(exam_id) == final_seats for s in crowd), 30)
+            print(f"{confirms} confirms in {confirmed - started:.2f}s, "
+                  f"every subscriber had the final count {(time.perf_counter() - confirmed) * 1000:.0f} ms later")
+
+        received = [sum(1 for event in s.events if event["event"] == "seats") for s in crowd]
+        print(f"seats events per subscriber: avg {sum(received) / len(received):.1f}, max {max(received)} "
+              f"for {feed.published} published changes")
+
+        slow.unblocked.set()
+        slow_caught_up = await until(lambda: slow.last_seats().get(exam_id) == final_seats, 10)
+
+        resumed_from = crowd[0].events[0]["id"]
+        resumed = Subscriber(last_event_id=resumed_from)
+        unknown = Subscriber(last_event_id="not-a-version")
+        extra += [resumed, unknown]
+        tasks += [asyncio.create_task(resumed.run()), asyncio.create_task(unknown.run())]
+        await until(lambda: resumed.events and unknown.events, 10)
+
+        for subscriber in crowd + extra:
+            subscriber.disconnected.set()
+        await asyncio.gather(*tasks)
+        await dispose_async_engines()
+
+        return [
+            ("every confirm succeeded", statuses.count(200) == confirms),
+            ("every subscriber got the final seat count", settled),
+            ("updates were coalesced", max(received) < confirms),
+            ("filtered subscriber got no other schedules", not other.events),
+            ("slow subscriber caught up with one event",
+             slow_caught_up and sum(1 for event in slow.events if event["event"] == "seats") == 1),
+            ("Last-Event-ID resumes with later changes", resumed.last_seats().get(exam_id) == final_seats),
+            ("unknown Last-Event-ID asks for a reload", bool(unknown.events) and unknown.events[0]["event"] == "reset"),
+            ("subscriptions cost no queries", all(s.queries == 0 for s in crowd + extra)),
+            ("disconnected subscribers were released", feed.subscribers == 0),
+        ]
+
+    checks = asyncio.run(run())
+    for label, passed in checks:
+        print(f"  {'ok' if passed else 'NG'}  {label}")
+    ok = all(passed for _, passed in checks)
+    print("PASS" if ok else "FAIL")
+    return ok
+
+
+def replica_routing(primary_path: str, replica_path: str) -> bool:
+    """
+    두 SQLite 파일로 복제본 라우팅을 확인한다. 시드 직후 primary 를 복제본으로 복사하고(복제가 멈춘 상태),
+    이후 primary 에만 만든 일정·예약이 읽기 엔드포인트에 보이는지로 어느 쪽에서 읽었는지 판단한다.
+    """
+    import asyncio
+    import shutil
+
+    import httpx
+
+    from app.core.cache import schedule_cache, AVAILABLE_SCHEDULES_CACHE_KEY
+    from app.core.database import SessionLocal, get_engine, get_replica_engine
+    from app.models import ExamSchedule, Reservation
+    from app.models.enums import ReservationStatus
+    from main import app
+
+    get_engine().dispose()
+    get_replica_engine().dispose()
+    shutil.copyfile(primary_path, replica_path)
+
+    db = SessionLocal()
+    try:
+        # --reuse 로 다시 돌려도 겹치지 않도록 가장 늦은 일정 다음 날을 쓴다
+        latest = db.query(func.max(ExamSchedule.start_time)).scalar()
+        primary_only_slot = (latest + timedelta(days=1), latest + timedelta(days=1, hours=2))
+        schedule = ExamSchedule(start_time=primary_only_slot[0], end_time=primary_only_slot[1], max_seats=10)
+        db.add(schedule)
+        db.flush()
+        marker = Reservation(user_id=3, exam_id=schedule.id, status=ReservationStatus.PENDING, requested_seats=1)
+        db.add(marker)
+        db.commit()
+        marker_id, exam_id = marker.id, schedule.id
+    finally:
+        db.close()
+    schedule_cache.invalidate(AVAILABLE_SCHEDULES_CACHE_KEY)
+
+    user3 = {"Authorization": "Bearer user3"}
+    reservations_path = f"/reservations/?limit=500&exam_id={exam_id}"
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", follow_redirects=True) as client:
+            async def visible(path, headers) -> bool:
+                items = (await client.get(path, headers=headers)).json()
+                items = items["items"] if isinstance(items, dict) else items
+                return any(item["id"] == (marker_id if "reservations" in path else exam_id) for item in items)
+
+            before_write = await visible(reservations_path, user3)
+            schedule_visible = await visible("/exam-schedules/available", {})
+            admin_before = await visible(reservations_path, ADMIN)
+            booking = await client.post("/reservations/", headers=user3, json=_booking(_far_future_slot(-3), 1))
+            after_write = await visible(reservations_path, user3)
+            admin_after = await visible(reservations_path, ADMIN)
+        await dispose_async_engines()
+
+        return [
+            ("user3 list before writing reads replica", not before_write),
+            ("available schedules read replica", not schedule_visible),
+            ("admin list reads replica", not admin_before),
+            ("user3 booking is written to primary", booking.status_code == 200),
+            ("user3 list right after writing reads primary", after_write),
+            ("admin list keeps reading replica", not admin_after),
+        ]
+
+    checks = asyncio.run(run())
+    for label, ok in checks:
+        print(f"{'ok' if ok else 'NG'}  {label}")
+    ok = all(ok for _, ok in checks)
+    print("PASS" if ok else "FAIL")
+    return ok
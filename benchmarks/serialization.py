@@ -0,0 +1,63 @@
+import time
+from typing import Callable, List, Tuple
+
+
+def _best_of(repeat: int, call: Callable[[], bytes]) -> Tuple[float, int]:
+    best, size = float("inf"), 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(call())
+        best = min(best, time.perf_counter() - started)
+    return best, size
+
+
+def serialization_cost(sizes: List[int], repeat: int):
+    """
+    예약 목록 응답 하나를 만드는 비용(조회 + JSON 인코딩)을 변경 전 경로와 비교한다.
+    legacy: ORM 객체 조회 -> ReservationResponse.model_validate (from_attributes) -> model_dump_json
+    rows:   컬럼 Row 조회 -> orjson 으로 바로 인코딩
+    """
+    from sqlalchemy import select
+
+    from app.core.database import SessionLocal
+    from app.core.serialization import encode_page
+    from app.models import Reservation
+    from app.repository.reservation import RESERVATION_COLUMNS
+    from app.schemas.reservation import ReservationPage, ReservationResponse
+
+    print(f"{'rows':>8} {'legacy ms':>10} {'rows ms':>9} {'speedup':>8} {'encode-only legacy':>19} {'encode-only rows':>17}")
+    print("-" * 77)
+    db = SessionLocal()
+    try:
+        for size in sizes:
+            legacy_stmt = select(Reservation).order_by(Reservation.id).limit(size)
+            rows_stmt = select(*RESERVATION_COLUMNS).order_by(Reservation.id).limit(size)
+
+            def legacy() -> bytes:
+                db.expunge_all()
+                reservations = db.execute(legacy_stmt).scalars().all()
+                items = [ReservationResponse.model_validate(reservation) for reservation in reservations]
+                return ReservationPage(items=items, next_cursor=None).model_dump_json().encode()
+
+            def rows() -> bytes:
+                return encode_page(db.execute(rows_stmt).all(), None)
+
+            legacy_time, legacy_size = _best_of(repeat, legacy)
+            rows_time, rows_size = _best_of(repeat, rows)
+            if legacy_size != rows_size:
+                raise AssertionError(f"응답 크기가 다릅니다: {legacy_size} != {rows_size}")
+
+            db.expunge_all()
+            reservations = db.execute(legacy_stmt).scalars().all()
+            fetched_rows = db.execute(rows_stmt).all()
+            legacy_encode, _ = _best_of(repeat, lambda: ReservationPage(
+                items=[ReservationResponse.model_validate(reservation) for reservation in reservations]
+            ).model_dump_json().encode())
+            rows_encode, _ = _best_of(repeat, lambda: encode_page(fetched_rows, None))
+
+            print(
+                f"{size:>8} {legacy_time * 1000:>10.1f} {rows_time * 1000:>9.1f} {legacy_time / rows_time:>7.1f}x"
+                f" {legacy_encode * 1000:>16.1f} ms {rows_encode * 1000:>14.1f} ms"
+            )
+    finally:
+        db.close()
@@ -0,0 +1,128 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# 새 인터프리터에서 main 을 import 하고 OpenAPI 스키마를 만든다. 만든 엔진 이름도 함께 출력한다
+_IMPORT_PROBE = """
+import json, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+main.app.openapi()
+documented = time.perf_counter()
+from app.core.database import all_engines
+print(json.dumps({
+    "import_seconds": imported - started,
+    "openapi_seconds": documented - imported,
+    "engines": sorted(all_engines(create=False)),
+}))
+"""
+
+# 새 인터프리터에서 기동·종료 이벤트를 실행한다. 기동 이벤트가 끝났을 때까지 만든 엔진 이름도 함께 출력한다
+_LIFESPAN_PROBE = """
+import asyncio, json, time
+import main
+from app.core.database import all_engines
+
+async def run():
+    started = time.perf_counter()
+    await main.app.router.startup()
+    ready = time.perf_counter()
+    engines = sorted(all_engines(create=False))
+    await main.app.router.shutdown()
+    return {"startup_seconds": ready - started, "engines": engines}
+
+print(json.dumps(asyncio.run(run())))
+"""
+
+_DATABASE_ENV_PREFIXES = ("DATABASE_", "POSTGRES_")
+
+
+def probe_import() -> dict:
+    """DB 접속 설정을 모두 지운 환경에서 import 와 문서 생성을 잰다."""
+    return _run_probe(_IMPORT_PROBE)
+
+
+def probe_lifespan() -> dict:
+    """DB 접속 설정을 모두 지운 환경에서 기동 이벤트를 잰다. 기동이 DB 를 기다리지 않아야 성공한다."""
+    return _run_probe(_LIFESPAN_PROBE)
+
+
+def _run_probe(script: str) -> dict:
+    env = {key: value for key, value in os.environ.items() if not key.startswith(_DATABASE_ENV_PREFIXES)}
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "unknown"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _legacy_startup_seconds() -> float:
+    """변경 전 startup_event 가 워커마다 하던 스키마 생성 + 시드 확인 비용."""
+    import app.models  # noqa: F401
+    from app.core.database import Base, SessionLocal, get_engine
+    from app.core.dummy import create_seed_data
+
+    started = time.perf_counter()
+    Base.metadata.create_all(get_engine())
+    db = SessionLocal()
+    try:
+        create_seed_data(db)
+    finally:
+        db.close()
+    return time.perf_counter() - started
+
+
+async def _lifespan_seconds():
+    from benchmarks.runner import dispose_async_engines
+    from main import app
+
+    started = time.perf_counter()
+    await app.router.startup()
+    ready = time.perf_counter()
+    await app.router.shutdown()
+    stopped = time.perf_counter()
+    await dispose_async_engines()
+    return ready - started, stopped - ready
+
+
+def startup_cost(max_import_seconds: float, max_startup_seconds: float) -> bool:
+    """
+    콜드 스타트 비용을 잰다. DB 설정 없이 import·문서 생성이 되는지, 기동 이벤트가 DB 를 기다리지 않는지 확인한다.
+    기준 시간을 넘기면 실패로 본다(CI 에서 회귀 확인용).
+    """
+    probe = probe_import()
+    legacy = _legacy_startup_seconds()
+    startup, shutdown = asyncio.run(_lifespan_seconds())
+
+    if "error" in probe:
+        print(f"import main without database settings: FAILED ({probe['error']})")
+    else:
+        print(f"import main (no database settings): {probe['import_seconds'] * 1000:.1f} ms")
+        print(f"openapi schema:                     {probe['openapi_seconds'] * 1000:.1f} ms")
+        print(f"engines created by import:          {probe['engines'] or 'none'}")
+    print(f"startup event:                      {startup * 1000:.1f} ms")
+    print(f"shutdown event:                     {shutdown * 1000:.1f} ms")
+    print(f"previous per-worker setup (create_all + seed check): {legacy * 1000:.1f} ms")
+
+    checks = [
+        ("import and docs need no database", "error" not in probe and not probe["engines"]),
+        (f"import under {max_import_seconds}s", "error" not in probe and probe["import_seconds"] <= max_import_seconds),
+        (f"startup under {max_startup_seconds}s", startup <= max_startup_seconds),
+    ]
+    for label, ok in checks:
+        print(f"{'ok' if ok else 'NG'}  {label}")
+    ok = all(ok for _, ok in checks)
+    print("PASS" if ok else "FAIL")
+    return ok
@@ -0,0 +1,73 @@
+import json
+import math
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.runner import Sample
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(q / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def summarize(samples: List[Sample], wall: float) -> Dict[str, Dict[str, float]]:
+    by_label = defaultdict(list)
+    for sample in samples:
+        by_label[sample.label].append(sample)
+    by_label["ALL"] = samples
+
+    summary = {}
+    for label, group in sorted(by_label.items()):
+        latencies = sorted(sample.elapsed * 1000 for sample in group)
+        summary[label] = {
+            "count": len(group),
+            "errors": sum(1 for sample in group if sample.status >= 500),
+            "p50_ms": round(percentile(latencies, 50), 3),
+            "p99_ms": round(percentile(latencies, 99), 3),
+            "rps": round(len(group) / wall, 1) if wall else 0.0,
+            "queries_per_request": round(sum(sample.queries for sample in group) / len(group), 2),
+        }
+    return summary
+
+
+def print_report(summary: Dict[str, Dict[str, float]]):
+    header = f"{'endpoint':<40} {'count':>7} {'5xx':>5} {'p50 ms':>9} {'p99 ms':>9} {'req/s':>8} {'q/req':>6}"
+    print(header)
+    print("-" * len(header))
+    for label, row in summary.items():
+        print(
+            f"{label:<40} {row['count']:>7} {row['errors']:>5} {row['p50_ms']:>9.2f} "
+            f"{row['p99_ms']:>9.2f} {row['rps']:>8.1f} {row['queries_per_request']:>6.2f}"
+        )
+
+
+def save_baseline(name: str, summary: Dict[str, Dict[str, float]]) -> Path:
+    BASELINE_DIR.mkdir(exist_ok=True)
+    path = BASELINE_DIR / f"{name}.json"
+    path.write_text(json.dumps(summary, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return path
+
+
+def compare_baseline(name: str, summary: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    """기준선보다 p99 가 tolerance 이상 느려졌거나, 처리량이 줄었거나, 요청당 쿼리 수가 늘어난 항목을 돌려준다."""
+    baseline = json.loads((BASELINE_DIR / f"{name}.json").read_text(encoding="utf-8"))
+    regressions = []
+    for label, before in baseline.items():
+        after = summary.get(label)
+        if after is None:
+            continue
+        if after["p99_ms"] > before["p99_ms"] * (1 + tolerance):
+            regressions.append(f"{label}: p99 {before['p99_ms']}ms -> {after['p99_ms']}ms")
+        if after["rps"] < before["rps"] * (1 - tolerance):
+            regressions.append(f"{label}: req/s {before['rps']} -> {after['rps']}")
+        if after["queries_per_request"] > before["queries_per_request"]:
+            regressions.append(
+                f"{label}: queries/request {before['queries_per_request']} -> {after['queries_per_request']}"
+            )
+    return regressions
@@ -0,0 +1,127 @@
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import islice, cycle
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.http_file import parse_http_file
+
+ADMIN = {"Authorization": "Bearer admin"}
+
+# 접수 기간의 트래픽 비율을 흉내 낸 가중치
+MIXED_WEIGHTS = {
+    "GET /exam-schedules/available": 50,
+    "GET /reservations (admin)": 5,
+    "GET /reservations (user)": 10,
+    "POST /reservations": 15,
+    "PATCH /reservations/{id}/confirm": 10,
+    "PATCH /reservations/{id}": 5,
+    "POST /reservations/bulk": 3,
+    "PATCH /reservations/confirm-bulk": 2,
+}
+
+
+@dataclass(frozen=True)
+class PlannedRequest:
+    label: str
+    method: str
+    path: str
+    headers: Dict[str, str]
+    json: Optional[Any] = None
+
+
+@dataclass
+class Catalog:
+    """워크로드를 만들 때 참조하는 시드 데이터의 식별자 목록"""
+    time_slots: List[Tuple[datetime, datetime]]
+    user_ids: List[int]
+    pending_ids: List[int]
+
+
+def load_catalog() -> Catalog:
+    from app.core.database import SessionLocal
+    from app.models import ExamSchedule, Reservation, User
+    from app.models.enums import ReservationStatus, UserRole
+
+    min_start = datetime.now() + timedelta(days=3, hours=1)
+    db = SessionLocal()
+    try:
+        return Catalog(
+            time_slots=[
+                (start_time, end_time)
+                for start_time, end_time in db.query(ExamSchedule.start_time, ExamSchedule.end_time)
+                .filter(ExamSchedule.start_time >= min_start)
+            ],
+            user_ids=[user_id for user_id, in db.query(User.id).filter(User.role == UserRole.USER)],
+            pending_ids=[
+                reservation_id for reservation_id, in db.query(Reservation.id)
+                .filter(Reservation.status == ReservationStatus.PENDING)
+                .order_by(Reservation.id)
+                .limit(200_000)
+            ],
+        )
+    finally:
+        db.close()
+
+
+def _user(user_id: int) -> Dict[str, str]:
+    return {"Authorization": f"Bearer user{user_id}"}
+
+
+def _booking(time_slot: Tuple[datetime, datetime], seats: int) -> Dict[str, Any]:
+    start_time, end_time = time_slot
+    return {"start_time": start_time.isoformat(), "end_time": end_time.isoformat(), "requested_seats": seats}
+
+
+def mixed_workload(catalog: Catalog, count: int, seed: int = 7) -> List[PlannedRequest]:
+    rng = random.Random(seed)
+    pending = list(catalog.pending_ids)
+    rng.shuffle(pending)
+    labels = list(MIXED_WEIGHTS)
+    weights = list(MIXED_WEIGHTS.values())
+
+    planned = []
+    for label in rng.choices(labels, weights=weights, k=count):
+        user_id = rng.choice(catalog.user_ids)
+        if label == "GET /exam-schedules/available":
+            planned.append(PlannedRequest(label, "GET", "/exam-schedules/available", {}))
+        elif label == "GET /reservations (admin)":
+            planned.append(PlannedRequest(label, "GET", "/reservations/?limit=50", ADMIN))
+        elif label == "GET /reservations (user)":
+            planned.append(PlannedRequest(label, "GET", "/reservations/?limit=50", _user(user_id)))
+        elif label == "POST /reservations":
+            body = _booking(rng.choice(catalog.time_slots), rng.randint(1, 5))
+            planned.append(PlannedRequest(label, "POST", "/reservations/", _user(user_id), body))
+        elif label == "POST /reservations/bulk":
+            items = [_booking(rng.choice(catalog.time_slots), rng.randint(1, 5)) for _ in range(20)]
+            planned.append(PlannedRequest(label, "POST", "/reservations/bulk", _user(user_id), {"items": items}))
+        elif not pending:
+            continue
+        elif label == "PATCH /reservations/{id}/confirm":
+            planned.append(PlannedRequest(label, "PATCH", f"/reservations/{pending.pop()}/confirm", ADMIN))
+        elif label == "PATCH /reservations/{id}":
+            body = {"requested_seats": rng.randint(1, 5)}
+            planned.append(PlannedRequest(label, "PATCH", f"/reservations/{pending.pop()}", ADMIN, body))
+        elif label == "PATCH /reservations/confirm-bulk":
+            ids = [pending.pop() for _ in range(min(50, len(pending)))]
+            planned.append(PlannedRequest(label, "PATCH", "/reservations/confirm-bulk", ADMIN, {"reservation_ids": ids}))
+    return planned
+
+
+def http_file_workload(path: Path, count: int) -> List[PlannedRequest]:
+    """test_main.http 의 요청을 순서대로 반복 재생한다. 앱에 없는 예제 경로(/, /hello)는 건너뛴다."""
+    requests = [
+        request for request in parse_http_file(path)
+        if request.path.startswith(("/reservations", "/exam-schedules"))
+    ]
+    return [
+        PlannedRequest(
+            label=f"{request.method} {request.path.split('?')[0]}",
+            method=request.method,
+            path=request.path,
+            headers=request.headers,
+            json=request.json,
+        )
+        for request in islice(cycle(requests), count)
+    ]
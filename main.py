@@ -1,10 +1,25 @@
 from fastapi import FastAPI
 
-from app.api import reservation, schedule
+from app.api import (
+    reservation,
+    schedule,
+    async_reservation,
+    async_schedule,
+    reservation_bulk,
+    reservation_export,
+    metrics,
+    schedule_events,
+)
 from app.core.config import settings
-from app.core.database import Base, engine, SessionLocal
-from app.core.dummy import create_seed_data
+from app.core.database import dispose_engines
+from app.core.instrumentation import QueryInstrumentationMiddleware
+from app.core.rate_limit import RateLimitMiddleware
+from app.core.token import check_keys
 from app.docs.description import API_DESCRIPTION, TAGS_METADATA
+from app.service.seat_feed import seat_feed
+from app.service.seat_ledger import reservation_writer
+from app.worker.jobs import scheduler
+from app.worker.waitlist import waitlist_worker
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -13,16 +28,44 @@ app = FastAPI(
     openapi_tags=TAGS_METADATA,
 )
 
+# 나중에 추가한 미들웨어가 바깥쪽이다. 계측 미들웨어가 요청 수 제한으로 거절된 요청도 센다
+app.add_middleware(RateLimitMiddleware)
+
+# 엔진은 처음 만들어질 때 계측 리스너를 단다 (app.core.database)
+if settings.SQL_INSTRUMENTATION_ENABLED:
+    app.add_middleware(QueryInstrumentationMiddleware)
+
 
+# 스키마 마이그레이션과 샘플 데이터는 서버가 아니라 `python manage.py setup` 이 한 번만 만든다.
+# 기동 시에는 DB 에 접속하지 않고 서명 키를 확인한 뒤 백그라운드 작업만 띄운다.
 @app.on_event("startup")
 async def startup_event():
-    Base.metadata.create_all(bind=engine)
-    db = SessionLocal()
-    try:
-        create_seed_data(db)
-    finally:
-        db.close()
+    check_keys()
+    if settings.WAITLIST_WORKER_ENABLED:
+        await waitlist_worker.start()
+    if settings.SCHEDULER_ENABLED:
+        await scheduler.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    seat_feed.close()
+    await scheduler.stop()
+    await waitlist_worker.stop()
+    # 쓰기를 기다리는 예약 생성 요청을 마저 커밋한다
+    await reservation_writer.stop()
+    await dispose_engines()
+
 
+# 드라이버와 무관한 라우터는 /reservations/{reservation_id} 보다 먼저 매칭되도록 앞에 둔다
+app.include_router(metrics.router)
+app.include_router(reservation_bulk.router)
+app.include_router(reservation_export.router)
+app.include_router(schedule_events.router)
 
-app.include_router(reservation.router)
-app.include_router(schedule.router)
+if settings.DATABASE_DRIVER == "async":
+    app.include_router(async_reservation.router)
+    app.include_router(async_schedule.router)
+else:
+    app.include_router(reservation.router)
+    app.include_router(schedule.router)
@@ -0,0 +1,44 @@
+"""
+일회성 관리 명령. 서버 기동과 분리해 배포 파이프라인(또는 로컬에서 처음 한 번)에서 실행한다.
+
+    python manage.py migrate [--revision head]   # alembic 마이그레이션
+    python manage.py seed                        # 샘플 데이터 (사용자가 이미 있으면 건너뜀)
+    python manage.py setup                       # migrate + seed
+"""
+import argparse
+import sys
+
+from app.core.database import SessionLocal
+from app.core.dummy import create_seed_data
+from app.core.migration import run_migrations
+
+
+def seed():
+    db = SessionLocal()
+    try:
+        create_seed_data(db)
+    finally:
+        db.close()
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description="데이터베이스 준비 명령")
+    commands = parser.add_subparsers(dest="command", required=True)
+    migrate = commands.add_parser("migrate", help="스키마 마이그레이션 적용")
+    migrate.add_argument("--revision", default="head")
+    commands.add_parser("seed", help="샘플 데이터 생성")
+    commands.add_parser("setup", help="마이그레이션 적용 후 샘플 데이터 생성")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    if args.command in ("migrate", "setup"):
+        run_migrations(getattr(args, "revision", "head"))
+    if args.command in ("seed", "setup"):
+        seed()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
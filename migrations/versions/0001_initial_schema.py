@@ -0,0 +1,72 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-01-28 00:00:00
+
+기존에 Base.metadata.create_all 로 만들어진 데이터베이스는 테이블이 이미 있으므로
+생성을 건너뛰고 이 리비전부터 관리를 시작한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    existing_tables = sa.inspect(op.get_bind()).get_table_names()
+
+    if "users" not in existing_tables:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("password", sa.String(), nullable=False),
+            sa.Column("role", sa.Enum("ADMIN", "USER", name="userrole"), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_users_id", "users", ["id"])
+
+    if "exam_schedules" not in existing_tables:
+        op.create_table(
+            "exam_schedules",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("start_time", sa.DateTime(), nullable=False),
+            sa.Column("end_time", sa.DateTime(), nullable=False),
+            sa.Column("max_seats", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_exam_schedules_id", "exam_schedules", ["id"])
+
+    if "reservations" not in existing_tables:
+        op.create_table(
+            "reservations",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("exam_id", sa.Integer(), sa.ForeignKey("exam_schedules.id"), nullable=False),
+            sa.Column(
+                "status",
+                sa.Enum("PENDING", "CONFIRMED", "CANCELLED", name="reservationstatus"),
+                nullable=False,
+            ),
+            sa.Column("requested_seats", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_reservations_id", "reservations", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("reservations")
+    op.drop_table("exam_schedules")
+    op.drop_table("users")
+    sa.Enum(name="reservationstatus").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="userrole").drop(op.get_bind(), checkfirst=True)
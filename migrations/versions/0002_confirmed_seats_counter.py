@@ -0,0 +1,41 @@
+"""exam_schedules.confirmed_seats counter
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-02-03 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("exam_schedules")}
+    if "confirmed_seats" not in columns:
+        op.add_column(
+            "exam_schedules",
+            sa.Column("confirmed_seats", sa.Integer(), nullable=False, server_default="0"),
+        )
+
+    op.execute(
+        """
+        UPDATE exam_schedules
+        SET confirmed_seats = COALESCE((
+            SELECT SUM(r.requested_seats)
+            FROM reservations r
+            WHERE r.exam_id = exam_schedules.id AND r.status = 'CONFIRMED'
+        ), 0)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("exam_schedules", "confirmed_seats")
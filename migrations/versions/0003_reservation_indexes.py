@@ -0,0 +1,69 @@
+"""indexes for reservation hot queries
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-02-03 00:10:00
+
+- reservations (exam_id, status): 일정별 확정 좌석 집계
+- reservations (user_id, created_at): 사용자별 예약 조회
+- exam_schedules UNIQUE (start_time, end_time): 일정 조회 및 중복 일정 방지.
+  start_time 이 선두 컬럼이라 예약 가능 일정 조회(start_time >=)도 이 인덱스를 탄다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 같은 시간대로 중복 생성된 일정은 가장 먼저 만들어진 일정으로 합친다.
+    op.execute(
+        """
+        WITH duplicates AS (
+            SELECT id, MIN(id) OVER (PARTITION BY start_time, end_time) AS keep_id
+            FROM exam_schedules
+        )
+        UPDATE reservations r
+        SET exam_id = d.keep_id
+        FROM duplicates d
+        WHERE r.exam_id = d.id AND d.id <> d.keep_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM exam_schedules s
+        USING exam_schedules keep
+        WHERE s.start_time = keep.start_time
+          AND s.end_time = keep.end_time
+          AND s.id > keep.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE exam_schedules
+        SET confirmed_seats = COALESCE((
+            SELECT SUM(r.requested_seats)
+            FROM reservations r
+            WHERE r.exam_id = exam_schedules.id AND r.status = 'CONFIRMED'
+        ), 0)
+        """
+    )
+
+    op.create_unique_constraint(
+        "uq_exam_schedules_start_time_end_time",
+        "exam_schedules",
+        ["start_time", "end_time"],
+    )
+    op.create_index("ix_reservations_exam_id_status", "reservations", ["exam_id", "status"])
+    op.create_index("ix_reservations_user_id_created_at", "reservations", ["user_id", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reservations_user_id_created_at", table_name="reservations")
+    op.drop_index("ix_reservations_exam_id_status", table_name="reservations")
+    op.drop_constraint("uq_exam_schedules_start_time_end_time", "exam_schedules", type_="unique")
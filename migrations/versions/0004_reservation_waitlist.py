@@ -0,0 +1,53 @@
+"""reservation waitlist
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-02-10 00:00:00
+
+- reservationstatus 에 WAITLISTED 추가
+- reservation_waitlist: 정원 초과로 대기 중인 예약. (exam_id, id) 인덱스로 일정별 대기열 앞부분을 읽는다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # ADD VALUE 로 추가한 값은 같은 트랜잭션 안에서 쓸 수 없으므로 따로 커밋한다
+        with op.get_context().autocommit_block():
+            op.execute("ALTER TYPE reservationstatus ADD VALUE IF NOT EXISTS 'WAITLISTED'")
+
+    op.create_table(
+        "reservation_waitlist",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "exam_id",
+            sa.Integer(),
+            sa.ForeignKey("exam_schedules.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "reservation_id",
+            sa.Integer(),
+            sa.ForeignKey("reservations.id", ondelete="CASCADE"),
+            nullable=False,
+            unique=True,
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_reservation_waitlist_exam_id_id", "reservation_waitlist", ["exam_id", "id"])
+
+
+def downgrade() -> None:
+    # enum 값은 지울 수 없으므로 남겨 두고, 대기 중이던 예약은 다시 확정 대기 상태로 돌린다
+    op.execute("UPDATE reservations SET status = 'PENDING' WHERE status = 'WAITLISTED'")
+    op.drop_index("ix_reservation_waitlist_exam_id_id", table_name="reservation_waitlist")
+    op.drop_table("reservation_waitlist")
@@ -0,0 +1,33 @@
+"""partial index for stale pending reservations
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-02-12 00:00:00
+
+- reservations (created_at, id) WHERE status = 'PENDING': 오래된 PENDING 예약 만료 작업이
+  만료 대상만 created_at 순으로 잘라 읽는다. 확정·취소된 예약은 인덱스에 들어가지 않는다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_reservations_pending_created_at",
+        "reservations",
+        ["created_at", "id"],
+        postgresql_where=sa.text("status = 'PENDING'"),
+        sqlite_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reservations_pending_created_at", table_name="reservations")
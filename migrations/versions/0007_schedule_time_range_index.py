@@ -0,0 +1,37 @@
+"""GiST index for overlapping schedule search
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-02-19 00:00:00
+
+- exam_schedules GiST (tsrange(start_time, end_time, '[)')): 시간대 겹침 검색(&&).
+  start_time B-tree 로는 검색 구간 앞의 일정을 모두 훑어야 하지만 GiST 는 겹치는 일정만 찾는다.
+  예약 중인 테이블을 막지 않도록 CONCURRENTLY 로 만든다. PostgreSQL 전용이며 다른 DB 에서는 건너뛴다.
+  종료 시각이 시작 시각보다 이른 일정이 있으면 tsrange 가 실패하므로 먼저 정리해야 한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_exam_schedules_time_range "
+            "ON exam_schedules USING gist (tsrange(start_time, end_time, '[)'))"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_exam_schedules_time_range")
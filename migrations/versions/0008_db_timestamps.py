@@ -0,0 +1,115 @@
+"""database-side timestamps
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2025-02-24 00:00:00
+
+- users, exam_schedules, reservations 의 created_at/updated_at, reservation_waitlist 의 created_at 을
+  timestamptz 로 바꾸고 DEFAULT now(), NOT NULL 을 건다. 기존 값은 앱 서버의 로컬 시각이므로 세션 TimeZone 으로
+  해석한다. 앱 서버와 같은 시간대로 맞춘 뒤(예: PGTZ=Asia/Seoul) 올린다. TimeZone 이 UTC 면 테이블을 다시 쓰지 않는다.
+- 예전 모델은 created_at 기본값을 import 시각으로 고정해 두어 행마다 워커 기동 시각이 들어가 있다.
+  생성 시각은 id 순으로 줄어들 수 없으므로 id 순 누적 최댓값으로 올려 맞추고(실제 생성 시각의 하한),
+  비어 있는 값은 now(), updated_at 은 created_at 보다 이르지 않게 채운다.
+- BEFORE UPDATE 트리거가 updated_at 을 now() 로 맞춘다. ORM 은 UPDATE 문에 같은 값을 넣지만,
+  트리거는 마이그레이션·운영 SQL 처럼 ORM 을 거치지 않는 UPDATE 도 맞춘다.
+- exam_schedules.start_time/end_time 은 시험 현지 시각이므로 그대로 timestamp 로 둔다.
+PostgreSQL 전용이며 다른 DB 에서는 건너뛴다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ("users", "exam_schedules", "reservations")
+
+
+def _to_timestamptz(table: str, column: str):
+    op.alter_column(
+        table,
+        column,
+        type_=sa.DateTime(timezone=True),
+        existing_type=sa.DateTime(),
+        postgresql_using=f"{column}::timestamptz",
+    )
+
+
+def _set_db_default(table: str, column: str):
+    op.alter_column(
+        table,
+        column,
+        existing_type=sa.DateTime(timezone=True),
+        server_default=sa.func.now(),
+        nullable=False,
+    )
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in _TABLES:
+        _to_timestamptz(table, "created_at")
+        _to_timestamptz(table, "updated_at")
+        op.execute(
+            f"""
+            UPDATE {table} t
+            SET created_at = fixed.created_at
+            FROM (SELECT id, MAX(created_at) OVER (ORDER BY id) AS created_at FROM {table}) fixed
+            WHERE t.id = fixed.id
+              AND fixed.created_at IS NOT NULL
+              AND (t.created_at IS NULL OR t.created_at < fixed.created_at)
+            """
+        )
+        op.execute(f"UPDATE {table} SET created_at = now() WHERE created_at IS NULL")
+        op.execute(f"UPDATE {table} SET updated_at = created_at WHERE updated_at IS NULL OR updated_at < created_at")
+        _set_db_default(table, "created_at")
+        _set_db_default(table, "updated_at")
+
+    _to_timestamptz("reservation_waitlist", "created_at")
+    op.execute("UPDATE reservation_waitlist SET created_at = now() WHERE created_at IS NULL")
+    _set_db_default("reservation_waitlist", "created_at")
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in _TABLES:
+        # 값이 하나도 바뀌지 않는 UPDATE 는 건드리지 않는다
+        op.execute(
+            f"CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW WHEN (OLD.* IS DISTINCT FROM NEW.*) EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
+
+    columns = [(table, column) for table in _TABLES for column in ("created_at", "updated_at")]
+    columns.append(("reservation_waitlist", "created_at"))
+    for table, column in columns:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            postgresql_using=f"{column}::timestamp",
+            server_default=None,
+            nullable=True,
+        )
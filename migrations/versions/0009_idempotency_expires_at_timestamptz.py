@@ -0,0 +1,48 @@
+"""idempotency_keys.expires_at timestamptz
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2025-02-25 00:00:00
+
+- idempotency_keys.expires_at 을 다른 생성·수정 시각과 같이 timestamptz 로 바꾼다. 앱은 이제 UTC 로 쓰고 비교한다.
+  기존 값은 앱 서버의 로컬 시각이므로 0008 과 같이 세션 TimeZone 을 앱 서버와 맞춘 뒤 올린다.
+PostgreSQL 전용이며 다른 DB 에서는 건너뛴다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.alter_column(
+        "idempotency_keys",
+        "expires_at",
+        type_=sa.DateTime(timezone=True),
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+        postgresql_using="expires_at::timestamptz",
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.alter_column(
+        "idempotency_keys",
+        "expires_at",
+        type_=sa.DateTime(),
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+        postgresql_using="expires_at::timestamp",
+    )
@@ -0,0 +1,16 @@
+import threading
+
+from app.worker.jobs import reconcile_confirmed_seats
+
+
+def reconcile_seats():
+    """reservations 테이블을 기준으로 시험 일정별 확정 좌석 카운터를 다시 맞춘다"""
+    updated = reconcile_confirmed_seats(threading.Event())
+    if updated is None:
+        print("다른 인스턴스가 카운터를 보정하고 있어 건너뛰었습니다.")
+        return
+    print(f"확정 좌석 카운터를 보정한 시험 일정: {updated}개")
+
+
+if __name__ == "__main__":
+    reconcile_seats()
@@ -0,0 +1,52 @@
+import os
+
+# 테스트는 개발용 토큰과 임시 서명 키를 쓴다. app 이 설정을 처음 읽기 전에 정해야 하고, 하위 프로세스도 물려받는다
+os.environ.setdefault("AUTH_ALLOW_DEV_TOKENS", "true")
+
+import pytest  # noqa: E402
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import app.models  # noqa: F401,E402  모델을 메타데이터에 등록
+from app.core.database import Base  # noqa: E402
+
+# PostgreSQL 이 필요한 테스트는 이 URL 의 데이터베이스를 비우고 쓴다. 없거나 접속할 수 없으면 건너뛴다
+TEST_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+@pytest.fixture(scope="session")
+def postgres_url() -> str:
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL 이 없어 PostgreSQL 테스트를 건너뜁니다.")
+    engine = create_engine(TEST_POSTGRES_URL)
+    try:
+        with engine.connect():
+            pass
+    except OperationalError as e:
+        pytest.skip(f"PostgreSQL 에 접속할 수 없습니다: {e}")
+    finally:
+        engine.dispose()
+    return TEST_POSTGRES_URL
+
+
+@pytest.fixture
+def empty_postgres(postgres_url: str) -> str:
+    """public 스키마를 비운 테스트 데이터베이스의 URL."""
+    engine = create_engine(postgres_url)
+    try:
+        with engine.begin() as connection:
+            connection.execute(text("DROP SCHEMA public CASCADE"))
+            connection.execute(text("CREATE SCHEMA public"))
+    finally:
+        engine.dispose()
+    return postgres_url
+
+
+@pytest.fixture
+def sqlite_session_factory(tmp_path):
+    """스키마를 만든 임시 SQLite 파일의 sessionmaker. 잠금·동시성과 상관없는 서비스 테스트에 쓴다."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, autoflush=False)
+    engine.dispose()
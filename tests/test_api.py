@@ -0,0 +1,108 @@
+"""
+HTTP 경로 확인. 앱을 httpx.ASGITransport 로 같은 프로세스에서 부르고 DB 는 임시 SQLite 로 바꾼다.
+목록·확정 엔드포인트의 쿼리 수를 query_budget 으로 고정해 N+1 이나 불필요한 왕복이 생기면 실패하게 하고,
+/metrics 가 관리자(또는 METRICS_PUBLIC)에게만 열리는지 본다.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Iterator
+
+import httpx
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+import main
+from app.core import auth, replica
+from app.core.auth import Principal
+from app.core.config import get_settings
+from app.core.database import get_db
+from app.core.instrumentation import instrument_engine, query_budget
+from app.models import ExamSchedule, Reservation, User
+from app.models.enums import ReservationStatus, UserRole
+from app.service import reservation as reservation_module
+
+ADMIN = Principal(id=1, name="admin", role=UserRole.ADMIN)
+USER = Principal(id=2, name="user", role=UserRole.USER)
+RESERVATIONS = 30
+
+# 인증 주체는 캐시에서 읽으므로 요청마다 세는 쿼리는 엔드포인트 자체의 것이다.
+# 목록은 페이지 SELECT 한 번, 확정은 예약 잠금·대기열 확인·좌석 UPDATE·상태 UPDATE·커밋 뒤 다시 읽기
+LIST_QUERIES = 1
+CONFIRM_QUERIES = 5
+
+
+@pytest.fixture
+def api(sqlite_session_factory, monkeypatch):
+    """앱의 DB 를 임시 SQLite 로 바꾸고 관리자·사용자 한 명씩과 PENDING 예약 RESERVATIONS 건을 넣는다."""
+    instrument_engine(sqlite_session_factory.kw["bind"])
+    start_time = datetime.now().replace(microsecond=0) + timedelta(days=30)
+    with sqlite_session_factory() as db:
+        db.add_all([User(id=p.id, name=p.name, password=p.name, role=p.role) for p in (ADMIN, USER)])
+        schedule = ExamSchedule(start_time=start_time, end_time=start_time + timedelta(hours=2), max_seats=100)
+        db.add(schedule)
+        db.flush()
+        db.execute(insert(Reservation), [
+            {"user_id": USER.id, "exam_id": schedule.id, "status": ReservationStatus.PENDING, "requested_seats": 1}
+            for _ in range(RESERVATIONS)
+        ])
+        db.commit()
+
+    def override_get_db() -> Iterator[Session]:
+        with sqlite_session_factory() as db:
+            yield db
+
+    monkeypatch.setitem(main.app.dependency_overrides, get_db, override_get_db)
+    monkeypatch.setattr(auth, "SessionLocal", sqlite_session_factory)
+    # 커밋 뒤 알림은 다른 스레드에서 앱 DB 를 읽으므로 이 테스트에서는 끈다
+    monkeypatch.setattr(reservation_module.seat_feed, "notify", lambda exam_id: None)
+    monkeypatch.setattr(reservation_module.waitlist_worker, "notify", lambda exam_id: None)
+    for principal in (ADMIN, USER):
+        auth._principal_cache.set(principal.id, principal)
+    yield sqlite_session_factory
+    for principal in (ADMIN, USER):
+        auth.invalidate_principal(principal.id)
+        # 확정 요청이 남긴 "최근 쓰기" 표시가 같은 id 를 쓰는 다른 테스트의 복제본 라우팅을 바꾸지 않게 한다
+        replica._recent_writers.delete(principal.id)
+
+
+def _request(method: str, path: str, token: str = None) -> httpx.Response:
+    async def run():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            headers = {"Authorization": f"Bearer {token}"} if token else {}
+            return await client.request(method, path, headers=headers)
+
+    return asyncio.run(run())
+
+
+def test_list_reservations_query_budget(api):
+    for token in ("admin", "user2"):
+        with query_budget(LIST_QUERIES) as stats:
+            response = _request("GET", "/reservations/?limit=50", token)
+        assert stats.count == LIST_QUERIES
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == RESERVATIONS
+
+
+def test_confirm_reservation_query_budget(api):
+    with api() as db:
+        reservation_ids = db.scalars(select(Reservation.id).order_by(Reservation.id).limit(3)).all()
+
+    for reservation_id in reservation_ids:
+        with query_budget(CONFIRM_QUERIES) as stats:
+            response = _request("PATCH", f"/reservations/{reservation_id}/confirm", "admin")
+        assert stats.count == CONFIRM_QUERIES
+        assert response.status_code == 200
+        assert response.json()["status"] == ReservationStatus.CONFIRMED.value
+
+
+def test_metrics_require_admin_unless_public(api, monkeypatch):
+    assert _request("GET", "/metrics").status_code == 401
+    assert _request("GET", "/metrics", "user2").status_code == 403
+    response = _request("GET", "/metrics", "admin")
+    assert response.status_code == 200
+    assert "# TYPE http_requests_total counter" in response.text
+
+    monkeypatch.setattr(get_settings(), "METRICS_PUBLIC", True)
+    assert _request("GET", "/metrics").status_code == 200
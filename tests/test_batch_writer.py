@@ -0,0 +1,205 @@
+"""
+예약 기록기(BatchWriter). 쓰는 동안 쌓인 항목이 다음 배치로 묶이는지, stop 이 받은 항목을 모두 쓰는지,
+실패한 배치가 롤백된 뒤 항목별로 다시 쓰여 문제가 된 항목만 실패하는지 확인한다.
+좌석 원장을 켠 예약 생성이 기록기를 거쳐도 정원을 넘겨 확정되지 않는지도 본다.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError
+
+from app.core.auth import Principal
+from app.core.cache import LRUCacheBackend
+from app.models import ExamSchedule, Reservation, User, WaitlistEntry
+from app.models.enums import ReservationStatus, UserRole
+from app.repository.reservation import ReservationRepository
+from app.schemas.reservation import CreateReservationRequest
+from app.service import seat_ledger as seat_ledger_module
+from app.service.reservation import ReservationService
+from app.service.seat_ledger import PendingBooking, SeatLedger, SeatLedgerService
+from app.worker.batch_writer import BatchWriter
+
+ADMIN = Principal(id=1, name="admin", role=UserRole.ADMIN)
+USER = Principal(id=2, name="user", role=UserRole.USER)
+MAX_SEATS = 10
+CONFIRMED_SEATS = 7
+CONCURRENCY = 8
+REQUESTED_SEATS = [1, 2, 3, 4] * 6
+
+
+def test_items_submitted_during_a_write_form_the_next_batch():
+    batches: List[List[int]] = []
+    writing, release = threading.Event(), threading.Event()
+
+    def write(items: List[int]) -> List[int]:
+        batches.append(items)
+        writing.set()
+        release.wait(5)
+        return [item * 10 for item in items]
+
+    writer = BatchWriter("test-writer", write, batch_size=100, max_pending=100)
+    futures = [writer.submit(0)]
+    assert writing.wait(5)
+    futures += [writer.submit(item) for item in range(1, 6)]
+    release.set()
+
+    assert [future.result(5) for future in futures] == [0, 10, 20, 30, 40, 50]
+    assert batches == [[0], [1, 2, 3, 4, 5]]
+    assert (writer.batches, writer.items) == (2, 6)
+    asyncio.run(writer.stop())
+
+
+def test_stop_flushes_accepted_items():
+    batches: List[List[int]] = []
+
+    def write(items: List[int]) -> List[int]:
+        batches.append(items)
+        return items
+
+    # linger 가 길어도 stop 은 기다리지 않고 모아 둔 배치를 바로 쓴다
+    writer = BatchWriter("test-writer", write, batch_size=100, max_pending=100, linger=60)
+    futures = [writer.submit(item) for item in range(3)]
+    asyncio.run(asyncio.wait_for(writer.stop(), timeout=5))
+
+    assert all(future.done() for future in futures)
+    assert [future.result() for future in futures] == [0, 1, 2]
+    assert batches == [[0, 1, 2]]
+
+
+def test_failed_batch_only_fails_the_bad_item():
+    calls: List[List[str]] = []
+
+    def write(items: List[str]) -> List[str]:
+        calls.append(items)
+        if "bad" in items:
+            raise ValueError("bad item")
+        return [item.upper() for item in items]
+
+    writer = BatchWriter("test-writer", write, batch_size=3, max_pending=100, linger=60)
+    futures = [writer.submit(item) for item in ("a", "bad", "b")]
+
+    assert futures[0].result(5) == "A"
+    assert futures[2].result(5) == "B"
+    with pytest.raises(ValueError):
+        futures[1].result(5)
+    assert calls == [["a", "bad", "b"], ["a"], ["bad"], ["b"]]
+    assert (writer.batches, writer.items, writer.failures) == (2, 2, 1)
+    asyncio.run(writer.stop())
+
+
+@pytest.fixture
+def schedule(sqlite_session_factory):
+    """정원 MAX_SEATS 중 CONFIRMED_SEATS 가 확정된 일정."""
+    start_time = datetime.now().replace(microsecond=0) + timedelta(days=30)
+    with sqlite_session_factory() as db:
+        db.add_all([
+            User(id=ADMIN.id, name=ADMIN.name, password="admin", role=ADMIN.role),
+            User(id=USER.id, name=USER.name, password="user", role=USER.role),
+        ])
+        schedule = ExamSchedule(
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=2),
+            max_seats=MAX_SEATS,
+            confirmed_seats=CONFIRMED_SEATS,
+        )
+        db.add(schedule)
+        db.flush()
+        db.execute(insert(Reservation), [{
+            "user_id": ADMIN.id,
+            "exam_id": schedule.id,
+            "status": ReservationStatus.CONFIRMED,
+            "requested_seats": CONFIRMED_SEATS,
+        }])
+        db.commit()
+        return schedule.id, schedule.start_time, schedule.end_time
+
+
+@pytest.fixture
+def ledger_writer(sqlite_session_factory, monkeypatch):
+    """임시 DB 에 쓰는 예약 기록기와 빈 좌석 원장으로 바꿔 끼운다."""
+
+    def write(bookings: List[PendingBooking]):
+        with sqlite_session_factory() as db:
+            return SeatLedgerService(ReservationRepository(db)).write(bookings)
+
+    writer = BatchWriter("test-reservation-writer", write, batch_size=8, max_pending=100, linger=0.01)
+    monkeypatch.setattr(seat_ledger_module, "reservation_writer", writer)
+    monkeypatch.setattr(seat_ledger_module, "seat_ledger", SeatLedger(LRUCacheBackend(100), ttl=60))
+    yield writer
+    asyncio.run(writer.stop())
+
+
+def _reservation_rows(session_factory, exam_id: int):
+    with session_factory() as db:
+        return db.execute(
+            select(Reservation.id, Reservation.status, Reservation.requested_seats)
+            .where(Reservation.exam_id == exam_id, Reservation.user_id == USER.id)
+            .order_by(Reservation.id)
+        ).all()
+
+
+def test_failed_batch_rolls_back_before_retrying_items(sqlite_session_factory, schedule, ledger_writer):
+    exam_id, start_time, end_time = schedule
+    good = PendingBooking(USER.id, exam_id, start_time, end_time, 1)
+    # user_id 가 NULL 이라 INSERT 가 실패한다. 같은 배치의 다른 행도 함께 롤백된다
+    bad = PendingBooking(None, exam_id, start_time, end_time, 1)
+
+    futures = [ledger_writer.submit(booking) for booking in (good, bad, good)]
+
+    assert [future.result(5).requested_seats for future in (futures[0], futures[2])] == [1, 1]
+    with pytest.raises(IntegrityError):
+        futures[1].result(5)
+    # 실패한 배치에서 넣었던 행이 남지 않아 좋은 요청이 두 번 들어가지 않는다
+    assert len(_reservation_rows(sqlite_session_factory, exam_id)) == 2
+
+
+def test_ledger_bookings_through_the_writer_never_oversell(sqlite_session_factory, schedule, ledger_writer):
+    exam_id, start_time, end_time = schedule
+    available = MAX_SEATS - CONFIRMED_SEATS
+
+    def book(seats: int):
+        request = CreateReservationRequest(start_time=start_time, end_time=end_time, requested_seats=seats)
+        with sqlite_session_factory() as db:
+            return SeatLedgerService(ReservationRepository(db)).create_reservation(request, USER)
+
+    with ThreadPoolExecutor(CONCURRENCY) as pool:
+        futures = [pool.submit(book, seats) for seats in REQUESTED_SEATS]
+    accepted = [future.result() for future in futures if future.exception() is None]
+    rejected = [future.exception() for future in futures if future.exception() is not None]
+
+    # 남은 좌석보다 많이 요청한 예약만 거절되고, 받아들인 예약은 모두 한 번씩 들어간다
+    assert all(isinstance(error, HTTPException) and error.status_code == 400 for error in rejected)
+    assert sorted(row.requested_seats for row in accepted) == sorted(s for s in REQUESTED_SEATS if s <= available)
+    rows = _reservation_rows(sqlite_session_factory, exam_id)
+    assert sorted(row.id for row in rows) == sorted(row.id for row in accepted)
+    assert {row.status for row in rows} == {ReservationStatus.PENDING}
+
+    for row in rows:
+        with sqlite_session_factory() as db:
+            ReservationService(ReservationRepository(db)).confirm_reservation(row.id, ADMIN)
+
+    with sqlite_session_factory() as db:
+        counter = db.scalar(select(ExamSchedule.confirmed_seats).where(ExamSchedule.id == exam_id))
+        confirmed_seats = db.scalar(
+            select(func.coalesce(func.sum(Reservation.requested_seats), 0))
+            .where(Reservation.exam_id == exam_id, Reservation.status == ReservationStatus.CONFIRMED)
+        )
+        waitlisted = db.scalar(select(func.count()).select_from(WaitlistEntry).where(WaitlistEntry.exam_id == exam_id))
+    statuses = [row.status for row in _reservation_rows(sqlite_session_factory, exam_id)]
+
+    assert counter == confirmed_seats <= MAX_SEATS
+    assert waitlisted == statuses.count(ReservationStatus.WAITLISTED) > 0
+
+    # 원장은 마지막 배치를 쓸 때의 값을 기억하지만, 기록기가 DB 값으로 다시 확인해 정원을 넘기지 않는다
+    if counter < MAX_SEATS:
+        with pytest.raises(HTTPException):
+            book(MAX_SEATS - counter + 1)
+    with pytest.raises(HTTPException):
+        book(available)
+    assert len(_reservation_rows(sqlite_session_factory, exam_id)) == len(rows)
@@ -0,0 +1,118 @@
+"""
+동시 확정·동시 예약 스트레스 테스트. 행 잠금(FOR UPDATE)과 @transactional(retryable=True) 재시도를 확인하므로
+PostgreSQL 에서만 돌린다 (SQLite 는 FOR UPDATE 를 무시하고 쓰기를 파일 잠금으로 직렬화한다).
+"""
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+import pytest
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401  모델을 메타데이터에 등록
+from app.core.auth import Principal
+from app.core.database import Base
+from app.models import ExamSchedule, Reservation, User, WaitlistEntry
+from app.models.enums import ReservationStatus, UserRole
+from app.repository.reservation import ReservationRepository
+from app.schemas.reservation import CreateReservationRequest
+from app.service.reservation import ReservationService
+
+CONCURRENCY = 32
+RESERVATIONS = 2000
+SEATS = 3
+MAX_SEATS = 1000
+DUPLICATE_BOOKINGS = 500
+
+ADMIN = Principal(id=1, name="admin", role=UserRole.ADMIN)
+USER = Principal(id=2, name="user", role=UserRole.USER)
+
+
+def _time_slot(offset_days: int) -> Tuple[datetime, datetime]:
+    start_time = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=30 + offset_days)
+    return start_time, start_time + timedelta(hours=2)
+
+
+@pytest.fixture
+def session_factory(empty_postgres: str):
+    engine = create_engine(empty_postgres, pool_size=CONCURRENCY, max_overflow=0)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+    with factory() as db:
+        db.add_all([
+            User(id=ADMIN.id, name=ADMIN.name, password="admin", role=ADMIN.role),
+            User(id=USER.id, name=USER.name, password="user", role=USER.role),
+        ])
+        db.commit()
+    yield factory
+    engine.dispose()
+
+
+def _run_concurrently(session_factory, calls: List[Tuple[str, tuple]]):
+    """요청 하나마다 세션 하나로 서비스 메서드를 부른다. 서비스가 던진 예외는 그대로 올라온다."""
+
+    def call(planned: Tuple[str, tuple]):
+        method, args = planned
+        db = session_factory()
+        try:
+            getattr(ReservationService(ReservationRepository(db)), method)(*args)
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(CONCURRENCY) as pool:
+        list(pool.map(call, calls))
+
+
+def test_concurrent_confirms_never_oversell(session_factory):
+    with session_factory() as db:
+        start_time, end_time = _time_slot(0)
+        schedule = ExamSchedule(start_time=start_time, end_time=end_time, max_seats=MAX_SEATS)
+        db.add(schedule)
+        db.flush()
+        db.execute(insert(Reservation), [
+            {"user_id": USER.id, "exam_id": schedule.id, "status": ReservationStatus.PENDING, "requested_seats": SEATS}
+            for _ in range(RESERVATIONS)
+        ])
+        db.commit()
+        exam_id = schedule.id
+        reservation_ids = db.scalars(select(Reservation.id).where(Reservation.exam_id == exam_id)).all()
+
+    # 같은 예약을 두 번씩 동시에 확정해 좌석이 이중으로 반영되지 않는지도 본다
+    planned = [("confirm_reservation", (reservation_id, ADMIN)) for reservation_id in reservation_ids * 2]
+    random.Random(1).shuffle(planned)
+    _run_concurrently(session_factory, planned)
+
+    with session_factory() as db:
+        counter = db.scalar(select(ExamSchedule.confirmed_seats).where(ExamSchedule.id == exam_id))
+        statuses = dict(db.execute(
+            select(Reservation.status, func.count()).where(Reservation.exam_id == exam_id).group_by(Reservation.status)
+        ).all())
+        confirmed_seats = db.scalar(
+            select(func.coalesce(func.sum(Reservation.requested_seats), 0))
+            .where(Reservation.exam_id == exam_id, Reservation.status == ReservationStatus.CONFIRMED)
+        )
+        waitlisted = db.scalars(select(WaitlistEntry.reservation_id).where(WaitlistEntry.exam_id == exam_id)).all()
+
+    assert confirmed_seats <= MAX_SEATS
+    assert counter == confirmed_seats
+    # 좌석 수가 모두 같으므로 대기열이 생기기 전에 정원이 찰 때까지 확정된다
+    assert confirmed_seats == MAX_SEATS // SEATS * SEATS
+    assert set(statuses) == {ReservationStatus.CONFIRMED, ReservationStatus.WAITLISTED}
+    assert len(waitlisted) == len(set(waitlisted)) == statuses[ReservationStatus.WAITLISTED]
+
+
+def test_concurrent_bookings_create_one_schedule(session_factory):
+    start_time, end_time = _time_slot(1)
+    request = CreateReservationRequest(start_time=start_time, end_time=end_time, requested_seats=1)
+    _run_concurrently(session_factory, [("create_reservation", (request, USER))] * DUPLICATE_BOOKINGS)
+
+    with session_factory() as db:
+        exam_ids = db.scalars(
+            select(ExamSchedule.id).where(ExamSchedule.start_time == start_time, ExamSchedule.end_time == end_time)
+        ).all()
+        reservations = db.scalar(select(func.count()).select_from(Reservation).where(Reservation.exam_id.in_(exam_ids)))
+
+    assert len(exam_ids) == 1
+    assert reservations == DUPLICATE_BOOKINGS
@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, select
+
+from app.core.auth import Principal
+from app.models import ExamSchedule, Reservation, User, WaitlistEntry
+from app.models.enums import ReservationStatus, UserRole
+from app.repository.reservation import ReservationRepository
+from app.schemas.reservation import BulkPolicy
+from app.service.bulk import BulkReservationService
+
+ADMIN = Principal(id=1, name="admin", role=UserRole.ADMIN)
+
+
+@pytest.fixture
+def schedule_with_waiter(sqlite_session_factory):
+    """남은 좌석이 있지만 대기 예약 하나가 걸린 일정과 그 일정의 PENDING 예약 두 건."""
+    start_time = datetime.now().replace(microsecond=0) + timedelta(days=30)
+    with sqlite_session_factory() as db:
+        db.add(User(id=ADMIN.id, name=ADMIN.name, password="admin", role=ADMIN.role))
+        schedule = ExamSchedule(start_time=start_time, end_time=start_time + timedelta(hours=2), max_seats=10)
+        db.add(schedule)
+        db.flush()
+        db.execute(insert(Reservation), [
+            {"user_id": ADMIN.id, "exam_id": schedule.id, "status": status, "requested_seats": 1}
+            for status in (ReservationStatus.WAITLISTED, ReservationStatus.PENDING, ReservationStatus.PENDING)
+        ])
+        waiter, *pending = db.scalars(select(Reservation.id).order_by(Reservation.id)).all()
+        db.add(WaitlistEntry(exam_id=schedule.id, reservation_id=waiter))
+        db.commit()
+        return schedule.id, waiter, pending
+
+
+def test_bulk_confirm_does_not_jump_the_waitlist(sqlite_session_factory, schedule_with_waiter):
+    exam_id, waiter, pending = schedule_with_waiter
+
+    with sqlite_session_factory() as db:
+        service = BulkReservationService(ReservationRepository(db))
+        response = service.confirm_reservations(pending, ADMIN, BulkPolicy.PARTIAL)
+
+    assert [result.success for result in response.results] == [False, False]
+    with sqlite_session_factory() as db:
+        assert db.scalar(select(ExamSchedule.confirmed_seats).where(ExamSchedule.id == exam_id)) == 0
+        queue = db.scalars(
+            select(WaitlistEntry.reservation_id).where(WaitlistEntry.exam_id == exam_id).order_by(WaitlistEntry.id)
+        ).all()
+        statuses = set(db.scalars(select(Reservation.status).where(Reservation.id.in_(pending))))
+    assert queue == [waiter, *pending]
+    assert statuses == {ReservationStatus.WAITLISTED}
+
+
+def test_bulk_confirm_waitlists_when_schedule_is_full(sqlite_session_factory):
+    start_time = datetime.now().replace(microsecond=0) + timedelta(days=30)
+    with sqlite_session_factory() as db:
+        db.add(User(id=ADMIN.id, name=ADMIN.name, password="admin", role=ADMIN.role))
+        schedule = ExamSchedule(start_time=start_time, end_time=start_time + timedelta(hours=2), max_seats=3)
+        db.add(schedule)
+        db.flush()
+        db.execute(insert(Reservation), [
+            {"user_id": ADMIN.id, "exam_id": schedule.id, "status": ReservationStatus.PENDING, "requested_seats": seats}
+            for seats in (2, 2, 1)
+        ])
+        db.commit()
+        exam_id = schedule.id
+        first, second, third = db.scalars(select(Reservation.id).order_by(Reservation.id)).all()
+
+    with sqlite_session_factory() as db:
+        service = BulkReservationService(ReservationRepository(db))
+        response = service.confirm_reservations([first, second, third], ADMIN, BulkPolicy.PARTIAL)
+
+    # 두 번째가 들어가지 않으면 좌석 하나가 남아도 세 번째는 그 뒤에 선다
+    assert [result.success for result in response.results] == [True, False, False]
+    with sqlite_session_factory() as db:
+        assert db.scalar(select(ExamSchedule.confirmed_seats).where(ExamSchedule.id == exam_id)) == 2
+        queue = db.scalars(
+            select(WaitlistEntry.reservation_id).where(WaitlistEntry.exam_id == exam_id).order_by(WaitlistEntry.id)
+        ).all()
+        statuses = dict(db.execute(select(Reservation.id, Reservation.status)).all())
+    assert queue == [second, third]
+    assert statuses == {
+        first: ReservationStatus.CONFIRMED,
+        second: ReservationStatus.WAITLISTED,
+        third: ReservationStatus.WAITLISTED,
+    }
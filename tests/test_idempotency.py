@@ -0,0 +1,101 @@
+"""
+Idempotency-Key 처리. 메모리·DB 저장소 모두에서 재시도 재생, 다른 본문 거절, 동시 요청의 단일 실행, 만료된 선점의 인계를 확인한다.
+DB 저장소는 임시 SQLite 파일을 쓴다.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import get_settings
+from app.service.idempotency import (
+    REPLAYED_HEADER,
+    DatabaseIdempotencyStore,
+    MemoryIdempotencyStore,
+    idempotent_response,
+    use_idempotency_store,
+)
+
+SCOPE = "user:2:POST /reservations"
+CONCURRENCY = 8
+
+
+@pytest.fixture(params=["memory", "db"])
+def store(request, sqlite_session_factory):
+    store = MemoryIdempotencyStore(100) if request.param == "memory" else DatabaseIdempotencyStore(sqlite_session_factory)
+    use_idempotency_store(store)
+    yield store
+    use_idempotency_store(None)
+
+
+def test_retry_with_same_body_replays_stored_response(store):
+    calls = []
+
+    def compute() -> bytes:
+        calls.append(1)
+        return b'{"id":1}'
+
+    first = idempotent_response("key-1", SCOPE, "fingerprint", compute)
+    retried = idempotent_response("key-1", SCOPE, "fingerprint", compute)
+
+    assert len(calls) == 1
+    assert retried.body == first.body == b'{"id":1}'
+    assert retried.status_code == 200
+    assert retried.headers[REPLAYED_HEADER] == "true"
+    assert REPLAYED_HEADER not in first.headers
+
+
+def test_same_key_with_different_body_is_rejected(store):
+    idempotent_response("key-1", SCOPE, "fingerprint", lambda: b"{}")
+
+    with pytest.raises(HTTPException) as error:
+        idempotent_response("key-1", SCOPE, "other-fingerprint", lambda: b"{}")
+    assert error.value.status_code == 422
+
+
+def test_concurrent_duplicates_execute_once(store):
+    calls = []
+
+    def compute() -> bytes:
+        calls.append(1)
+        time.sleep(0.2)
+        return b'{"id":1}'
+
+    with ThreadPoolExecutor(CONCURRENCY) as pool:
+        responses = list(pool.map(
+            lambda _: idempotent_response("key-1", SCOPE, "fingerprint", compute), range(CONCURRENCY)
+        ))
+
+    assert len(calls) == 1
+    assert {response.body for response in responses} == {b'{"id":1}'}
+    assert sum(1 for response in responses if REPLAYED_HEADER in response.headers) == CONCURRENCY - 1
+
+
+def test_failed_request_releases_key(store):
+    def reject() -> bytes:
+        raise HTTPException(status_code=400, detail="충분한 자리가 없습니다.")
+
+    with pytest.raises(HTTPException):
+        idempotent_response("key-1", SCOPE, "fingerprint", reject)
+    # 실패는 저장하지 않으므로 재시도가 다시 실행된다
+    assert idempotent_response("key-1", SCOPE, "fingerprint", lambda: b"{}").body == b"{}"
+
+
+def test_expired_lock_is_taken_over(store):
+    # 처리 중에 죽은 요청처럼 선점만 하고 끝내지 않는다
+    assert store.claim(f"{SCOPE}:key-1", "fingerprint", 0.05) is None
+    assert store.claim(f"{SCOPE}:key-1", "fingerprint", 30) is not None
+
+    time.sleep(0.1)
+    assert store.claim(f"{SCOPE}:key-1", "fingerprint", 30) is None
+    assert store.claim(f"{SCOPE}:key-1", "fingerprint", 30) is not None
+
+
+def test_waiting_duplicate_gives_up_while_first_is_running(store, monkeypatch):
+    monkeypatch.setattr(get_settings(), "IDEMPOTENCY_WAIT_SECONDS", 0.05)
+    assert store.claim(f"{SCOPE}:key-1", "fingerprint", 30) is None
+
+    with pytest.raises(HTTPException) as error:
+        idempotent_response("key-1", SCOPE, "fingerprint", lambda: b"{}")
+    assert error.value.status_code == 409
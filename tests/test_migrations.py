@@ -0,0 +1,88 @@
+"""
+alembic 마이그레이션을 빈 PostgreSQL 에 끝까지 올린 뒤, 리포지토리의 조회 쿼리가 인덱스를 타는지 EXPLAIN 으로 확인한다.
+테이블이 비어 있으면 플래너가 순차 스캔을 고르므로 enable_seqscan 을 끄고 본다. 그래도 Seq Scan 이 나오면 쓸 인덱스가 없다는 뜻이다.
+"""
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.migration import run_migrations
+from app.repository.reservation import ReservationRepository
+from app.repository.schedule import ExamScheduleRepository
+from app.schemas.reservation import ReservationFilter
+
+START_TIME = datetime(2030, 1, 1, 9)
+END_TIME = START_TIME + timedelta(hours=2)
+
+REPOSITORY_QUERIES: List[Tuple[str, Callable[[Session], object]]] = [
+    ("find_exam_schedule", lambda db: ReservationRepository(db).find_exam_schedule(START_TIME, END_TIME)),
+    ("get_confirmed_seats_count", lambda db: ReservationRepository(db).get_confirmed_seats_count(1)),
+    ("get_available_seats", lambda db: ReservationRepository(db).get_available_seats([1, 2])),
+    ("get_user_reservations",
+     lambda db: ReservationRepository(db).get_user_reservations(1, ReservationFilter(), None, 50)),
+    ("get_all_reservations by exam",
+     lambda db: ReservationRepository(db).get_all_reservations(ReservationFilter(exam_id=1), None, 50)),
+    ("has_waitlist", lambda db: ReservationRepository(db).has_waitlist(1)),
+    ("get_stale_pending_ids", lambda db: ReservationRepository(db).get_stale_pending_ids(START_TIME, 100)),
+    ("find_available_schedules", lambda db: ExamScheduleRepository(db).find_available_schedules(START_TIME)),
+    ("find_overlapping_schedules",
+     lambda db: ExamScheduleRepository(db).find_overlapping_schedules(START_TIME, END_TIME, 1, START_TIME)),
+]
+
+
+@pytest.fixture(scope="module")
+def migrated_engine(postgres_url: str):
+    # 파라미터마다 마이그레이션을 다시 돌리지 않도록 empty_postgres 대신 모듈 단위로 한 번 비우고 올린다
+    engine = create_engine(postgres_url)
+    with engine.begin() as connection:
+        connection.execute(text("DROP SCHEMA public CASCADE"))
+        connection.execute(text("CREATE SCHEMA public"))
+    # 0007 이 autocommit_block 을 쓰므로 트랜잭션을 열지 않은 연결을 넘긴다
+    with engine.connect() as connection:
+        run_migrations("head", connection=connection)
+        connection.commit()
+    yield engine
+    engine.dispose()
+
+
+@contextmanager
+def _captured_statements(engine: Engine):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+def test_migrations_create_the_indexed_schema(migrated_engine):
+    inspector = inspect(migrated_engine)
+    reservation_indexes = {index["name"] for index in inspector.get_indexes("reservations")}
+    schedule_indexes = {index["name"] for index in inspector.get_indexes("exam_schedules")}
+    unique_constraints = {constraint["name"] for constraint in inspector.get_unique_constraints("exam_schedules")}
+
+    assert {"ix_reservations_exam_id_status", "ix_reservations_user_id_created_at"} <= reservation_indexes
+    assert "ix_exam_schedules_time_range" in schedule_indexes
+    assert "uq_exam_schedules_start_time_end_time" in unique_constraints
+
+
+@pytest.mark.parametrize("query", [query for _, query in REPOSITORY_QUERIES], ids=[name for name, _ in REPOSITORY_QUERIES])
+def test_repository_query_uses_an_index(migrated_engine, query):
+    with _captured_statements(migrated_engine) as statements, Session(migrated_engine) as db:
+        query(db)
+    assert statements
+
+    with migrated_engine.connect() as connection:
+        connection.exec_driver_sql("SET enable_seqscan = off")
+        for statement, parameters in statements:
+            plan = "\n".join(connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).scalars())
+            assert "Seq Scan" not in plan, f"{statement}\n{plan}"
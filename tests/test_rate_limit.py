@@ -0,0 +1,138 @@
+"""
+요청 수 제한(GCRA). 시계를 고정해 버킷 크기만큼 통과한 뒤 429 와 Retry-After 가 나오는지,
+사용자·IP 별 키가 서로 따로 세어지는지, 프로세스 로컬·공유 저장소가 같게 동작하는지 확인한다.
+"""
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core import cache, rate_limit
+from app.core.cache import FakeSharedCacheBackend
+from app.core.config import get_settings
+from app.core.rate_limit import CacheRateLimitStore, MemoryRateLimitStore, RateLimit, RateLimitMiddleware, rate_limiter
+
+RATE = 0.5
+BURST = 3
+LIMIT = RateLimit(RATE, BURST)
+
+
+class _Clock:
+    """time.monotonic 과 time.time 을 함께 대신하는 시계. advance 로만 흐른다."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    monkeypatch.setattr(cache, "time", clock)
+    return clock
+
+
+@pytest.fixture(params=["memory", "shared"])
+def store(request):
+    if request.param == "memory":
+        return MemoryRateLimitStore(max_keys=100)
+    return CacheRateLimitStore(FakeSharedCacheBackend())
+
+
+@pytest.fixture
+def limited_app(monkeypatch, store):
+    config = get_settings()
+    monkeypatch.setattr(config, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(config, "RATE_LIMIT_RESERVATION_PER_SECOND", RATE)
+    monkeypatch.setattr(config, "RATE_LIMIT_RESERVATION_BURST", BURST)
+    monkeypatch.setattr(config, "RATE_LIMIT_SCHEDULE_PER_SECOND", RATE)
+    monkeypatch.setattr(config, "RATE_LIMIT_SCHEDULE_BURST", BURST)
+    monkeypatch.setattr(config, "RATE_LIMIT_TRUST_FORWARDED_FOR", True)
+    monkeypatch.setattr(rate_limiter, "store", store)
+
+    async def ok(request):
+        return PlainTextResponse("ok")
+
+    app = Starlette(routes=[
+        Route("/reservations/", ok, methods=["POST"]),
+        Route("/exam-schedules/available", ok, methods=["GET"]),
+    ])
+    return RateLimitMiddleware(app)
+
+
+def _send(app, requests) -> List[httpx.Response]:
+    """(method, path, headers) 를 차례로 보낸 응답."""
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return [await client.request(method, path, headers=headers) for method, path, headers in requests]
+
+    return asyncio.run(run())
+
+
+def _statuses(responses: List[httpx.Response]) -> List[int]:
+    return [response.status_code for response in responses]
+
+
+def test_burst_then_429_with_retry_after(store, clock):
+    assert [store.acquire("k", LIMIT) for _ in range(BURST)] == [0.0] * BURST
+    assert store.acquire("k", LIMIT) == pytest.approx(1 / RATE)
+
+    # 거절은 버킷을 쓰지 않으므로 기다리라는 시간만큼 지나면 정확히 하나가 다시 통과한다
+    clock.advance(1 / RATE)
+    assert store.acquire("k", LIMIT) == 0.0
+    assert store.acquire("k", LIMIT) > 0
+
+
+def test_middleware_rejects_over_burst(limited_app, clock):
+    booking = ("POST", "/reservations/", {"Authorization": "Bearer user2"})
+
+    responses = _send(limited_app, [booking] * (BURST + 1))
+
+    assert _statuses(responses) == [200] * BURST + [429]
+    assert responses[-1].headers["retry-after"] == str(int(1 / RATE))
+
+    clock.advance(1 / RATE)
+    assert _statuses(_send(limited_app, [booking, booking])) == [200, 429]
+
+
+def test_users_and_ips_are_limited_independently(limited_app, clock):
+    user2 = ("POST", "/reservations/", {"Authorization": "Bearer user2"})
+    user3 = ("POST", "/reservations/", {"Authorization": "Bearer user3"})
+    browse_a = ("GET", "/exam-schedules/available", {"X-Forwarded-For": "10.0.0.1"})
+    browse_b = ("GET", "/exam-schedules/available", {"X-Forwarded-For": "10.0.0.2"})
+
+    assert _statuses(_send(limited_app, [user2] * (BURST + 1))) == [200] * BURST + [429]
+    assert _statuses(_send(limited_app, [user3] * BURST)) == [200] * BURST
+    # 같은 IP 라도 예약 생성 버킷은 사용자별이라 일정 조회 한도에 영향을 주지 않는다
+    assert _statuses(_send(limited_app, [browse_a] * (BURST + 1))) == [200] * BURST + [429]
+    assert _statuses(_send(limited_app, [browse_b] * BURST)) == [200] * BURST
+
+
+def test_memory_store_evicts_idle_keys(clock):
+    store = MemoryRateLimitStore(max_keys=2)
+    for key in ("a", "b", "c"):
+        store.acquire(key, LIMIT)
+    # 한도를 넘으면 가장 오래 쓰지 않은 키를 버린다
+    assert store.size() == 2
+    assert "a" not in store._tats
+
+    # 버킷이 다시 가득 찬(TAT 가 지난) 키는 한도와 상관없이 지운다
+    clock.advance(1 / RATE + 1)
+    store.acquire("d", LIMIT)
+    assert store.size() == 1
+    assert list(store._tats) == ["d"]
@@ -0,0 +1,88 @@
+"""
+두 SQLite 파일로 복제본 라우팅을 확인한다. 두 파일에 같은 스키마와 사용자를 만든 뒤(복제가 멈춘 상태)
+primary 에만 넣은 예약이 보이는지로 어느 쪽에서 읽었는지 판단한다.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.auth import Principal
+from app.core.database import Base
+from app.core.replica import REPLICA_BIND_KEY, RoutingSession, set_current_subject
+from app.models import ExamSchedule, Reservation, User
+from app.models.enums import ReservationStatus, UserRole
+from app.repository.reservation import ReservationRepository
+from app.schemas.reservation import CreateReservationRequest, ReservationFilter
+from app.service.reservation import ReservationService
+
+WRITER = Principal(id=1, name="writer", role=UserRole.USER)
+READER = Principal(id=2, name="reader", role=UserRole.USER)
+START_TIME = datetime.now().replace(microsecond=0) + timedelta(days=30)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    engines = []
+    for name in ("primary", "replica"):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(insert(User), [
+                {"id": user.id, "name": user.name, "password": user.name, "role": user.role} for user in (WRITER, READER)
+            ])
+        engines.append(engine)
+    primary, replica = engines
+
+    # 복제되지 않은 쓰기: 사용자마다 primary 에만 있는 예약 하나
+    with primary.begin() as connection:
+        exam_id = connection.execute(
+            insert(ExamSchedule).values(start_time=START_TIME, end_time=START_TIME + timedelta(hours=2))
+        ).inserted_primary_key[0]
+        connection.execute(insert(Reservation), [
+            {"user_id": user.id, "exam_id": exam_id, "status": ReservationStatus.PENDING, "requested_seats": 1}
+            for user in (WRITER, READER)
+        ])
+
+    factory = sessionmaker(class_=RoutingSession, bind=primary, autoflush=False, info={REPLICA_BIND_KEY: replica})
+    db = factory()
+    yield ReservationRepository(db)
+    db.close()
+    set_current_subject(None)
+    for engine in engines:
+        engine.dispose()
+
+
+def _user_reservations(repository: ReservationRepository, user: Principal):
+    rows, _ = repository.get_user_reservations(user.id, ReservationFilter(), None, 100)
+    return rows
+
+
+def test_read_only_queries_use_replica(repository):
+    rows, _ = repository.get_all_reservations(ReservationFilter(), None, 100)
+    assert rows == []
+    assert _user_reservations(repository, READER) == []
+
+
+def test_reads_inside_transaction_use_primary(repository):
+    with repository.transaction():
+        rows, _ = repository.get_all_reservations(ReservationFilter(), None, 100)
+    assert len(rows) == 2
+
+
+def test_writer_reads_own_writes_from_primary(repository):
+    set_current_subject(WRITER.id)
+    assert _user_reservations(repository, WRITER) == []
+
+    request = CreateReservationRequest(
+        start_time=START_TIME + timedelta(days=1),
+        end_time=START_TIME + timedelta(days=1, hours=2),
+        requested_seats=1,
+    )
+    ReservationService(repository).create_reservation(request, WRITER)
+    assert len(_user_reservations(repository, WRITER)) == 2
+
+    # 다른 사용자의 읽기는 계속 복제본으로 간다
+    set_current_subject(READER.id)
+    assert _user_reservations(repository, READER) == []
@@ -0,0 +1,184 @@
+"""
+동기·비동기 예약 서비스가 같은 요청에 같은 결과를 내는지 확인한다. 두 서비스는 판단을 공유하고 저장소 호출만 다르므로
+같은 시나리오를 같은 SQLite 파일에 Session 과 AsyncSession(aiosqlite)으로 돌려 응답·DB 상태·커밋 뒤 알림을 비교한다.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.auth import Principal
+from app.models import ExamSchedule, Reservation, User, WaitlistEntry
+from app.models.enums import ReservationStatus, UserRole
+from app.repository.reservation import AsyncReservationRepository, ReservationRepository
+from app.schemas.reservation import CreateReservationRequest, ReservationUpdate
+from app.service import reservation as reservation_module
+from app.service.reservation import AsyncReservationService, ReservationService
+
+ADMIN = Principal(id=1, name="admin", role=UserRole.ADMIN)
+USER = Principal(id=2, name="user", role=UserRole.USER)
+OTHER = Principal(id=3, name="other", role=UserRole.USER)
+MAX_SEATS = 3
+
+START_TIME = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=30)
+END_TIME = START_TIME + timedelta(hours=2)
+NEXT_DAY = timedelta(days=1)
+
+Step = Tuple[str, str, Callable[[], tuple]]
+
+
+def _booking(seats: int, start_time: datetime = START_TIME) -> CreateReservationRequest:
+    return CreateReservationRequest(start_time=start_time, end_time=start_time + timedelta(hours=2),
+                                    requested_seats=seats)
+
+
+def _scenario(ids: List[int]) -> List[Step]:
+    """(서비스 메서드, 이름, 인자). ids 는 앞에서 만든 예약의 id 로 차례로 채워진다."""
+    return [
+        ("create_reservation", "create 2 seats", lambda: (_booking(2), USER)),
+        ("create_reservation", "create 2 more seats", lambda: (_booking(2), USER)),
+        ("create_reservation", "create 1 seat", lambda: (_booking(1), USER)),
+        ("create_reservation", "create past deadline", lambda: (_booking(1, datetime.now() + NEXT_DAY), USER)),
+        ("confirm_reservation", "user confirms", lambda: (ids[0], USER)),
+        ("confirm_reservation", "confirm first", lambda: (ids[0], ADMIN)),
+        ("confirm_reservation", "confirm over capacity", lambda: (ids[1], ADMIN)),
+        ("confirm_reservation", "confirm behind the queue", lambda: (ids[2], ADMIN)),
+        ("confirm_reservation", "confirm again", lambda: (ids[0], ADMIN)),
+        ("delete_reservation", "user deletes confirmed", lambda: (ids[0], USER)),
+        ("update_reservation", "other user updates", lambda: (ids[1], ReservationUpdate(requested_seats=1), OTHER)),
+        ("update_reservation", "grow confirmed seats", lambda: (ids[0], ReservationUpdate(requested_seats=3), ADMIN)),
+        ("update_reservation", "grow past capacity", lambda: (ids[0], ReservationUpdate(requested_seats=4), ADMIN)),
+        ("update_reservation", "move waitlisted",
+         lambda: (ids[2], ReservationUpdate(start_time=START_TIME + NEXT_DAY, end_time=END_TIME + NEXT_DAY), USER)),
+        ("delete_reservation", "delete confirmed", lambda: (ids[0], ADMIN)),
+        ("delete_reservation", "delete missing", lambda: (10_000, ADMIN)),
+    ]
+
+
+def _reset(session_factory):
+    """예약을 모두 지우고 정원 MAX_SEATS 인 일정 두 개(START_TIME, 다음 날)를 새로 만든다."""
+    with session_factory() as db:
+        for model in (WaitlistEntry, Reservation, ExamSchedule):
+            db.execute(delete(model))
+        db.add_all([
+            ExamSchedule(start_time=START_TIME + offset, end_time=END_TIME + offset, max_seats=MAX_SEATS)
+            for offset in (timedelta(0), NEXT_DAY)
+        ])
+        db.commit()
+
+
+def _state(session_factory):
+    """(일정별 시작 시각·확정 좌석, 예약 상태·좌석, 대기 예약 수). 실행마다 달라지는 id 는 뺀다."""
+    with session_factory() as db:
+        schedules = db.execute(
+            select(ExamSchedule.start_time, ExamSchedule.confirmed_seats).order_by(ExamSchedule.start_time)
+        ).all()
+        reservations = db.execute(
+            select(Reservation.status, Reservation.requested_seats).order_by(Reservation.id)
+        ).all()
+        waitlisted = len(db.scalars(select(WaitlistEntry.id)).all())
+    return [tuple(row) for row in schedules], [tuple(row) for row in reservations], waitlisted
+
+
+def _record(outcomes: list, ids: List[int], method: str, label: str, reservation):
+    if reservation is None:
+        outcomes.append((label, "ok"))
+        return
+    if method == "create_reservation":
+        ids.append(reservation.id)
+    outcomes.append((label, reservation.status, reservation.requested_seats))
+
+
+def _run_sync(session_factory) -> list:
+    outcomes, ids = [], []
+    for method, label, args in _scenario(ids):
+        with session_factory() as db:
+            service = ReservationService(ReservationRepository(db))
+            try:
+                _record(outcomes, ids, method, label, getattr(service, method)(*args()))
+            except HTTPException as e:
+                outcomes.append((label, e.status_code, e.detail))
+    return outcomes
+
+
+def _run_async(session_factory) -> list:
+    url = session_factory.kw["bind"].url.set(drivername="sqlite+aiosqlite")
+
+    async def run():
+        engine = create_async_engine(url)
+        async_session = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+        outcomes, ids = [], []
+        try:
+            for method, label, args in _scenario(ids):
+                async with async_session() as db:
+                    service = AsyncReservationService(AsyncReservationRepository(db))
+                    try:
+                        _record(outcomes, ids, method, label, await getattr(service, method)(*args()))
+                    except HTTPException as e:
+                        outcomes.append((label, e.status_code, e.detail))
+        finally:
+            await engine.dispose()
+        return outcomes
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def database(sqlite_session_factory):
+    with sqlite_session_factory() as db:
+        db.add_all([
+            User(id=principal.id, name=principal.name, password=principal.name, role=principal.role)
+            for principal in (ADMIN, USER, OTHER)
+        ])
+        db.commit()
+    return sqlite_session_factory
+
+
+@pytest.fixture
+def notifications(monkeypatch) -> List[str]:
+    """커밋 뒤 알림의 종류를 순서대로 기록한다."""
+    sent: List[str] = []
+    monkeypatch.setattr(reservation_module.seat_feed, "notify", lambda exam_id: sent.append("seats"))
+    monkeypatch.setattr(reservation_module.waitlist_worker, "notify", lambda exam_id: sent.append("waitlist"))
+    monkeypatch.setattr(reservation_module.schedule_cache, "invalidate", lambda key: sent.append("cache"))
+    return sent
+
+
+def test_sync_and_async_services_agree(database, notifications):
+    _reset(database)
+    sync_outcomes = _run_sync(database)
+    sync_state = _state(database)
+    sync_notifications = list(notifications)
+
+    _reset(database)
+    notifications.clear()
+    async_outcomes = _run_async(database)
+
+    assert async_outcomes == sync_outcomes
+    assert _state(database) == sync_state
+    assert notifications == sync_notifications
+
+    outcomes = {label: outcome for label, *outcome in sync_outcomes}
+    assert outcomes["create past deadline"][0] == 400
+    assert outcomes["user confirms"][0] == 403
+    assert outcomes["confirm first"] == [ReservationStatus.CONFIRMED, 2]
+    assert outcomes["confirm over capacity"] == [ReservationStatus.WAITLISTED, 2]
+    # 좌석이 남아 있어도 앞선 대기 예약을 새치기하지 않는다
+    assert outcomes["confirm behind the queue"] == [ReservationStatus.WAITLISTED, 1]
+    assert outcomes["confirm again"] == [ReservationStatus.CONFIRMED, 2]
+    assert outcomes["user deletes confirmed"] == [400, "확정된 예약은 삭제할 수 없습니다."]
+    assert outcomes["other user updates"] == [403, "다른 사용자의 예약을 변경할 수 없습니다."]
+    assert outcomes["grow confirmed seats"] == [ReservationStatus.CONFIRMED, 3]
+    assert outcomes["grow past capacity"][0] == 400
+    assert outcomes["move waitlisted"] == [ReservationStatus.WAITLISTED, 1]
+    assert outcomes["delete confirmed"] == ["ok"]
+    assert outcomes["delete missing"][0] == 404
+
+    schedules, reservations, waitlisted = sync_state
+    assert [seats for _, seats in schedules] == [0, 0]
+    assert reservations == [(ReservationStatus.WAITLISTED, 2), (ReservationStatus.WAITLISTED, 1)]
+    assert waitlisted == 2
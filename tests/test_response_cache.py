@@ -0,0 +1,37 @@
+"""
+응답 캐시 무효화. 무효화 전에 계산을 시작한 요청이 늦게 넣은 값이 다음 요청에 나가지 않는지 확인한다.
+"""
+import asyncio
+
+from app.core.cache import FakeSharedCacheBackend, LRUCacheBackend, ResponseCache
+
+KEY = "exam-schedules:available"
+
+
+def test_put_computed_before_invalidation_is_not_served():
+    cache = ResponseCache(LRUCacheBackend(100), ttl=60)
+
+    def stale_compute() -> bytes:
+        # 이전 값을 읽은 뒤, 넣기 전에 다른 트랜잭션이 커밋하고 무효화한다
+        cache.invalidate(KEY)
+        return b"old"
+
+    assert cache.get_or_set(KEY, stale_compute).body == b"old"
+    assert cache.get_or_set(KEY, lambda: b"new").body == b"new"
+    assert cache.get_or_set(KEY, lambda: b"unused").body == b"new"
+
+
+def test_async_put_and_shared_backend():
+    backend = FakeSharedCacheBackend()
+    first, second = ResponseCache(backend, ttl=60), ResponseCache(backend, ttl=60)
+
+    async def stale_compute() -> bytes:
+        second.invalidate(KEY)
+        return b"old"
+
+    async def fresh_compute() -> bytes:
+        return b"new"
+
+    assert asyncio.run(first.get_or_set_async(KEY, stale_compute)).body == b"old"
+    assert asyncio.run(second.get_or_set_async(KEY, fresh_compute)).body == b"new"
+    assert first.get_or_set(KEY, lambda: b"unused").body == b"new"
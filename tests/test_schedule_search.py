@@ -0,0 +1,47 @@
+"""
+시간대 겹침 검색. 시간대가 붙은 검색 구간(Z, +09:00)도 캐시로 만든 구간 트리 경로에서 DB 경로와 같은 결과를 주는지 확인한다.
+"""
+from datetime import datetime, timedelta, timezone
+
+import orjson
+import pytest
+
+from app.core.cache import AVAILABLE_SCHEDULES_CACHE_KEY, schedule_cache
+from app.core.config import get_settings
+from app.models import ExamSchedule
+from app.repository.schedule import ExamScheduleRepository
+from app.service.schedule import ExamScheduleService
+
+START_TIME = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=30)
+
+
+@pytest.fixture
+def service(sqlite_session_factory):
+    with sqlite_session_factory() as db:
+        db.add_all([
+            ExamSchedule(start_time=START_TIME, end_time=START_TIME + timedelta(hours=2), max_seats=10),
+            ExamSchedule(start_time=START_TIME + timedelta(days=1), end_time=START_TIME + timedelta(days=1, hours=2),
+                         max_seats=10),
+        ])
+        db.commit()
+    schedule_cache.invalidate(AVAILABLE_SCHEDULES_CACHE_KEY)
+    db = sqlite_session_factory()
+    yield ExamScheduleService(ExamScheduleRepository(db))
+    db.close()
+    schedule_cache.invalidate(AVAILABLE_SCHEDULES_CACHE_KEY)
+    get_settings().SCHEDULE_SEARCH_INDEX_ENABLED = True
+
+
+@pytest.mark.parametrize("zone", [timezone.utc, timezone(timedelta(hours=9))], ids=["Z", "+09:00"])
+def test_aware_search_window_matches_database_path(service, zone):
+    # 첫 일정과만 겹치는 구간을 다른 시간대로 표현한다
+    start_time = (START_TIME + timedelta(hours=1)).astimezone(zone)
+    end_time = (START_TIME + timedelta(hours=3)).astimezone(zone)
+
+    get_settings().SCHEDULE_SEARCH_INDEX_ENABLED = True
+    from_index = orjson.loads(service.search_available_schedules(start_time, end_time, 1))
+    get_settings().SCHEDULE_SEARCH_INDEX_ENABLED = False
+    from_database = orjson.loads(service.search_available_schedules(start_time, end_time, 1))
+
+    assert [schedule["start_time"] for schedule in from_index] == [START_TIME.isoformat()]
+    assert from_index == from_database
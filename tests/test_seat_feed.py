@@ -0,0 +1,105 @@
+"""
+남은 좌석 피드가 커밋 콜백의 순서와 상관없이 DB 의 최신 값을 발행하는지 확인한다.
+"""
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Collection, Dict
+
+from sqlalchemy import update
+
+from app.models import ExamSchedule
+from app.repository.reservation import ReservationRepository
+from app.repository.schedule import ExamScheduleRepository
+from app.service import maintenance
+from app.service.maintenance import SeatReconcileService
+from app.service.seat_feed import SeatFeed
+
+MAX_SEATS = 10
+START_TIME = datetime(2030, 1, 1, 9)
+
+
+def _published(feed: SeatFeed) -> Dict[int, int]:
+    changes, _, _ = feed._changes_since(0, None)
+    return {change["exam_id"]: change["available_seats"] for change in changes}
+
+
+def _available_seats(session_factory, exam_ids: Collection[int]) -> Dict[int, int]:
+    with session_factory() as db:
+        return ReservationRepository(db).get_available_seats(exam_ids)
+
+
+def _wait_until(condition, timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_late_commit_callback_does_not_publish_stale_seats(sqlite_session_factory):
+    with sqlite_session_factory() as db:
+        schedule = ExamSchedule(start_time=START_TIME, end_time=START_TIME + timedelta(hours=2), max_seats=MAX_SEATS)
+        db.add(schedule)
+        db.commit()
+        exam_id = schedule.id
+
+    reading = threading.Event()
+    release = threading.Event()
+
+    def read(exam_ids: Collection[int]) -> Dict[int, int]:
+        reading.set()
+        release.wait(5)
+        with sqlite_session_factory() as db:
+            return ReservationRepository(db).get_available_seats(exam_ids)
+
+    feed = SeatFeed(100, read)
+    try:
+        # 첫 번째 확정의 콜백이 읽는 동안 두 번째 확정이 커밋되고 알린다
+        with sqlite_session_factory() as db:
+            db.execute(update(ExamSchedule).values(confirmed_seats=3))
+            db.commit()
+        feed.notify(exam_id)
+        assert reading.wait(5)
+        with sqlite_session_factory() as db:
+            db.execute(update(ExamSchedule).values(confirmed_seats=5))
+            db.commit()
+        feed.notify(exam_id)
+        release.set()
+
+        assert _wait_until(lambda: feed.reads == 2)
+        assert _published(feed) == {exam_id: MAX_SEATS - 5}
+
+        # 첫 번째 확정의 콜백이 늦게 다시 불려도 읽는 값은 커밋된 최신 값이다
+        feed.notify(exam_id)
+        assert _wait_until(lambda: feed.reads == 3)
+        assert _published(feed) == {exam_id: MAX_SEATS - 5}
+    finally:
+        feed.close()
+
+
+def test_reconcile_publishes_corrected_seats(sqlite_session_factory, monkeypatch):
+    with sqlite_session_factory() as db:
+        drifted, correct = (
+            ExamSchedule(start_time=START_TIME + timedelta(days=day), end_time=START_TIME + timedelta(days=day, hours=2),
+                         max_seats=MAX_SEATS, confirmed_seats=seats)
+            for day, seats in ((0, 4), (1, 0))
+        )
+        db.add_all([drifted, correct])
+        db.commit()
+        drifted_id = drifted.id
+
+    feed = SeatFeed(100, lambda exam_ids: _available_seats(sqlite_session_factory, exam_ids))
+    monkeypatch.setattr(maintenance, "seat_feed", feed)
+    monkeypatch.setattr(maintenance.waitlist_worker, "notify", lambda exam_id: None)
+    try:
+        with sqlite_session_factory() as db:
+            corrected, _ = SeatReconcileService(ExamScheduleRepository(db)).reconcile_batch(0, 100)
+
+        # 예약이 없으므로 카운터가 어긋난 일정만 0 으로 보정되고 피드에 실린다
+        assert corrected == [drifted_id]
+        assert _wait_until(lambda: feed.reads == 1)
+        assert _published(feed) == {drifted_id: MAX_SEATS}
+    finally:
+        feed.close()
@@ -0,0 +1,59 @@
+"""
+좌석 원장의 빈 항목 채우기. 같은 일정을 동시에 채우려는 요청이 DB 를 한 번만 읽는지 확인한다.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from app.core.cache import LRUCacheBackend
+from app.service.seat_ledger import LedgerEntry, SeatLedger
+
+START_TIME = datetime(2030, 1, 1, 9)
+END_TIME = START_TIME + timedelta(hours=2)
+CONCURRENCY = 16
+
+
+def test_concurrent_loads_read_once():
+    ledger = SeatLedger(LRUCacheBackend(100), ttl=60)
+    reads = []
+    release = threading.Event()
+
+    def read():
+        reads.append(1)
+        release.wait(5)
+        entry = LedgerEntry(1, 10)
+        ledger.put(START_TIME, END_TIME, entry)
+        return entry
+
+    with ThreadPoolExecutor(CONCURRENCY) as pool:
+        futures = [pool.submit(ledger.load, START_TIME, END_TIME, read) for _ in range(CONCURRENCY)]
+        release.set()
+        entries = [future.result() for future in futures]
+
+    assert len(reads) == 1
+    assert entries == [LedgerEntry(1, 10)] * CONCURRENCY
+
+
+def test_async_loads_read_once_and_survive_failure():
+    ledger = SeatLedger(LRUCacheBackend(100), ttl=60)
+    reads = []
+
+    async def failing_read():
+        reads.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def run():
+        return await asyncio.gather(
+            *(ledger.load_async(START_TIME, END_TIME, failing_read) for _ in range(CONCURRENCY)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+
+    # 먼저 읽던 요청만 실패하고, 기다리던 요청은 None 을 받아 기존 경로로 처리된다
+    assert len(reads) == 1
+    assert sum(isinstance(result, RuntimeError) for result in results) == 1
+    assert results.count(None) == CONCURRENCY - 1
+    assert ledger.load(START_TIME, END_TIME, lambda: LedgerEntry(1, 3)) == LedgerEntry(1, 3)
@@ -0,0 +1,28 @@
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+from app.core.serialization import encode_page, encode_rows
+from app.schemas.reservation import ReservationResponse
+
+_RESERVATION = {
+    "id": 1,
+    "user_id": 2,
+    "exam_id": 3,
+    "status": "pending",
+    "requested_seats": 4,
+    "created_at": datetime(2025, 3, 1, 9, 30, 15, 123456, tzinfo=timezone.utc),
+    "updated_at": datetime(2025, 3, 1, 18, 30, tzinfo=timezone(timedelta(hours=9))),
+}
+
+# 컬럼 Row 와 같이 _fields 가 있는 튜플
+_Row = namedtuple("_Row", list(_RESERVATION))
+
+
+def test_list_encoding_matches_pydantic_response():
+    """목록 응답(orjson)의 바이트가 단건 응답(Pydantic)과 같은 형식이어야 한다. UTC 시각은 Z 로 끝난다."""
+    expected = ReservationResponse.model_validate(_RESERVATION).model_dump_json().encode()
+    rows = [_Row(**_RESERVATION)]
+
+    assert b'"2025-03-01T09:30:15.123456Z"' in expected
+    assert encode_rows(rows) == b"[" + expected + b"]"
+    assert encode_page(rows, None) == b'{"items":[' + expected + b'],"next_cursor":null}'
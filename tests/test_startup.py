@@ -0,0 +1,60 @@
+"""
+콜드 스타트 회귀 확인. `python -m benchmarks startup` 과 같은 기준을 DB 접속 설정이 없는 새 인터프리터에서 확인한다.
+"""
+import asyncio
+
+import pytest
+import rsa
+
+import main
+from app.core import token
+from app.core.config import get_settings
+from benchmarks.startup import probe_import, probe_lifespan
+
+MAX_IMPORT_SECONDS = 3.0
+MAX_STARTUP_SECONDS = 0.5
+
+
+def test_import_and_docs_need_no_database():
+    probe = probe_import()
+
+    assert "error" not in probe, probe.get("error")
+    assert probe["engines"] == []
+    assert probe["import_seconds"] <= MAX_IMPORT_SECONDS
+
+
+def test_startup_event_does_not_wait_for_database():
+    probe = probe_lifespan()
+
+    assert "error" not in probe, probe.get("error")
+    assert probe["engines"] == []
+    assert probe["startup_seconds"] <= MAX_STARTUP_SECONDS
+
+
+@pytest.fixture
+def key_settings(monkeypatch):
+    """캐시된 키 없이 인증 설정을 바꿔 본다."""
+    monkeypatch.setattr(token, "_keys", token._KeyStore())
+    monkeypatch.setattr(get_settings(), "AUTH_PUBLIC_KEY_FILE", None)
+    monkeypatch.setattr(get_settings(), "AUTH_PRIVATE_KEY_FILE", None)
+    monkeypatch.setattr(get_settings(), "AUTH_ALLOW_DEV_TOKENS", False)
+    return get_settings()
+
+
+def test_startup_fails_without_keys_unless_dev_tokens_are_allowed(key_settings):
+    with pytest.raises(RuntimeError, match="AUTH_PUBLIC_KEY_FILE"):
+        asyncio.run(main.startup_event())
+    with pytest.raises(RuntimeError, match="AUTH_PUBLIC_KEY_FILE"):
+        token.create_access_token(2)
+
+
+def test_startup_loads_configured_keys(key_settings, monkeypatch, tmp_path):
+    public_key, private_key = rsa.newkeys(512)
+    (tmp_path / "public.pem").write_bytes(public_key.save_pkcs1())
+    (tmp_path / "private.pem").write_bytes(private_key.save_pkcs1())
+    monkeypatch.setattr(key_settings, "AUTH_PUBLIC_KEY_FILE", str(tmp_path / "public.pem"))
+    monkeypatch.setattr(key_settings, "AUTH_PRIVATE_KEY_FILE", str(tmp_path / "private.pem"))
+
+    token.check_keys()
+
+    assert token.verify_access_token(token.create_access_token(2)).subject == 2